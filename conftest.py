@@ -0,0 +1,60 @@
+"""Shared pytest fixtures for the root-level test scripts."""
+
+import sys
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Add src to path so we can import swiftsolve modules
+sys.path.insert(0, str(pathlib.Path(__file__).parent / "src"))
+
+
+@pytest.fixture(scope="session")
+def analyst():
+    """One Analyst (and its OpenAI client) shared by every test that needs it."""
+    from swiftsolve.agents.analyst import Analyst
+    return Analyst()
+
+
+@pytest.fixture(scope="session")
+def profiler():
+    """One Profiler shared by every test that needs it."""
+    from swiftsolve.agents.profiler import Profiler
+    return Profiler()
+
+
+@pytest.fixture(scope="session")
+def precompile(profiler):
+    """
+    Compile C++ snippets into the profiler's binary cache on a background thread.
+
+    Yields submit(code, **run_options) -> Future, where run_options are the
+    Profiler.run() options the snippet will be profiled with; repeated calls
+    return the same future. The executor is shut down at session teardown.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    futures = {}
+
+    def submit(code, **run_options):
+        key = (code, tuple(sorted(run_options.items())))
+        if key not in futures:
+            futures[key] = executor.submit(profiler.prepare, code, **run_options)
+        return futures[key]
+
+    yield submit
+    executor.shutdown(wait=True, cancel_futures=True)
+
+
+@pytest.fixture(scope="session")
+def coder():
+    """One Coder (and its LLM client) shared by every test that needs it."""
+    from swiftsolve.agents.coder import Coder
+    return Coder()
+
+
+@pytest.fixture(scope="session")
+def planner():
+    """One Planner (and its LLM client) shared by every test that needs it."""
+    from swiftsolve.agents.planner import Planner
+    return Planner()
@@ -78,7 +78,8 @@ class Analyst(Agent):
         """Detect if the performance curve is ambiguous and needs LLM analysis."""
         self.log.info(f"Checking curve ambiguity: slope={slope:.3f}, R²={r_squared:.3f}")
         
-        # Criteria for ambiguous curves:
+        # Criteria for ambiguous curves, cheap scalar checks before the
+        # per-point scans (any one of them makes the curve ambiguous):
         
         # 1. Poor fit (low R-squared)
         if r_squared < 0.7:
@@ -96,15 +97,20 @@ class Analyst(Agent):
                 self.log.info(f"Slope {slope:.3f} in ambiguous range [{low}, {high}]")
                 return True
         
-        # 3. Highly irregular or noisy data
+        # 3. Extreme slope values that might indicate measurement errors
+        if slope < -0.5 or slope > 10:
+            self.log.info(f"Extreme slope {slope:.3f} detected")
+            return True
+        
+        # 4. Highly irregular or noisy data
         if len(runtimes) >= 4:
             # Check for non-monotonic behavior (significant ups and downs)
             increases = 0
             decreases = 0
-            for i in range(1, len(runtimes)):
-                if runtimes[i] > runtimes[i-1] * 1.1:  # Significant increase
+            for prev, cur in zip(runtimes, runtimes[1:]):
+                if cur > prev * 1.1:  # Significant increase
                     increases += 1
-                elif runtimes[i] < runtimes[i-1] * 0.9:  # Significant decrease
+                elif cur < prev * 0.9:  # Significant decrease
                     decreases += 1
             
             # If we have both significant increases and decreases, it's noisy
@@ -112,11 +118,6 @@ class Analyst(Agent):
                 self.log.info(f"Noisy data detected: {increases} increases, {decreases} decreases")
                 return True
         
-        # 4. Extreme slope values that might indicate measurement errors
-        if slope < -0.5 or slope > 10:
-            self.log.info(f"Extreme slope {slope:.3f} detected")
-            return True
-        
         # 5. Very small input size range (hard to determine complexity)
         if len(input_sizes) >= 2:
             size_ratio = max(input_sizes) / min(input_sizes)
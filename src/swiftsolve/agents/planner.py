@@ -3,7 +3,8 @@ from anthropic import Anthropic
 from .base import Agent
 from ..schemas import PlanMessage, ProblemInput
 from ..utils.config import get_settings
-from typing import Optional
+from ..utils.feedback_store import PlannerFeedback, format_feedback, get_feedback_store
+from typing import Optional, Union
 import json
 
 class Planner(Agent):
@@ -11,7 +12,24 @@ class Planner(Agent):
         super().__init__("Planner")
         self.client = Anthropic(api_key=get_settings().anthropic_api_key)
 
-    def run(self, problem: ProblemInput, feedback: Optional[str] = None) -> PlanMessage:
+    def run(self, problem: ProblemInput,
+            feedback: Optional[Union[str, PlannerFeedback]] = None) -> PlanMessage:
+        exemplars = ""
+        if isinstance(feedback, dict):
+            # Structured feedback: show earlier failed strategies for the same
+            # task and target complexity as few-shot exemplars.
+            # The store is best-effort: an unusable database only costs the exemplars
+            try:
+                past = get_feedback_store().recent(problem.task_id, feedback["target_complexity"])
+            except Exception as e:
+                self.log.warning(f"Could not read planner feedback for {problem.task_id}: {e}")
+                past = []
+            if past:
+                exemplars = "\n\nSTRATEGIES THAT ALREADY FAILED ON THIS TASK:\n" + "\n".join(
+                    f"- {fb['prev_algorithm']}: {fb['failure_mode']} at {fb['measured_runtime_ms']:.2f}ms"
+                    for fb in past
+                )
+            feedback = format_feedback(feedback)
         if feedback:
             self.log.info(f"🔄 Re-planning with feedback: {feedback}")
         
@@ -57,7 +75,7 @@ Rules:
 {problem.prompt}
 
 PREVIOUS PERFORMANCE FEEDBACK:
-{feedback}
+{feedback}{exemplars}
 
 Generate a NEW algorithmic plan that addresses the performance issues. Choose a fundamentally different approach than before."""
         else:
@@ -6,14 +6,28 @@ from ..static_pruner import pruner
 from ..schemas import ProblemInput, VerdictMessage, CodeMessage
 from ..utils.config import get_settings
 from ..utils.logger import get_logger
+from ..utils.jsonio import dump_model
+from ..utils.feedback_store import PlannerFeedback, get_feedback_store
 import json
 
 log = get_logger("SolveLoop")
 planner, coder, profiler, analyst = Planner(), Coder(), Profiler(), Analyst()
 
+def _fast_dump(model) -> str:
+    """Pretty-printed JSON for log lines (orjson when available)."""
+    return dump_model(model, indent=True)
+
+def _validate_or_reject(plan) -> bool:
+    """Run the static pruner on a (re-)plan; False means the plan is rejected."""
+    if not pruner.validate(plan):
+        log.warning("Static pruner rejected plan")
+        return False
+    log.info("Static pruner approved plan")
+    return True
+
 def run_pipeline(problem: ProblemInput):
     log.info(f"=== Starting pipeline for task_id: {problem.task_id} ===")
-    log.info(f"Problem input: {problem.model_dump_json(indent=2)}")
+    log.info(f"Problem input: {_fast_dump(problem)}")
     
     max_iter = get_settings().max_iterations
     log.info(f"Max iterations: {max_iter}")
@@ -28,7 +42,7 @@ def run_pipeline(problem: ProblemInput):
     try:
         plan = planner.run(problem)
         log.info(f"✅ HANDOFF: Planner → Pipeline [SUCCESS]")
-        log.info(f"Plan: {plan.model_dump_json(indent=2)}")
+        log.info(f"Plan: {_fast_dump(plan)}")
     except Exception as e:
         agent_failures += 1
         log.error(f"Planner failed (attempt {agent_failures}/{max_failures}): {e}")
@@ -41,10 +55,8 @@ def run_pipeline(problem: ProblemInput):
     log.info("--- Starting Static Pruner ---")
     log.info(f"🔄 HANDOFF: Planner → StaticPruner")
     try:
-        if not pruner.validate(plan):
-            log.warning("Static pruner rejected plan")
+        if not _validate_or_reject(plan):
             return {"status": "static_prune_failed"}
-        log.info("Static pruner approved plan")
     except Exception as e:
         agent_failures += 1
         log.error(f"Static Pruner failed (attempt {agent_failures}/{max_failures}): {e}")
@@ -70,7 +82,7 @@ def run_pipeline(problem: ProblemInput):
             else:
                 code = coder.run(plan)
             log.info(f"✅ HANDOFF: Coder → Pipeline [SUCCESS]")
-            log.info(f"Code: {code.model_dump_json(indent=2)}")
+            log.info(f"Code: {_fast_dump(code)}")
         except Exception as e:
             agent_failures += 1
             log.error(f"Coder failed (attempt {agent_failures}/{max_failures}): {e}")
@@ -85,7 +97,7 @@ def run_pipeline(problem: ProblemInput):
         try:
             profile = profiler.run(code)
             log.info(f"✅ HANDOFF: Profiler → Pipeline [SUCCESS]")
-            log.info(f"Profile: {profile.model_dump_json(indent=2)}")
+            log.info(f"Profile: {_fast_dump(profile)}")
         except Exception as e:
             agent_failures += 1
             log.error(f"Profiler failed (attempt {agent_failures}/{max_failures}): {e}")
@@ -100,7 +112,7 @@ def run_pipeline(problem: ProblemInput):
         try:
             verdict: VerdictMessage = analyst.run(profile, problem.constraints)
             log.info(f"✅ HANDOFF: Analyst → Pipeline [SUCCESS]")
-            log.info(f"Verdict: {verdict.model_dump_json(indent=2)}")
+            log.info(f"Verdict: {_fast_dump(verdict)}")
         except Exception as e:
             agent_failures += 1
             log.error(f"Analyst failed (attempt {agent_failures}/{max_failures}): {e}")
@@ -134,12 +146,20 @@ def run_pipeline(problem: ProblemInput):
         else:
             log.info("Routing to Planner for re-planning")
             try:
-                # Generate feedback for planner based on current performance issues
-                feedback = f"Previous algorithm '{plan.algorithm}' showed inefficient performance with runtime {current_time:.2f}ms for large inputs. The current approach is not meeting the efficiency requirements. Choose a fundamentally different algorithmic approach that can achieve O(n log n) or better time complexity."
+                # Structured feedback for the planner; persisted so later runs can learn from it
+                feedback = PlannerFeedback(
+                    prev_algorithm=plan.algorithm,
+                    measured_runtime_ms=current_time,
+                    target_complexity="O(n log n)",
+                    failure_mode="inefficient_performance",
+                )
                 log.info(f"🔄 HANDOFF: Feedback → Planner [RE-PLANNING]")
                 plan = planner.run(problem, feedback=feedback)  # re-plan with feedback
                 log.info(f"✅ HANDOFF: Planner → Pipeline [RE-PLAN SUCCESS]")
-                log.info(f"Updated plan: {plan.model_dump_json(indent=2)}")
+                log.info(f"Updated plan: {_fast_dump(plan)}")
+                if not _validate_or_reject(plan):
+                    log.warning("=== Pipeline FAILED - Re-plan rejected by static pruner ===")
+                    return {"status": "static_prune_failed"}
             except Exception as e:
                 agent_failures += 1
                 log.error(f"Planner re-planning failed (attempt {agent_failures}/{max_failures}): {e}")
@@ -147,6 +167,13 @@ def run_pipeline(problem: ProblemInput):
                     log.error("=== PIPELINE ABORTED - Maximum agent failures reached ===")
                     return {"status": "agent_failure", "error": "Planner re-planning failed", "details": str(e)}
                 continue  # Skip this iteration and try again
+            
+            # Persisting is best-effort: a locked or read-only store must not
+            # cost the new plan or count as a planner failure
+            try:
+                get_feedback_store().append(problem.task_id, feedback)
+            except Exception as e:
+                log.warning(f"Could not persist planner feedback for {problem.task_id}: {e}")
         
         last_time = current_time
     
@@ -9,12 +9,13 @@ designed specifically for evaluating the ability to generate efficient algorithm
 """
 
 import json
-import re
 from pathlib import Path
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional
 
 from .task_format import TaskMetadata, TestCase, DifficultyLevel, ComplexityClass
 from ..utils.logger import get_logger
+from ..utils.jsonio import write_index
 
 log = get_logger("BigOBenchParser")
 
@@ -22,8 +23,10 @@ log = get_logger("BigOBenchParser")
 class BigOBenchParser:
     """Parser for BigO(Bench) dataset tasks."""
     
+    __slots__ = ("dataset_dir", "output_dir")
+    
     # Mapping from BigO(Bench) complexity to our enum
-    COMPLEXITY_MAPPING = {
+    COMPLEXITY_MAPPING = MappingProxyType({
         "O(1)": ComplexityClass.CONSTANT,
         "O(log n)": ComplexityClass.LOGARITHMIC,
         "O(n)": ComplexityClass.LINEAR,
@@ -33,10 +36,10 @@ class BigOBenchParser:
         "O(n^k)": ComplexityClass.POLYNOMIAL,
         "O(2^n)": ComplexityClass.EXPONENTIAL,
         "O(n!)": ComplexityClass.FACTORIAL
-    }
+    })
     
     # Difficulty mapping based on complexity
-    DIFFICULTY_MAPPING = {
+    DIFFICULTY_MAPPING = MappingProxyType({
         ComplexityClass.CONSTANT: DifficultyLevel.EASY,
         ComplexityClass.LOGARITHMIC: DifficultyLevel.EASY,
         ComplexityClass.LINEAR: DifficultyLevel.EASY,
@@ -46,7 +49,7 @@ class BigOBenchParser:
         ComplexityClass.POLYNOMIAL: DifficultyLevel.HARD,
         ComplexityClass.EXPONENTIAL: DifficultyLevel.HARD,
         ComplexityClass.FACTORIAL: DifficultyLevel.HARD
-    }
+    })
     
     def __init__(self, dataset_dir: Path):
         """
@@ -77,6 +80,7 @@ class BigOBenchParser:
         tasks = []
         for item in data.get('problems', []):
             try:
+                # Every entry is independent user data, so each one is validated
                 task = self._parse_problem_json(item)
                 if task:
                     tasks.append(task)
@@ -101,7 +105,12 @@ class BigOBenchParser:
         return []
     
     def _parse_problem_json(self, problem_data: Dict[str, Any]) -> Optional[TaskMetadata]:
-        """Parse a single problem from JSON format."""
+        """
+        Parse a single problem from JSON format.
+        
+        Args:
+            problem_data: Raw problem entry
+        """
         problem_id = problem_data.get('id', f"BIGOBENCH_{len(problem_data)}")
         
         # Extract complexity
@@ -132,7 +141,7 @@ class BigOBenchParser:
                 TestCase(input="5\n1 2 3 4 5", output="1 2 3 4 5", explanation="Larger case")
             ])
         
-        return TaskMetadata(
+        fields = dict(
             task_id=f"BIGOBENCH_{problem_id}",
             title=problem_data.get('title', f"Problem {problem_id}"),
             source="bigobench",
@@ -147,8 +156,10 @@ class BigOBenchParser:
             expected_approach=problem_data.get('approach', self._infer_approach(complexity)),
             test_cases=test_cases[:10],  # Limit to 10 test cases
             source_url=problem_data.get('url'),
-            tags=[complexity_str.lower().replace('(', '').replace(')', '').replace(' ', '-')]
+            tags=(complexity_str.lower().replace('(', '').replace(')', '').replace(' ', '-'),)
         )
+        
+        return TaskMetadata(**fields)
     
     def _parse_problem_html(self, problem_div) -> Optional[TaskMetadata]:
         """Parse a single problem from HTML div element. (Disabled - requires bs4)"""
@@ -183,28 +194,25 @@ class BigOBenchParser:
             filename = f"task_{task.task_id.lower()}.json"
             filepath = self.output_dir / filename
             
-            with open(filepath, 'w') as f:
-                json.dump(task.model_dump(), f, indent=2)
+            filepath.write_text(task.model_dump_json(indent=2), encoding="utf-8")
         
-        # Create index file
-        index = {
+        # Create index file, streaming one entry per task
+        header = {
             "dataset": "bigobench",
             "version": "1.0.0",
             "task_count": len(tasks),
-            "tasks": [
-                {
-                    "task_id": task.task_id,
-                    "title": task.title,
-                    "difficulty": task.difficulty.value,
-                    "complexity": task.expected_complexity.value,
-                    "file": f"task_{task.task_id.lower()}.json"
-                }
-                for task in tasks
-            ]
         }
-        
-        with open(self.output_dir / "index.json", 'w') as f:
-            json.dump(index, f, indent=2)
+        entries = (
+            {
+                "task_id": task.task_id,
+                "title": task.title,
+                "difficulty": task.difficulty.value,
+                "complexity": task.expected_complexity.value,
+                "file": f"task_{task.task_id.lower()}.json"
+            }
+            for task in tasks
+        )
+        write_index(self.output_dir / "index.json", header, "tasks", entries)
         
         log.info(f"Created index with {len(tasks)} tasks")
 
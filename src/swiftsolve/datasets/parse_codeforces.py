@@ -8,17 +8,154 @@ Handles Codeforces Div-2 problems (800-1800 rating) with proper rate limiting
 and caching to respect Codeforces API and scraping policies.
 """
 
-import json
+import bisect
+import importlib.util
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from .task_format import TaskMetadata, TestCase, DifficultyLevel, ComplexityClass
 from ..utils.logger import get_logger
+from ..utils.jsonio import write_index
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+# C-backed tree builder for BeautifulSoup when installed
+_HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
 
 log = get_logger("CodeforcesParser")
 
+# Patterns compiled once at import time
+_TIME_RE = re.compile(r'(\d+)\s*seconds?')
+_MEM_RE = re.compile(r'(\d+)\s*megabytes?')
+_BOUND_RE = re.compile(r'1\s*≤\s*([nmkq])\s*≤\s*(\d+)', re.IGNORECASE)
+# Priority order for approach selection
+_PRIORITY_TAGS = ('dp', 'graphs', 'binary search', 'two pointers', 'greedy', 'math', 'implementation')
+# Known tag vocabulary, matched as whole tags in a single scan over the joined tag list
+_TAG_SCAN = re.compile(
+    r'^(dp|graphs|binary search|two pointers|greedy|math|implementation|sorting|brute force)$',
+    re.MULTILINE
+)
+_COMPLEXITY_HINT_RE = re.compile(r'sort|binary search|dp|dynamic', re.IGNORECASE)
+_COMPLEXITY_HINTS = {
+    'sort': ComplexityClass.LINEARITHMIC,
+    'binary search': ComplexityClass.LINEARITHMIC,
+    'dp': ComplexityClass.QUADRATIC,
+    'dynamic': ComplexityClass.QUADRATIC,
+}
+
+
+
+def _scan_tags(tags: Tuple[str, ...]) -> frozenset:
+    """Return the known tags present in tags, found in one regex pass."""
+    return frozenset(_TAG_SCAN.findall('\n'.join(tags)))
+
+
+@lru_cache(maxsize=1024)
+def _complexity_from_tags(tags: Tuple[str, ...]) -> Optional[ComplexityClass]:
+    """Complexity implied by the highest-priority known tag, or None."""
+    hit = _scan_tags(tags)
+    for tag in CodeforcesParser._COMPLEXITY_PRIORITY:
+        if tag in hit:
+            return CodeforcesParser.COMMON_COMPLEXITIES[tag]
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _approach_from_tags(tags: Tuple[str, ...]) -> str:
+    """Approach implied by the highest-priority known tag."""
+    if not tags:
+        return "implementation"
+    
+    hit = _scan_tags(tags)
+    for tag in _PRIORITY_TAGS:
+        if tag in hit:
+            return tag
+    
+    return tags[0]  # First tag as fallback
+
+
+# Placeholder test cases, built once and shared instead of re-validated per problem
+_FALLBACK_TESTS = (
+    TestCase(input="1", output="1", explanation="Sample case"),
+    TestCase(input="2", output="2", explanation="Basic case"),
+    TestCase(input="3", output="3", explanation="Extended case"),
+)
+_PAD_TESTS = (
+    TestCase(input="1", output="1", explanation="Additional case"),
+    TestCase(input="2", output="2", explanation="Edge case"),
+)
+
+# Test cases shared by every problem in create_sample_codeforces_dataset
+_SAMPLE_TEST_CASES = (
+    TestCase(input="3\n1 2 3", output="6", explanation="Sample case"),
+    TestCase(input="1\n5", output="5", explanation="Single element"),
+    TestCase(input="4\n1 1 1 1", output="4", explanation="All same"),
+)
+
+
+def _text(tag, strip: bool = True) -> Optional[str]:
+    """Text of a BeautifulSoup tag, or None when the tag is missing."""
+    return tag.get_text(strip=strip) if tag else None
+
+
+def _sample_pairs(sample_tests) -> Tuple[Tuple[str, str], ...]:
+    """
+    (input, output) texts of the samples in a div.sample-tests.
+    
+    Each div.input is paired with the div.output right after it, so a sample
+    missing its <pre> is skipped instead of shifting every later pair.
+    """
+    pairs = []
+    for inp_div in sample_tests.select('div.input'):
+        out_div = inp_div.find_next_sibling('div')
+        if out_div is None or 'output' not in out_div.get('class', ()):
+            continue
+        inp_pre = inp_div.find('pre')
+        out_pre = out_div.find('pre')
+        if inp_pre is None or out_pre is None:
+            continue
+        pairs.append((inp_pre.get_text().strip(), out_pre.get_text().strip()))
+    return tuple(pairs)
+
+
+@lru_cache(maxsize=256)
+def _parse_page(html: str) -> Dict[str, Any]:
+    """
+    Parse a problem page once and extract every field the extractors need.
+    
+    Only the extracted strings are cached, never the soup, so the cache
+    stays small.
+    
+    Args:
+        html: Raw problem page HTML
+        
+    Returns:
+        Dict of section name to its text (None when the section is missing);
+        'samples' holds the (input, output) pairs of the sample tests
+    """
+    if not BS4_AVAILABLE:
+        raise ImportError("beautifulsoup4 is required to parse Codeforces problem pages")
+    soup = BeautifulSoup(html, _HTML_PARSER)
+    statement = soup.find('div', class_='problem-statement')
+    samples = soup.find('div', class_='sample-tests')
+    return {
+        'statement': _text(statement),
+        # The description paragraph is the statement's first nested div
+        'description': _text(statement.find('div')) if statement else None,
+        'input_spec': _text(soup.find('div', class_='input-specification')),
+        'output_spec': _text(soup.find('div', class_='output-specification')),
+        'header': _text(soup.find('div', class_='header'), strip=False),
+        'samples': _sample_pairs(samples) if samples else None,
+    }
+
 
 class CodeforcesParser:
     """Parser for Codeforces contest problems."""
@@ -29,6 +166,10 @@ class CodeforcesParser:
         (900, 1400): DifficultyLevel.MEDIUM,
         (1400, float('inf')): DifficultyLevel.HARD
     }
+    # Sorted lower bounds / levels derived from RATING_DIFFICULTY for bisect lookups
+    _RATING_RANGES = sorted(RATING_DIFFICULTY.items())
+    _RATING_THRESHOLDS = [min_rating for (min_rating, _), _ in _RATING_RANGES[1:]]
+    _RATING_LEVELS = [difficulty for _, difficulty in _RATING_RANGES]
     
     # Common complexity patterns from Codeforces problems
     COMMON_COMPLEXITIES = {
@@ -42,6 +183,11 @@ class CodeforcesParser:
         "sorting": ComplexityClass.LINEARITHMIC,
         "brute force": ComplexityClass.QUADRATIC
     }
+    # Most specific tags decide first (mirrors the _infer_approach ordering)
+    _COMPLEXITY_PRIORITY = (
+        "dp", "graphs", "binary search", "sorting", "two pointers",
+        "brute force", "greedy", "math", "implementation"
+    )
     
     def __init__(self, dataset_dir: Path, rate_limit: float = 1.0):
         """
@@ -100,48 +246,48 @@ class CodeforcesParser:
             log.warning(f"Failed to parse problem {task_id}: {e}")
             return None
     
-    def _extract_problem_statement(self, soup) -> str:
+    def _parse_page(self, html: str) -> Dict[str, Any]:
+        """Parse a problem page once; the extracted fields are cached per HTML string."""
+        return _parse_page(html)
+    
+    def _extract_problem_statement(self, page: Dict[str, Any]) -> str:
         """Extract problem description from HTML."""
-        # Look for problem statement div
-        statement_div = soup.find('div', class_='problem-statement')
-        if not statement_div:
+        statement = page['statement']
+        if statement is None:
             return "Problem statement not found"
         
-        # Get the description paragraph
-        desc_div = statement_div.find('div')
-        if desc_div:
-            return desc_div.get_text(strip=True)
+        # Prefer the description paragraph
+        if page['description'] is not None:
+            return page['description']
         
-        return statement_div.get_text(strip=True)[:500]  # Limit length
+        return statement[:500]  # Limit length
     
-    def _extract_input_format(self, soup) -> str:
+    def _extract_input_format(self, page: Dict[str, Any]) -> str:
         """Extract input format description."""
-        input_section = soup.find('div', class_='input-specification')
-        if input_section:
-            return input_section.get_text(strip=True)
+        if page['input_spec'] is not None:
+            return page['input_spec']
         return "Input format not specified"
     
-    def _extract_output_format(self, soup) -> str:
+    def _extract_output_format(self, page: Dict[str, Any]) -> str:
         """Extract output format description."""
-        output_section = soup.find('div', class_='output-specification')
-        if output_section:
-            return output_section.get_text(strip=True)
+        if page['output_spec'] is not None:
+            return page['output_spec']
         return "Output format not specified"
     
-    def _extract_limits(self, soup) -> tuple[int, int]:
+    def _extract_limits(self, page: Dict[str, Any]) -> tuple[int, int]:
         """Extract time and memory limits."""
         # Default limits
         time_limit_ms = 2000
         memory_limit_mb = 256
         
         # Look for limits in header
-        header = soup.find('div', class_='header')
-        if header:
-            time_match = re.search(r'(\d+)\s*seconds?', header.get_text())
+        header_text = page['header']
+        if header_text:
+            time_match = _TIME_RE.search(header_text)
             if time_match:
                 time_limit_ms = int(time_match.group(1)) * 1000
             
-            memory_match = re.search(r'(\d+)\s*megabytes?', header.get_text())
+            memory_match = _MEM_RE.search(header_text)
             if memory_match:
                 memory_limit_mb = int(memory_match.group(1))
         
@@ -151,102 +297,63 @@ class CodeforcesParser:
         """Extract input size bounds from problem text."""
         bounds = {}
         
-        # Look for common constraint patterns
-        n_match = re.search(r'1\s*≤\s*n\s*≤\s*(\d+)', problem_text, re.IGNORECASE)
-        if n_match:
-            bounds['n'] = int(n_match.group(1))
-        else:
-            bounds['n'] = 100000  # Default
-        
-        # Look for other common variables
-        for var in ['m', 'k', 'q']:
-            var_match = re.search(rf'1\s*≤\s*{var}\s*≤\s*(\d+)', problem_text, re.IGNORECASE)
-            if var_match:
-                bounds[var] = int(var_match.group(1))
+        # Single pass over the text; the first bound seen for each variable wins
+        for match in _BOUND_RE.finditer(problem_text):
+            bounds.setdefault(match.group(1).lower(), int(match.group(2)))
+        bounds.setdefault('n', 100000)  # Default
         
         return bounds
     
-    def _extract_test_cases(self, soup) -> List[TestCase]:
+    def _extract_test_cases(self, page: Dict[str, Any]) -> List[TestCase]:
         """Extract sample test cases."""
         test_cases = []
         
-        # Find sample input/output sections
-        sample_tests = soup.find('div', class_='sample-tests')
-        if not sample_tests:
-            # Fallback: create minimal test cases
-            return [
-                TestCase(input="1", output="1", explanation="Sample case"),
-                TestCase(input="2", output="2", explanation="Basic case"),
-                TestCase(input="3", output="3", explanation="Extended case")
-            ]
+        # Sample input/output pairs found by _parse_page
+        samples = page['samples']
+        if samples is None:
+            # Fallback: minimal test cases
+            return list(_FALLBACK_TESTS)
         
-        inputs = sample_tests.find_all('div', class_='input')
-        outputs = sample_tests.find_all('div', class_='output')
-        
-        for i, (inp_div, out_div) in enumerate(zip(inputs, outputs)):
-            # Extract text content from pre tags
-            inp_pre = inp_div.find('pre')
-            out_pre = out_div.find('pre')
-            
-            if inp_pre and out_pre:
-                input_text = inp_pre.get_text().strip()
-                output_text = out_pre.get_text().strip()
-                
-                test_cases.append(TestCase(
-                    input=input_text,
-                    output=output_text,
-                    explanation=f"Sample test {i+1}"
-                ))
+        for i, (inp, out) in enumerate(samples):
+            test_cases.append(TestCase(
+                input=inp,
+                output=out,
+                explanation=f"Sample test {i+1}"
+            ))
         
         # Ensure minimum test cases
         if len(test_cases) < 3:
-            test_cases.extend([
-                TestCase(input="1", output="1", explanation="Additional case"),
-                TestCase(input="2", output="2", explanation="Edge case"),
-            ])
+            test_cases.extend(_PAD_TESTS)
         
         return test_cases[:5]  # Limit to 5 test cases
     
     def _rating_to_difficulty(self, rating: int) -> DifficultyLevel:
         """Convert Codeforces rating to difficulty level."""
-        for (min_rating, max_rating), difficulty in self.RATING_DIFFICULTY.items():
-            if min_rating <= rating < max_rating:
-                return difficulty
-        return DifficultyLevel.MEDIUM
+        return self._RATING_LEVELS[bisect.bisect_right(self._RATING_THRESHOLDS, rating)]
     
-    def _infer_complexity(self, tags: List[str], problem_text: str) -> ComplexityClass:
+    def _infer_complexity(self, tags: Tuple[str, ...], problem_text: str) -> ComplexityClass:
         """Infer expected complexity from tags and problem text."""
         # Check tags for complexity hints
-        for tag in tags:
-            if tag in self.COMMON_COMPLEXITIES:
-                return self.COMMON_COMPLEXITIES[tag]
+        complexity = _complexity_from_tags(tuple(tags))
+        if complexity is not None:
+            return complexity
         
-        # Fallback based on text analysis
-        if any(word in problem_text.lower() for word in ['sort', 'binary search']):
-            return ComplexityClass.LINEARITHMIC
-        elif any(word in problem_text.lower() for word in ['dp', 'dynamic']):
-            return ComplexityClass.QUADRATIC
-        elif 'math' in tags:
+        # Fallback based on text analysis: one scan, sort/binary search outrank dp
+        text_hint = None
+        for match in _COMPLEXITY_HINT_RE.finditer(problem_text):
+            text_hint = _COMPLEXITY_HINTS[match.group(0).lower()]
+            if text_hint is ComplexityClass.LINEARITHMIC:
+                break
+        if text_hint is not None:
+            return text_hint
+        if 'math' in tags:
             return ComplexityClass.CONSTANT
         
         return ComplexityClass.LINEAR  # Default
     
-    def _infer_approach(self, tags: List[str]) -> str:
+    def _infer_approach(self, tags: Tuple[str, ...]) -> str:
         """Infer expected algorithmic approach from tags."""
-        if not tags:
-            return "implementation"
-        
-        # Priority order for approach selection
-        priority_tags = [
-            'dp', 'graphs', 'binary search', 'two pointers', 
-            'greedy', 'math', 'implementation'
-        ]
-        
-        for tag in priority_tags:
-            if tag in tags:
-                return tag
-        
-        return tags[0]  # First tag as fallback
+        return _approach_from_tags(tuple(tags))
     
     def save_tasks(self, tasks: List[TaskMetadata]) -> None:
         """
@@ -257,35 +364,34 @@ class CodeforcesParser:
         """
         log.info(f"Saving {len(tasks)} Codeforces tasks to {self.output_dir}")
         
-        for task in tasks:
-            filename = f"task_{task.task_id.lower()}.json"
-            filepath = self.output_dir / filename
-            
-            with open(filepath, 'w') as f:
-                json.dump(task.model_dump(), f, indent=2)
+        # Serialize up front, then overlap the small file writes on a thread pool
+        pairs = [
+            (self.output_dir / f"task_{task.task_id.lower()}.json", task.model_dump_json(indent=2))
+            for task in tasks
+        ]
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            list(ex.map(lambda pair: pair[0].write_text(pair[1], encoding="utf-8"), pairs))
         
-        # Create index file
-        index = {
+        # Create index file, streaming one entry per task
+        header = {
             "dataset": "codeforces",
-            "version": "1.0.0", 
+            "version": "1.0.0",
             "task_count": len(tasks),
             "rating_range": [800, 1800],
-            "tasks": [
-                {
-                    "task_id": task.task_id,
-                    "title": task.title,
-                    "difficulty": task.difficulty.value,
-                    "rating": task.source_rating,
-                    "complexity": task.expected_complexity.value,
-                    "tags": task.tags,
-                    "file": f"task_{task.task_id.lower()}.json"
-                }
-                for task in tasks
-            ]
         }
-        
-        with open(self.output_dir / "index.json", 'w') as f:
-            json.dump(index, f, indent=2)
+        entries = (
+            {
+                "task_id": task.task_id,
+                "title": task.title,
+                "difficulty": task.difficulty.value,
+                "rating": task.source_rating,
+                "complexity": task.expected_complexity.value,
+                "tags": task.tags,
+                "file": f"task_{task.task_id.lower()}.json"
+            }
+            for task in tasks
+        )
+        write_index(self.output_dir / "index.json", header, "tasks", entries)
         
         log.info(f"Created Codeforces index with {len(tasks)} tasks")
 
@@ -332,7 +438,7 @@ def create_sample_codeforces_dataset(output_dir: Path) -> None:
         # Create mock task without network request
         task_id = f"CF{problem['contestId']}{problem['index']}"
         rating = problem['rating']
-        tags = problem['tags']
+        tags = tuple(problem['tags'])
         
         task = TaskMetadata(
             task_id=task_id,
@@ -347,11 +453,7 @@ def create_sample_codeforces_dataset(output_dir: Path) -> None:
             memory_limit_mb=256,
             expected_complexity=parser._infer_complexity(tags, ""),
             expected_approach=parser._infer_approach(tags),
-            test_cases=[
-                TestCase(input="3\n1 2 3", output="6", explanation="Sample case"),
-                TestCase(input="1\n5", output="5", explanation="Single element"),
-                TestCase(input="4\n1 1 1 1", output="4", explanation="All same")
-            ],
+            test_cases=list(_SAMPLE_TEST_CASES),
             source_url=f"https://codeforces.com/problemset/problem/{problem['contestId']}/{problem['index']}",
             source_rating=rating,
             tags=tags
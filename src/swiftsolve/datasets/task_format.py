@@ -7,8 +7,8 @@ All tasks (BigO(Bench), Codeforces, etc.) must conform to this schema.
 Based on CONTEXT.md section 1.10 and repository layout section 3.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, Field, conint, field_validator
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 
 
@@ -52,9 +52,9 @@ class TaskMetadata(BaseModel):
     output_format: str = Field(..., description="Description of output format")
     
     # Constraints and limits
-    input_bounds: Dict[str, int] = Field(..., description="Input size bounds (e.g., {'n': 100000})")
-    time_limit_ms: int = Field(..., description="Time limit in milliseconds")
-    memory_limit_mb: int = Field(..., description="Memory limit in megabytes")
+    input_bounds: Dict[str, conint(gt=0)] = Field(..., description="Input size bounds (e.g., {'n': 100000})")
+    time_limit_ms: conint(gt=0, le=60000) = Field(..., description="Time limit in milliseconds")
+    memory_limit_mb: conint(gt=0, le=2048) = Field(..., description="Memory limit in megabytes")
     
     # Expected solution properties
     expected_complexity: ComplexityClass = Field(..., description="Expected optimal time complexity")
@@ -66,36 +66,15 @@ class TaskMetadata(BaseModel):
     # Dataset-specific metadata
     source_url: Optional[str] = Field(None, description="Original problem URL")
     source_rating: Optional[int] = Field(None, description="Original difficulty rating (e.g., Codeforces rating)")
-    tags: List[str] = Field(default_factory=list, description="Problem tags (e.g., ['graph', 'dfs', 'binary-search'])")
+    tags: Tuple[str, ...] = Field(default_factory=tuple, description="Problem tags (e.g., ('graph', 'dfs', 'binary-search'))")
     
-    @validator('task_id')
+    @field_validator('task_id')
+    @classmethod
     def validate_task_id(cls, v):
         """Ensure task_id follows naming convention."""
         if not v or len(v) < 3:
             raise ValueError("task_id must be at least 3 characters")
         return v
-    
-    @validator('input_bounds')
-    def validate_input_bounds(cls, v):
-        """Ensure input bounds are positive."""
-        for key, value in v.items():
-            if not isinstance(value, int) or value <= 0:
-                raise ValueError(f"Input bound {key} must be a positive integer")
-        return v
-    
-    @validator('time_limit_ms')
-    def validate_time_limit(cls, v):
-        """Ensure reasonable time limit."""
-        if v <= 0 or v > 60000:  # 0-60 seconds
-            raise ValueError("Time limit must be between 1ms and 60000ms")
-        return v
-    
-    @validator('memory_limit_mb')
-    def validate_memory_limit(cls, v):
-        """Ensure reasonable memory limit."""
-        if v <= 0 or v > 2048:  # 0-2GB
-            raise ValueError("Memory limit must be between 1MB and 2048MB")
-        return v
 
 
 def validate_task_file(task_data: Dict[str, Any]) -> TaskMetadata:
@@ -114,6 +93,27 @@ def validate_task_file(task_data: Dict[str, Any]) -> TaskMetadata:
     return TaskMetadata.model_validate(task_data)
 
 
+def construct_task(task_data: Dict[str, Any]) -> TaskMetadata:
+    """
+    Build TaskMetadata from trusted data without running validators.
+    
+    Intended for task files this repo generated itself. Nested test cases and
+    enums are converted explicitly, since model_construct leaves them raw.
+    
+    Args:
+        task_data: Raw task data from a repo-generated JSON file
+        
+    Returns:
+        Unvalidated TaskMetadata instance
+    """
+    fields = dict(task_data)
+    fields['difficulty'] = DifficultyLevel(fields['difficulty'])
+    fields['expected_complexity'] = ComplexityClass(fields['expected_complexity'])
+    fields['test_cases'] = [TestCase.model_construct(**tc) for tc in fields['test_cases']]
+    fields['tags'] = tuple(fields.get('tags', ()))
+    return TaskMetadata.model_construct(**fields)
+
+
 def create_problem_input(task: TaskMetadata) -> Dict[str, Any]:
     """
     Convert TaskMetadata to ProblemInput format for SwiftSolve pipeline.
@@ -124,22 +124,30 @@ def create_problem_input(task: TaskMetadata) -> Dict[str, Any]:
     Returns:
         Dict suitable for ProblemInput schema
     """
+    # The agents only see the prompt, so the first few test cases go into it
+    # as worked examples; all of them are passed on as unit_tests
+    examples = []
+    for i, tc in enumerate(task.test_cases[:3], 1):  # Include first 3 as examples
+        example = f"Example {i}:\nInput:\n{tc.input}\nOutput:\n{tc.output}"
+        if tc.explanation:
+            example += f"\nExplanation: {tc.explanation}"
+        examples.append(example)
+    
     return {
         "task_id": task.task_id,
-        "description": task.description,
-        "input_format": task.input_format,
-        "output_format": task.output_format,
+        "prompt": "\n\n".join([
+            task.description,
+            f"Input format: {task.input_format}\n"
+            f"Output format: {task.output_format}",
+            *examples,
+        ]),
         "constraints": {
             "runtime_limit": task.time_limit_ms,
             "memory_limit": task.memory_limit_mb
         },
-        "examples": [
-            {
-                "input": tc.input,
-                "output": tc.output,
-                "explanation": tc.explanation
-            }
-            for tc in task.test_cases[:3]  # Include first 3 as examples
+        "unit_tests": [
+            {"input": tc.input, "output": tc.output}
+            for tc in task.test_cases
         ]
     }
 
@@ -4,19 +4,25 @@ Batch Runner for Systematic Benchmarking
 Implements the batch runner specified in CONTEXT.md section 4.2 Phase D:
 - CLI flags: --benchmark, --seeds, --replans
 - Multiprocess pool, progress bar (tqdm)
-- Store artifacts under results/<task>/seed_<s>/
+- Store artifacts under results/<task>/seed_<s>/ (one runs.jsonl shard per seed)
+- Keep a compact results/index.jsonl (one record per run) for report generation
 
 Enables large-scale evaluation runs for research benchmarking.
 """
 
 import argparse
-import json
+import mmap
+import os
+import pickle
+import tempfile
 import time
-import random
+import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from multiprocessing import cpu_count
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from collections import deque
+import multiprocessing
+from multiprocessing import cpu_count, shared_memory
 import traceback
 
 try:
@@ -26,30 +32,284 @@ except ImportError:
     TQDM_AVAILABLE = False
     print("Warning: tqdm not available. Progress bars will not be shown.")
 
+from pydantic import BaseModel
+
 from ..controller.solve_loop import run_pipeline
 from ..schemas import ProblemInput
-from ..datasets.task_format import TaskMetadata, create_problem_input
+from ..datasets.task_format import TaskMetadata, construct_task, create_problem_input
 from ..evaluation.metrics import EvaluationMetrics
 from ..utils.logger import get_logger
 from ..utils.config import get_settings
+from ..utils.jsonio import dumps, loads
 
 log = get_logger("BatchRunner")
 
+# Number of appended results between flushes of the JSONL shards
+RESULT_FLUSH_EVERY = 32
+
+# Adaptive chunking: aim for chunks of roughly this much work, based on the
+# smoothed per-job runtime observed for each difficulty level
+CHUNK_TARGET_SEC = 5.0
+CHUNK_MAX_SIZE = 64
+RUNTIME_EMA_ALPHA = 0.1
+
+# Per-worker view of the shared task store set up by _init_worker; tasks are
+# unpickled on first use and memoized so jobs only carry task ids
+_WORKER_SHM: Optional[shared_memory.SharedMemory] = None
+_WORKER_INDEX: Dict[str, tuple] = {}
+_WORKER_TASKS: Dict[str, TaskMetadata] = {}
+
+
+def _init_worker(shm_name: str, index: Dict[str, tuple]) -> None:
+    """
+    Pool initializer: attach to the shared-memory block holding the pickled tasks.
+    
+    Args:
+        shm_name: Name of the SharedMemory block
+        index: task_id -> (offset, length) of each pickled task in the block
+    """
+    global _WORKER_SHM, _WORKER_INDEX
+    _WORKER_SHM = shared_memory.SharedMemory(name=shm_name)
+    _WORKER_INDEX = index
+    _WORKER_TASKS.clear()
+
+
+def _get_task(task_id: str) -> TaskMetadata:
+    """Return a task from the shared store, unpickling it on first access."""
+    task = _WORKER_TASKS.get(task_id)
+    if task is None:
+        offset, length = _WORKER_INDEX[task_id]
+        task = pickle.loads(_WORKER_SHM.buf[offset:offset + length])
+        _WORKER_TASKS[task_id] = task
+    return task
+
+
+def _run_single_job(task_id: str, seed: int, run_id: int, timeout: int) -> Optional[Dict[str, Any]]:
+    """
+    Execute a single benchmark job inside a worker.
+    
+    Args:
+        task_id: Task to run (looked up in the worker's task cache)
+        seed: Random seed for reproducibility
+        run_id: Run index for this task/seed
+        timeout: Timeout for the run in seconds
+        
+    Returns:
+        Job result (without task_metadata, which the main process attaches)
+        or None if failed
+    """
+    task = _get_task(task_id)
+    
+    # The seed only labels the run: nothing in the pipeline draws from Python's
+    # global RNG, and reseeding it here would leak state between jobs sharing a
+    # worker. Components that need randomness should take random.Random(seed).
+    
+    try:
+        # Convert task to problem input
+        # create_problem_input builds the ProblemInput fields from an already
+        # loaded task, so construct without re-validating
+        problem_input_data = create_problem_input(task)
+        problem = ProblemInput.model_construct(**problem_input_data)
+        
+        # Run pipeline
+        start_time = time.time()
+        result = run_pipeline(problem)
+        end_time = time.time()
+        
+        # Package result
+        job_result = {
+            'task_id': task.task_id,
+            'seed': seed,
+            'run_id': run_id,
+            'result': result,
+            'execution_time_sec': end_time - start_time,
+            'timestamp': time.time()
+        }
+        
+        return job_result
+        
+    except Exception as e:
+        log.error(f"Job execution failed: {task.task_id} seed={seed} run={run_id}: {e}")
+        log.debug(traceback.format_exc())
+        return None
+
+
+def _scan_dir(directory: Path, prefix: str = "", suffix: str = ".json") -> List[os.DirEntry]:
+    """List matching files with os.scandir (DirEntry caches the stat info)."""
+    try:
+        with os.scandir(directory) as it:
+            return [de for de in it
+                    if de.name.startswith(prefix) and de.name.endswith(suffix) and de.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _walk_result_files(root: Path) -> List[Path]:
+    """Find JSONL result shards and legacy run_*.json files under root."""
+    found = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name == "runs.jsonl" or (name.startswith("run_") and name.endswith(".json")):
+                found.append(Path(dirpath, name))
+    return found
+
+
+def _read_files(paths: List[Path]) -> List[tuple]:
+    """
+    Read many small files concurrently; file reads release the GIL.
+    
+    Args:
+        paths: Files to read
+        
+    Returns:
+        (path, bytes) pairs; bytes is None when the read failed
+    """
+    def read(path: Path) -> tuple:
+        try:
+            return path, path.read_bytes()
+        except OSError as e:
+            log.warning(f"Failed to read {path}: {e}")
+            return path, None
+    
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        return list(ex.map(read, paths))
+
+
+def _iter_jsonl(path: Path):
+    """Yield parsed records from a JSONL shard, scanning it through mmap."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if not line.strip():
+                    continue
+                try:
+                    yield loads(line)
+                except ValueError as e:
+                    log.warning(f"Skipping malformed line in {path}: {e}")
+
+
+def _dump_pickle(path: Path, obj: Any) -> None:
+    """
+    Pickle obj to path through a staged file renamed into place, so an
+    interrupted run never leaves a truncated pickle behind.
+    """
+    fd, staged = tempfile.mkstemp(prefix=f"{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(staged, path)
+    except BaseException:
+        Path(staged).unlink(missing_ok=True)
+        raise
+
+
+def _metric_args(data: Dict[str, Any]) -> tuple:
+    """Reduce a stored job result to the positional args of add_run_result."""
+    task_meta = data['task_metadata']
+    return (data['task_id'], data['run_id'], data['result'],
+            task_meta['time_limit_ms'], task_meta['memory_limit_mb'])
+
+
+def _task_metadata(task: TaskMetadata) -> Dict[str, Any]:
+    """Metadata stored alongside each result of a task."""
+    return {
+        'difficulty': task.difficulty.value,
+        'expected_complexity': task.expected_complexity.value,
+        'time_limit_ms': task.time_limit_ms,
+        'memory_limit_mb': task.memory_limit_mb
+    }
+
+
+def _index_record(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a job result to the flat fields EvaluationMetrics needs.
+    
+    Args:
+        result: Job result with task_metadata attached
+        
+    Returns:
+        Compact record for results/index.jsonl
+    """
+    run = result['result']
+    profile = run.get('profile') or {}
+    runtimes = profile.get('runtime_ms')
+    memories = profile.get('peak_memory_mb')
+    if 'iteration' in run:
+        iterations = run['iteration'] + 1
+    else:
+        iterations = (run.get('last_verdict') or {}).get('iteration', 0) + 1
+    task_meta = result['task_metadata']
+    return {
+        'task_id': result['task_id'],
+        'seed': result['seed'],
+        'run_id': result['run_id'],
+        'status': run.get('status', 'failed'),
+        'runtime_ms': runtimes[-1] if runtimes else None,
+        'memory_mb': memories[-1] if memories else None,
+        'iterations': iterations,
+        'time_limit_ms': task_meta['time_limit_ms'],
+        'memory_limit_mb': task_meta['memory_limit_mb'],
+    }
+
+
+def _index_metric_args(record: Dict[str, Any]) -> tuple:
+    """Rebuild the add_run_result args from an index.jsonl record."""
+    result = {'status': record['status'], 'iteration': record['iterations'] - 1}
+    if record['runtime_ms'] is not None or record['memory_mb'] is not None:
+        result['profile'] = {'runtime_ms': [record['runtime_ms']],
+                             'peak_memory_mb': [record['memory_mb']]}
+    return (record['task_id'], record['run_id'], result,
+            record['time_limit_ms'], record['memory_limit_mb'])
+
+
+def _run_job_batch(jobs_chunk: List[tuple]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Execute a chunk of jobs in one worker call.
+    
+    Args:
+        jobs_chunk: (task_id, seed, run_id, timeout) tuples
+        
+    Returns:
+        Results aligned with jobs_chunk (None for failed jobs)
+    """
+    return [_run_single_job(*job) for job in jobs_chunk]
+
 
 class BatchRunner:
     """Batch runner for systematic SwiftSolve evaluation."""
     
-    def __init__(self, output_dir: Path, max_workers: Optional[int] = None):
+    def __init__(self, output_dir: Path, max_workers: Optional[int] = None,
+                 max_tasks_per_child: Optional[int] = None):
         """
         Initialize batch runner.
         
         Args:
             output_dir: Directory to store results
             max_workers: Maximum number of parallel workers (default: CPU count)
+            max_tasks_per_child: Recycle each worker after this many job chunks
+                to bound memory growth (default: never recycle)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.max_workers = max_workers or min(cpu_count(), 8)  # Limit to 8 for stability
+        self.max_tasks_per_child = max_tasks_per_child
+        
+        # Append-only JSONL shard per (task_id, seed), opened lazily while a benchmark runs
+        self._result_handles: Dict[tuple, Any] = {}
+        self._unflushed = 0
+        
+        # Denormalized index.jsonl (one compact record per run) read by the report
+        self.index_file = self.output_dir / "index.jsonl"
+        self._index_handle = None
+        
+        # Metrics accumulated as results arrive, so a report right after a
+        # benchmark needs no second pass over the stored results. Only valid
+        # while output_dir held no results from before, since reruns of the
+        # same (task, seed, run_id) replace stored records
+        self._metrics = EvaluationMetrics()
+        self._metrics_cover_disk = True
         
         log.info(f"Initialized batch runner with {self.max_workers} workers")
         log.info(f"Results will be stored in: {self.output_dir}")
@@ -69,50 +329,78 @@ class BatchRunner:
         for dataset_dir in dataset_dirs:
             log.info(f"Loading tasks from {dataset_dir}")
             
+            # Reuse the pickled task list while the dataset's JSON files are
+            # the same set with the same mtimes and sizes (added, removed or
+            # modified files all invalidate it)
+            cache_file = dataset_dir / ".tasks_cache.v2.pkl"
+            fingerprint = sorted((de.name, de.stat().st_mtime_ns, de.stat().st_size)
+                                 for de in _scan_dir(dataset_dir))
+            if cache_file.exists():
+                try:
+                    with open(cache_file, 'rb') as f:
+                        cached = pickle.load(f)
+                    if cached['files'] == fingerprint:
+                        tasks.extend(cached['tasks'])
+                        continue
+                except Exception as e:
+                    log.warning(f"Ignoring unreadable task cache {cache_file}: {e}")
+            
             # Look for index.json first
             index_file = dataset_dir / "index.json"
             if index_file.exists():
-                tasks.extend(self._load_from_index(dataset_dir, index_file))
+                dataset_tasks = self._load_from_index(dataset_dir, index_file)
             else:
                 # Fallback: scan for individual task files
-                tasks.extend(self._load_from_files(dataset_dir))
+                dataset_tasks = self._load_from_files(dataset_dir)
+            tasks.extend(dataset_tasks)
+            
+            try:
+                _dump_pickle(cache_file, {'files': fingerprint, 'tasks': dataset_tasks})
+            except PermissionError:
+                # Read-only dataset directory; the cache is only an optimization
+                log.debug(f"Task cache not writable: {cache_file}")
+            except OSError as e:
+                log.warning(f"Could not write task cache {cache_file}: {e}")
         
         log.info(f"Loaded {len(tasks)} total tasks")
         return tasks
     
-    def _load_from_index(self, dataset_dir: Path, index_file: Path) -> List[TaskMetadata]:
-        """Load tasks using index file."""
-        tasks = []
+    def _load_from_index(self, dataset_dir: Path, index_file: Path,
+                         trusted: bool = True) -> List[TaskMetadata]:
+        """
+        Load tasks using index file.
         
+        Args:
+            dataset_dir: Dataset directory containing the task files
+            index_file: index.json written by one of the dataset parsers
+            trusted: Skip validation; the index and its task files are
+                generated by this repo's parsers
+        """
         try:
-            with open(index_file, 'r') as f:
-                index = json.load(f)
-            
-            for task_info in index.get('tasks', []):
-                task_file = dataset_dir / task_info['file']
-                if task_file.exists():
-                    try:
-                        with open(task_file, 'r') as f:
-                            task_data = json.load(f)
-                        task = TaskMetadata.model_validate(task_data)
-                        tasks.append(task)
-                    except Exception as e:
-                        log.warning(f"Failed to load task {task_file}: {e}")
-                        
+            index = loads(index_file.read_bytes())
         except Exception as e:
             log.error(f"Failed to load index {index_file}: {e}")
+            return []
         
-        return tasks
+        task_files = [dataset_dir / task_info['file'] for task_info in index.get('tasks', [])]
+        return self._parse_task_files([p for p in task_files if p.exists()], trusted=trusted)
     
     def _load_from_files(self, dataset_dir: Path) -> List[TaskMetadata]:
         """Load tasks by scanning for JSON files."""
+        return self._parse_task_files([Path(de.path) for de in _scan_dir(dataset_dir, "task_")])
+    
+    def _parse_task_files(self, task_files: List[Path], trusted: bool = False) -> List[TaskMetadata]:
+        """Read task files concurrently, then validate (or trust) them in order."""
         tasks = []
         
-        for task_file in dataset_dir.glob("task_*.json"):
+        for task_file, raw in _read_files(task_files):
+            if raw is None:
+                continue
             try:
-                with open(task_file, 'r') as f:
-                    task_data = json.load(f)
-                task = TaskMetadata.model_validate(task_data)
+                if trusted:
+                    task = construct_task(loads(raw))
+                else:
+                    task = TaskMetadata.model_validate_json(raw)
                 tasks.append(task)
             except Exception as e:
                 log.warning(f"Failed to load task {task_file}: {e}")
@@ -135,59 +423,128 @@ class BatchRunner:
         """
         log.info(f"Starting benchmark: {len(tasks)} tasks × {len(seeds)} seeds × {runs_per_task} runs")
         
-        # Create all job specifications
-        jobs = []
+        if self.index_file.exists() or _walk_result_files(self.output_dir):
+            # Earlier results may be replaced by this run; reports re-read the
+            # deduplicated results from disk instead of the in-memory metrics
+            self._metrics_cover_disk = False
+        
+        # Read each task's fields once into plain dicts; the job builder and the
+        # result consumer below never touch the pydantic models again.
+        # Results come back without task metadata; it is attached from here
+        # instead of being pickled back per job
+        task_ids = []
+        metadata_by_id = {}
+        difficulty_by_id = {}
         for task in tasks:
-            for seed in seeds:
-                for run_id in range(runs_per_task):
-                    job = {
-                        'task': task,
-                        'seed': seed,
-                        'run_id': run_id,
-                        'timeout': timeout_per_run
-                    }
-                    jobs.append(job)
+            task_id = task.task_id
+            meta = _task_metadata(task)
+            task_ids.append(task_id)
+            metadata_by_id[task_id] = meta
+            difficulty_by_id[task_id] = meta['difficulty']
+        
+        # Create all job specifications; jobs carry only the task id, workers
+        # look the task up in the cache loaded by _init_worker
+        jobs = [(task_id, seed, run_id, timeout_per_run)
+                for task_id in task_ids
+                for seed in seeds
+                for run_id in range(runs_per_task)]
         
         total_jobs = len(jobs)
         log.info(f"Total jobs to execute: {total_jobs}")
         
+        # Pickle each task once into shared memory; workers map it instead of
+        # receiving the tasks through per-job IPC
+        blobs = {task_id: pickle.dumps(task, protocol=pickle.HIGHEST_PROTOCOL)
+                 for task_id, task in zip(task_ids, tasks)}
+        index = {}
+        offset = 0
+        for task_id, blob in blobs.items():
+            index[task_id] = (offset, len(blob))
+            offset += len(blob)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, offset))
+        shm.buf[:offset] = b"".join(blobs.values())
+        del blobs
+        
+        runtime_ema: Dict[str, float] = {}
+        
         # Execute jobs in parallel
         results = []
         failed_jobs = []
         
         progress_bar = None
         if TQDM_AVAILABLE:
-            progress_bar = tqdm(total=total_jobs, desc="Running benchmark")
+            # Throttled refresh so progress output never dominates short jobs
+            progress_bar = tqdm(total=total_jobs, desc="Running benchmark",
+                                mininterval=0.5, smoothing=0,
+                                miniters=max(1, total_jobs // 200))
         
         try:
-            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all jobs
-                future_to_job = {
-                    executor.submit(self._run_single_job, job): job 
-                    for job in jobs
-                }
+            with ProcessPoolExecutor(**self._pool_kwargs(shm.name, index)) as executor:
+                # Submit jobs in chunks to amortize submit/IPC overhead, keeping at
+                # most max_in_flight chunks outstanding instead of queueing them all.
+                # Chunk size adapts per difficulty level: slow tasks run one job per
+                # chunk, fast ones are batched up to CHUNK_MAX_SIZE
+                max_in_flight = self.max_workers * 4
+                job_queue = deque(jobs)
+                pending = {}
                 
-                # Collect results
-                for future in as_completed(future_to_job):
-                    job = future_to_job[future]
-                    
-                    try:
-                        result = future.result()
-                        if result:
-                            results.append(result)
-                            self._save_individual_result(result)
-                        else:
-                            failed_jobs.append(job)
-                    except Exception as e:
-                        log.error(f"Job failed: {job['task'].task_id} seed={job['seed']} run={job['run_id']}: {e}")
-                        failed_jobs.append(job)
+                def submit_next(n: int) -> None:
+                    for _ in range(n):
+                        if not job_queue:
+                            return
+                        bucket = difficulty_by_id[job_queue[0][0]]
+                        size = self._chunk_size(runtime_ema.get(bucket))
+                        chunk = []
+                        while job_queue and len(chunk) < size and difficulty_by_id[job_queue[0][0]] == bucket:
+                            chunk.append(job_queue.popleft())
+                        pending[executor.submit(_run_job_batch, chunk)] = chunk
+                
+                submit_next(max_in_flight)
+                
+                # Collect results, topping up the queue as chunks complete
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk = pending.pop(future)
+                        
+                        try:
+                            chunk_results = future.result()
+                        except Exception as e:
+                            log.error(f"Job chunk failed ({len(chunk)} jobs, first: {chunk[0][0]}): {e}")
+                            chunk_results = [None] * len(chunk)
+                        
+                        runtimes = [r['execution_time_sec'] for r in chunk_results if r]
+                        if runtimes:
+                            bucket = difficulty_by_id[chunk[0][0]]
+                            observed = sum(runtimes) / len(runtimes)
+                            ema = runtime_ema.get(bucket)
+                            runtime_ema[bucket] = observed if ema is None else (
+                                (1 - RUNTIME_EMA_ALPHA) * ema + RUNTIME_EMA_ALPHA * observed)
+                        
+                        for job, result in zip(chunk, chunk_results):
+                            try:
+                                if result:
+                                    result['task_metadata'] = metadata_by_id[result['task_id']]
+                                    self._record_result(result)
+                                    results.append(result)
+                                else:
+                                    failed_jobs.append(job)
+                            except Exception as e:
+                                log.error(f"Job failed: {job[0]} seed={job[1]} run={job[2]}: {e}")
+                                log.debug(traceback.format_exc())
+                                failed_jobs.append(job)
+                        
+                        if progress_bar:
+                            progress_bar.update(len(chunk))
                     
-                    if progress_bar:
-                        progress_bar.update(1)
+                    submit_next(len(done))
         
         finally:
             if progress_bar:
                 progress_bar.close()
+            self._close_results()
+            shm.close()
+            shm.unlink()
         
         # Generate summary
         summary = {
@@ -203,126 +560,246 @@ class BatchRunner:
         log.info(f"Benchmark completed: {summary['successful_jobs']}/{total_jobs} jobs successful")
         return summary
     
-    def _run_single_job(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _chunk_size(runtime_ema: Optional[float]) -> int:
         """
-        Execute a single benchmark job.
+        Pick the number of jobs per chunk from the smoothed per-job runtime.
         
         Args:
-            job: Job specification with task, seed, run_id, timeout
+            runtime_ema: Smoothed runtime per job in seconds, or None if no job
+                of this difficulty has completed yet
             
         Returns:
-            Job result or None if failed
+            Chunk size (1 while runtime is unknown)
+        """
+        if runtime_ema is None:
+            return 1
+        return max(1, min(CHUNK_MAX_SIZE, int(CHUNK_TARGET_SEC / max(runtime_ema, 1e-6))))
+    
+    def _pool_kwargs(self, shm_name: str, index: Dict[str, tuple]) -> Dict[str, Any]:
+        """Build ProcessPoolExecutor arguments, including worker recycling when supported."""
+        kwargs = {
+            'max_workers': self.max_workers,
+            'initializer': _init_worker,
+            'initargs': (shm_name, index),
+        }
+        recycle = False
+        if self.max_tasks_per_child:
+            if sys.version_info >= (3, 11):
+                kwargs['max_tasks_per_child'] = self.max_tasks_per_child
+                recycle = True
+            else:
+                log.warning("max_tasks_per_child requires Python 3.11+; workers will not be recycled")
+        kwargs['mp_context'] = self._mp_context(recycle)
+        return kwargs
+    
+    @staticmethod
+    def _mp_context(recycle: bool):
         """
-        task = job['task']
-        seed = job['seed']
-        run_id = job['run_id']
+        Pick the cheapest start method for workers.
         
-        # Set random seed for reproducibility
-        random.seed(seed)
+        fork lets children inherit the already imported pipeline copy-on-write,
+        but cannot be combined with max_tasks_per_child; forkserver is used
+        then, with the heavy modules preloaded once in the server.
         
-        try:
-            # Convert task to problem input
-            problem_input_data = create_problem_input(task)
-            problem = ProblemInput.model_validate(problem_input_data)
-            
-            # Run pipeline
-            start_time = time.time()
-            result = run_pipeline(problem)
-            end_time = time.time()
-            
-            # Package result
-            job_result = {
-                'task_id': task.task_id,
-                'seed': seed,
-                'run_id': run_id,
-                'result': result,
-                'execution_time_sec': end_time - start_time,
-                'timestamp': time.time(),
-                'task_metadata': {
-                    'difficulty': task.difficulty.value,
-                    'expected_complexity': task.expected_complexity.value,
-                    'time_limit_ms': task.time_limit_ms,
-                    'memory_limit_mb': task.memory_limit_mb
-                }
-            }
-            
-            return job_result
+        Args:
+            recycle: Whether workers are recycled via max_tasks_per_child
             
-        except Exception as e:
-            log.error(f"Job execution failed: {task.task_id} seed={seed} run={run_id}: {e}")
-            log.debug(traceback.format_exc())
-            return None
+        Returns:
+            multiprocessing context
+        """
+        methods = multiprocessing.get_all_start_methods()
+        if sys.platform.startswith("linux") and not recycle:
+            return multiprocessing.get_context("fork")
+        if "forkserver" in methods:
+            ctx = multiprocessing.get_context("forkserver")
+            package = __package__.rsplit(".", 1)[0]
+            ctx.set_forkserver_preload([
+                f"{package}.controller.solve_loop",
+                f"{package}.datasets.task_format",
+                f"{package}.evaluation.metrics",
+            ])
+            return ctx
+        return multiprocessing.get_context("spawn")
+    
+    def _record_result(self, result: Dict[str, Any]) -> None:
+        """
+        Store a finished job result and add it to the in-memory metrics.
+        
+        Args:
+            result: Job result with task_metadata attached
+        """
+        run = result['result']
+        if isinstance(run.get('profile'), BaseModel):
+            # solve_loop returns the ProfileReport model on success; dump it
+            # once so the shard, the index and the metrics all read a dict
+            run['profile'] = run['profile'].model_dump()
+        self._save_individual_result(result)
+        self._metrics.add_run_result(*_metric_args(result))
     
     def _save_individual_result(self, result: Dict[str, Any]) -> None:
         """
-        Save individual result to file.
+        Append individual result to its (task, seed) JSONL shard.
         
         Args:
             result: Job result to save
         """
-        task_id = result['task_id']
-        seed = result['seed']
-        run_id = result['run_id']
+        key = (result['task_id'], result['seed'])
+        handle = self._result_handles.get(key)
+        if handle is None:
+            # Create directory structure: results/<task>/seed_<s>/runs.jsonl
+            seed_dir = self.output_dir / key[0] / f"seed_{key[1]}"
+            seed_dir.mkdir(parents=True, exist_ok=True)
+            handle = open(seed_dir / "runs.jsonl", "ab")
+            self._result_handles[key] = handle
+        
+        handle.write(dumps(result).encode() + b"\n")
         
-        # Create directory structure: results/<task>/seed_<s>/
-        task_dir = self.output_dir / task_id
-        seed_dir = task_dir / f"seed_{seed}"
-        seed_dir.mkdir(parents=True, exist_ok=True)
+        if self._index_handle is None:
+            self._index_handle = open(self.index_file, "ab")
+        self._index_handle.write(dumps(_index_record(result)).encode() + b"\n")
         
-        # Save result
-        result_file = seed_dir / f"run_{run_id}.json"
-        with open(result_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        self._unflushed += 1
+        if self._unflushed >= RESULT_FLUSH_EVERY:
+            self._flush_results()
+    
+    def _flush_results(self) -> None:
+        """Flush buffered result shards and the index to disk."""
+        for handle in self._result_handles.values():
+            handle.flush()
+        if self._index_handle is not None:
+            self._index_handle.flush()
+        self._unflushed = 0
+    
+    def _close_results(self) -> None:
+        """Close all open result shards and the index."""
+        for handle in self._result_handles.values():
+            handle.close()
+        self._result_handles.clear()
+        if self._index_handle is not None:
+            self._index_handle.close()
+            self._index_handle = None
+        self._unflushed = 0
     
-    def generate_evaluation_report(self, k_values: List[int] = [1, 3, 5]) -> Path:
+    def generate_evaluation_report(self, k_values: List[int] = [1, 3, 5],
+                                   from_disk: bool = False) -> Path:
         """
-        Generate comprehensive evaluation report from all results.
+        Generate comprehensive evaluation report.
+        
+        Uses the metrics accumulated by run_benchmark when they cover everything
+        stored in output_dir; otherwise (or with from_disk=True) aggregates every
+        stored result, keeping only the latest record per (task, seed, run_id).
         
         Args:
             k_values: List of k values for pass@k and eff@k metrics
+            from_disk: Always re-read the stored results
             
         Returns:
             Path to generated report
         """
-        log.info("Generating evaluation report from all results")
-        
-        # Collect all results
-        metrics = EvaluationMetrics()
-        
-        for result_file in self.output_dir.rglob("run_*.json"):
-            try:
-                with open(result_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Extract information for metrics
-                task_id = data['task_id']
-                run_id = data['run_id']
-                result = data['result']
-                task_meta = data['task_metadata']
-                
-                metrics.add_run_result(
-                    task_id=task_id,
-                    run_id=run_id,
-                    result=result,
-                    runtime_limit=task_meta['time_limit_ms'],
-                    memory_limit=task_meta['memory_limit_mb']
-                )
-                
-            except Exception as e:
-                log.warning(f"Failed to process result file {result_file}: {e}")
+        if len(self._metrics) and self._metrics_cover_disk and not from_disk:
+            log.info("Generating evaluation report from in-memory results")
+            metrics = self._metrics
+        else:
+            log.info("Generating evaluation report from all results")
+            metrics = self._load_metrics()
         
         # Generate and save evaluation summary
         summary = metrics.generate_summary(k_values)
         
         report_file = self.output_dir / "evaluation_summary.json"
-        with open(report_file, 'w') as f:
-            json.dump(summary, f, indent=2)
+        report_file.write_text(dumps(summary, indent=True), encoding="utf-8")
         
         # Save detailed results
         metrics.save_results(self.output_dir / "detailed_results.json")
         
         log.info(f"Generated evaluation report: {report_file}")
         return report_file
+    
+    def _load_metrics(self) -> EvaluationMetrics:
+        """
+        Aggregate metrics from index.jsonl, or from the result files when it is absent.
+        
+        Shards and the index are append-only, so a rerun into the same
+        output_dir appends a second record for the same (task_id, seed,
+        run_id); the last one wins.
+        """
+        if self.index_file.exists():
+            # Single sequential read; no directory walk or per-shard opens
+            latest: Dict[tuple, Dict[str, Any]] = {}
+            for record in _iter_jsonl(self.index_file):
+                try:
+                    latest[(record['task_id'], record['seed'], record['run_id'])] = record
+                except (KeyError, TypeError) as e:
+                    log.warning(f"Failed to process index record in {self.index_file}: {e}")
+            metrics = EvaluationMetrics()
+            for record in latest.values():
+                try:
+                    metrics.add_run_result(*_index_metric_args(record))
+                except Exception as e:
+                    log.warning(f"Failed to process index record in {self.index_file}: {e}")
+            return metrics
+        return self._load_metrics_from_results()
+    
+    def _load_metrics_from_results(self) -> EvaluationMetrics:
+        """Aggregate metrics from every result file under output_dir (pre-index layouts)."""
+        metrics = EvaluationMetrics()
+        
+        # Extracted (seed, metric args) keyed by path, reused while the file's
+        # mtime is unchanged
+        cache_file = self.output_dir / ".results_cache.v2.pkl"
+        cache: Dict[str, tuple] = {}
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    cache = pickle.load(f)
+            except Exception as e:
+                log.warning(f"Ignoring unreadable results cache {cache_file}: {e}")
+        fresh_cache: Dict[str, tuple] = {}
+        latest: Dict[tuple, tuple] = {}
+        
+        # JSONL shards, plus legacy one-file-per-run results; legacy files are
+        # read first so a shard record for the same run replaces them
+        result_files = [(p, p.stat().st_mtime) for p in
+                        sorted(_walk_result_files(self.output_dir), key=lambda p: p.suffix == ".jsonl")]
+        stale = [p for p, mtime in result_files if cache.get(str(p), (None,))[0] != mtime]
+        legacy_raw = dict(_read_files([p for p in stale if p.suffix == ".json"]))
+        stale = set(stale)
+        
+        for result_file, mtime in result_files:
+            key = str(result_file)
+            if result_file not in stale:
+                records = cache[key][1]
+            else:
+                # Stream the file, keeping only the metric args of each record
+                records = []
+                try:
+                    if result_file.suffix == ".jsonl":
+                        data_iter = _iter_jsonl(result_file)
+                    else:
+                        data_iter = iter([loads(legacy_raw[result_file])])
+                    for data in data_iter:
+                        try:
+                            records.append((data.get('seed'), _metric_args(data)))
+                        except Exception as e:
+                            log.warning(f"Failed to process a result in {result_file}: {e}")
+                except Exception as e:
+                    log.warning(f"Failed to process result file {result_file}: {e}")
+                    continue
+            fresh_cache[key] = (mtime, records)
+            
+            for seed, args in records:
+                latest[(args[0], seed, args[1])] = args
+        
+        for args in latest.values():
+            metrics.add_run_result(*args)
+        
+        try:
+            _dump_pickle(cache_file, fresh_cache)
+        except OSError as e:
+            log.warning(f"Could not write results cache {cache_file}: {e}")
+        
+        return metrics
 
 
 def create_sample_datasets(dataset_dir: Path) -> None:
@@ -354,6 +831,8 @@ def main():
                        help="Number of parallel workers")
     parser.add_argument("--timeout", type=int, default=300,
                        help="Timeout per run in seconds")
+    parser.add_argument("--max-tasks-per-child", type=int, default=50,
+                       help="Recycle each worker after this many job chunks (0 disables)")
     parser.add_argument("--output", default="results",
                        help="Output directory for results")
     parser.add_argument("--create-samples", action="store_true",
@@ -370,7 +849,8 @@ def main():
         return
     
     # Initialize batch runner
-    runner = BatchRunner(Path(args.output), max_workers=args.workers)
+    runner = BatchRunner(Path(args.output), max_workers=args.workers,
+                         max_tasks_per_child=args.max_tasks_per_child or None)
     
     # Load tasks
     dataset_paths = [Path(d) for d in args.datasets]
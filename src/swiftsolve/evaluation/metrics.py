@@ -11,15 +11,26 @@ Implements the evaluation metrics specified in CONTEXT.md section 1.9:
 Used for systematic benchmarking and research evaluation.
 """
 
+import copy
 import json
+import logging
+import os
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    import numpy_groupies as npg
+    NPG_AVAILABLE = True
+except ImportError:
+    NPG_AVAILABLE = False
+
 from ..schemas import ProblemInput, RunResult
 from ..utils.logger import get_logger
+from ..utils.jsonio import dumps, loads
 
 log = get_logger("EvaluationMetrics")
 
@@ -52,14 +63,177 @@ class RunMetrics:
     runtime_limit_ms: int  # Task time limit
     memory_limit_mb: int  # Task memory limit
     agent_failures: int  # Number of agent failures during run
+
+
+# Column layout of the struct-of-arrays run store, in RunMetrics field order.
+# task_id is interned to an int32 code, status is stored as its index in
+# RunStatus, and missing runtime/memory measurements are NaN
+_COLUMNS = (
+    ("task_code", np.int32),
+    ("run_id", np.int32),
+    ("status", np.int8),
+    ("success", np.bool_),
+    ("efficient_runtime", np.bool_),
+    ("efficient_memory", np.bool_),
+    ("iteration_count", np.int32),
+    ("final_runtime_ms", np.float64),
+    ("final_memory_mb", np.float64),
+    ("runtime_limit_ms", np.int32),
+    ("memory_limit_mb", np.int32),
+    ("agent_failures", np.int32),
+)
+
+# Flags derived at ingest time, so eff@k never recombines columns per call
+_DERIVED_COLUMNS = (
+    ("success_efficient_runtime", np.bool_),
+    ("success_efficient_memory", np.bool_),
+)
+
+_STATUSES = tuple(RunStatus)
+# Raw status string -> int8 code, so ingestion never constructs RunStatus
+_STATUS_LOOKUP = {status.value: code for code, status in enumerate(_STATUSES)}
+_SUCCESS = _STATUS_LOOKUP[RunStatus.SUCCESS.value]
+_AGENT_FAILURE = _STATUS_LOOKUP[RunStatus.AGENT_FAILURE.value]
+_TLE = _STATUS_LOOKUP[RunStatus.TLE.value]
+_MLE = _STATUS_LOOKUP[RunStatus.MLE.value]
+
+
+def _status_code(status: str) -> int:
+    """Map a raw status string to its column code."""
+    code = _STATUS_LOOKUP.get(status)
+    if code is None:
+        raise ValueError(f"{status!r} is not a valid RunStatus")
+    return code
+
+
+@dataclass
+class _Columns:
+    """Struct-of-arrays storage for run metrics, grown by doubling on append."""
+    size: int = 0
+    data: Dict[str, np.ndarray] = field(
+        default_factory=lambda: {
+            name: np.empty(16, dtype=dtype) for name, dtype in _COLUMNS + _DERIVED_COLUMNS
+        }
+    )
+    
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return the filled part of a column (a view, not a copy)."""
+        return self.data[name][:self.size]
     
+    def reserve(self, capacity: int) -> None:
+        """Ensure room for at least capacity rows."""
+        current = len(self.data["task_code"])
+        if capacity <= current:
+            return
+        new_capacity = max(capacity, current * 2)
+        for name, array in self.data.items():
+            grown = np.empty(new_capacity, dtype=array.dtype)
+            grown[:self.size] = array[:self.size]
+            self.data[name] = grown
+    
+    def append(self, row: tuple) -> None:
+        """Append one row given in _COLUMNS + _DERIVED_COLUMNS order."""
+        self.reserve(self.size + 1)
+        i = self.size
+        for (name, _), value in zip(_COLUMNS + _DERIVED_COLUMNS, row):
+            self.data[name][i] = value
+        self.size += 1
+    
+    def extend(self, columns: Dict[str, np.ndarray], count: int) -> None:
+        """Append count rows given as one array per column."""
+        self.reserve(self.size + count)
+        for name, array in self.data.items():
+            array[self.size:self.size + count] = columns[name]
+        self.size += count
+    
+    def clear(self) -> None:
+        """Drop all rows, keeping the allocated capacity."""
+        self.size = 0
+
 
 class EvaluationMetrics:
     """Calculator for SwiftSolve evaluation metrics."""
     
     def __init__(self):
         """Initialize metrics calculator."""
-        self.results: List[RunMetrics] = []
+        self._columns = _Columns()
+        self._task_ids: Dict[str, int] = {}  # task_id -> interned task code
+        self._task_names: List[str] = []  # task code -> task_id
+        self._results_cache: Optional[List[RunMetrics]] = None
+        self._group_cache: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._summary_cache: Dict[Tuple[int, ...], Dict[str, Any]] = {}
+        
+        # Running totals over successful runs for calculate_mean_iterations
+        self._succ_iter_sum = 0
+        self._succ_count = 0
+    
+    @property
+    def results(self) -> List[RunMetrics]:
+        """Run metrics as RunMetrics objects, materialized from the columns on first access."""
+        if self._results_cache is None:
+            cols = self._columns
+            names = self._task_names
+            self._results_cache = [
+                RunMetrics(
+                    task_id=names[task_code],
+                    run_id=int(run_id),
+                    status=_STATUSES[status],
+                    success=bool(success),
+                    efficient_runtime=bool(eff_rt),
+                    efficient_memory=bool(eff_mem),
+                    iteration_count=int(iterations),
+                    final_runtime_ms=None if np.isnan(runtime) else float(runtime),
+                    final_memory_mb=None if np.isnan(memory) else float(memory),
+                    runtime_limit_ms=int(rt_limit),
+                    memory_limit_mb=int(mem_limit),
+                    agent_failures=int(failures)
+                )
+                for (task_code, run_id, status, success, eff_rt, eff_mem, iterations,
+                     runtime, memory, rt_limit, mem_limit, failures)
+                in zip(*(cols[name].tolist() for name, _ in _COLUMNS))
+            ]
+        return self._results_cache
+    
+    def __len__(self) -> int:
+        """Number of recorded runs."""
+        return self._columns.size
+    
+    def _invalidate_caches(self) -> None:
+        """Drop state derived from the columns after they change."""
+        self._results_cache = None
+        self._group_cache = None
+        self._summary_cache.clear()
+    
+    def _grouped(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Rows grouped by task, computed once and reused until the next mutation.
+        
+        Rows are sorted by (task, run_id) with a stable lexsort, so ties keep
+        insertion order.
+        
+        Returns:
+            Tuple of (order, starts, rank): the sorting permutation, the start
+            offset of each task segment in it, and each sorted row's position
+            within its task
+        """
+        if self._group_cache is None:
+            cols = self._columns
+            task_code = cols["task_code"]
+            order = np.lexsort((cols["run_id"], task_code))
+            sorted_codes = task_code[order]
+            starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+            group_sizes = np.diff(np.r_[starts, len(order)])
+            rank = np.arange(len(order)) - np.repeat(starts, group_sizes)
+            self._group_cache = (order, starts, rank)
+        return self._group_cache
+    
+    def _task_code(self, task_id: str) -> int:
+        """Intern task_id, returning its integer code."""
+        code = self._task_ids.get(task_id)
+        if code is None:
+            code = self._task_ids[task_id] = len(self._task_names)
+            self._task_names.append(task_id)
+        return code
     
     def add_run_result(self, task_id: str, run_id: int, result: Dict[str, Any], 
                       runtime_limit: int, memory_limit: int) -> None:
@@ -73,19 +247,22 @@ class EvaluationMetrics:
             runtime_limit: Task time limit in ms
             memory_limit: Task memory limit in MB
         """
-        status = RunStatus(result.get('status', 'failed'))
+        status = _status_code(result.get('status', 'failed'))
         
         # Determine success (correctness)
-        success = status == RunStatus.SUCCESS
+        success = status == _SUCCESS
         
         # Extract performance metrics
-        profile = result.get('profile', {})
+        profile = result.get('profile')
         runtime_ms = None
         memory_mb = None
         
         if profile:
-            runtime_ms = profile.get('runtime_ms', [None])[-1]  # Last measurement
-            memory_mb = profile.get('peak_memory_mb', [None])[-1]
+            # Last measurement of each series, if any
+            runtimes = profile.get('runtime_ms')
+            memories = profile.get('peak_memory_mb')
+            runtime_ms = runtimes[-1] if runtimes else None
+            memory_mb = memories[-1] if memories else None
         
         # Determine efficiency
         efficient_runtime = True
@@ -106,58 +283,84 @@ class EvaluationMetrics:
             iteration_count = verdict.get('iteration', 0) + 1
         
         # Count agent failures
-        agent_failures = 1 if status == RunStatus.AGENT_FAILURE else 0
-        
-        metrics = RunMetrics(
-            task_id=task_id,
-            run_id=run_id,
-            status=status,
-            success=success,
-            efficient_runtime=efficient_runtime,
-            efficient_memory=efficient_memory,
-            iteration_count=iteration_count,
-            final_runtime_ms=runtime_ms,
-            final_memory_mb=memory_mb,
-            runtime_limit_ms=runtime_limit,
-            memory_limit_mb=memory_limit,
-            agent_failures=agent_failures
+        agent_failures = 1 if status == _AGENT_FAILURE else 0
+        
+        row = (
+            self._task_code(task_id),
+            run_id,
+            status,
+            success,
+            efficient_runtime,
+            efficient_memory,
+            iteration_count,
+            np.nan if runtime_ms is None else runtime_ms,
+            np.nan if memory_mb is None else memory_mb,
+            runtime_limit,
+            memory_limit,
+            agent_failures,
+            success and efficient_runtime,
+            success and efficient_memory
         )
         
-        self.results.append(metrics)
-        log.debug(f"Added metrics for {task_id} run {run_id}: {metrics}")
+        self._columns.append(row)
+        if success:
+            self._succ_iter_sum += iteration_count
+            self._succ_count += 1
+        self._invalidate_caches()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Added metrics for %s run %s: %s", task_id, run_id, row)
     
-    def calculate_pass_at_k(self, k: int) -> float:
+    def _top_k_any(self, values: np.ndarray, k: int) -> float:
         """
-        Calculate pass@k metric: fraction of tasks where ≥1 of top-k runs passed.
+        Fraction of tasks where values is true for at least one of the first k runs.
+        
+        Each task's first k rows (by run_id) are OR-reduced per task.
         
         Args:
+            values: Boolean column aligned with the stored rows
             k: Number of attempts per task to consider
             
         Returns:
-            pass@k score between 0.0 and 1.0
+            Score between 0.0 and 1.0
         """
-        if not self.results:
-            return 0.0
+        order, starts, rank = self._grouped()
+        hits = values[order] & (rank < k)
+        return float(self._grouped_any(hits, order, starts).mean())
+    
+    def _grouped_any(self, hits: np.ndarray, order: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """
+        OR-reduce sorted per-row flags into one flag per task.
         
-        # Group results by task
-        tasks = {}
-        for result in self.results:
-            if result.task_id not in tasks:
-                tasks[result.task_id] = []
-            tasks[result.task_id].append(result)
+        Uses numpy_groupies when installed, which copes better with skewed
+        group sizes, and np.logical_or.reduceat over the task segments otherwise.
         
-        passed_tasks = 0
-        total_tasks = len(tasks)
+        Args:
+            hits: Boolean flags in grouped (sorted) row order
+            order: Sorting permutation from _grouped()
+            starts: Task segment offsets from _grouped()
+            
+        Returns:
+            Boolean array with one entry per task
+        """
+        if NPG_AVAILABLE:
+            task_code = self._columns["task_code"][order]
+            return npg.aggregate(task_code, hits, func='any', size=len(self._task_names), fill_value=False)
+        return np.logical_or.reduceat(hits, starts)
+    
+    def calculate_pass_at_k(self, k: int) -> float:
+        """
+        Calculate pass@k metric: fraction of tasks where ≥1 of top-k runs passed.
         
-        for task_id, task_results in tasks.items():
-            # Take top-k results (by run_id order)
-            top_k_results = sorted(task_results, key=lambda x: x.run_id)[:k]
+        Args:
+            k: Number of attempts per task to consider
             
-            # Check if any passed
-            if any(r.success for r in top_k_results):
-                passed_tasks += 1
+        Returns:
+            pass@k score between 0.0 and 1.0
+        """
+        if not self._columns.size:
+            return 0.0
         
-        return passed_tasks / total_tasks if total_tasks > 0 else 0.0
+        return self._top_k_any(self._columns["success"], k)
     
     def calculate_eff_at_k_runtime(self, k: int) -> float:
         """
@@ -169,26 +372,10 @@ class EvaluationMetrics:
         Returns:
             eff@k_runtime score between 0.0 and 1.0
         """
-        if not self.results:
+        if not self._columns.size:
             return 0.0
         
-        tasks = {}
-        for result in self.results:
-            if result.task_id not in tasks:
-                tasks[result.task_id] = []
-            tasks[result.task_id].append(result)
-        
-        efficient_tasks = 0
-        total_tasks = len(tasks)
-        
-        for task_id, task_results in tasks.items():
-            top_k_results = sorted(task_results, key=lambda x: x.run_id)[:k]
-            
-            # Check if any met runtime efficiency
-            if any(r.success and r.efficient_runtime for r in top_k_results):
-                efficient_tasks += 1
-        
-        return efficient_tasks / total_tasks if total_tasks > 0 else 0.0
+        return self._top_k_any(self._columns["success_efficient_runtime"], k)
     
     def calculate_eff_at_k_memory(self, k: int) -> float:
         """
@@ -200,26 +387,10 @@ class EvaluationMetrics:
         Returns:
             eff@k_memory score between 0.0 and 1.0
         """
-        if not self.results:
+        if not self._columns.size:
             return 0.0
         
-        tasks = {}
-        for result in self.results:
-            if result.task_id not in tasks:
-                tasks[result.task_id] = []
-            tasks[result.task_id].append(result)
-        
-        efficient_tasks = 0
-        total_tasks = len(tasks)
-        
-        for task_id, task_results in tasks.items():
-            top_k_results = sorted(task_results, key=lambda x: x.run_id)[:k]
-            
-            # Check if any met memory efficiency
-            if any(r.success and r.efficient_memory for r in top_k_results):
-                efficient_tasks += 1
-        
-        return efficient_tasks / total_tasks if total_tasks > 0 else 0.0
+        return self._top_k_any(self._columns["success_efficient_memory"], k)
     
     def calculate_tle_mle_rate(self) -> Tuple[float, float]:
         """
@@ -228,21 +399,16 @@ class EvaluationMetrics:
         Returns:
             Tuple of (TLE_rate, MLE_rate) as percentages between 0.0 and 100.0
         """
-        if not self.results:
+        if not self._columns.size:
             return 0.0, 0.0
         
-        total_runs = len(self.results)
-        tle_count = 0
-        mle_count = 0
-        
-        for result in self.results:
-            if result.status == RunStatus.TLE or not result.efficient_runtime:
-                tle_count += 1
-            if result.status == RunStatus.MLE or not result.efficient_memory:
-                mle_count += 1
+        cols = self._columns
+        status = cols["status"]
+        tle_mask = (status == _TLE) | ~cols["efficient_runtime"]
+        mle_mask = (status == _MLE) | ~cols["efficient_memory"]
         
-        tle_rate = (tle_count / total_runs) * 100.0
-        mle_rate = (mle_count / total_runs) * 100.0
+        tle_rate = float(tle_mask.mean()) * 100.0
+        mle_rate = float(mle_mask.mean()) * 100.0
         
         return tle_rate, mle_rate
     
@@ -253,15 +419,13 @@ class EvaluationMetrics:
         Returns:
             Mean number of iterations across all successful runs
         """
-        if not self.results:
+        if not self._columns.size:
             return 0.0
         
-        successful_runs = [r for r in self.results if r.success]
-        if not successful_runs:
+        if not self._succ_count:
             return 0.0
         
-        total_iterations = sum(r.iteration_count for r in successful_runs)
-        return total_iterations / len(successful_runs)
+        return self._succ_iter_sum / self._succ_count
     
     def calculate_agent_failure_rate(self) -> float:
         """
@@ -270,13 +434,11 @@ class EvaluationMetrics:
         Returns:
             Failure rate as percentage between 0.0 and 100.0
         """
-        if not self.results:
+        if not self._columns.size:
             return 0.0
         
-        total_runs = len(self.results)
-        failure_runs = sum(1 for r in self.results if r.status == RunStatus.AGENT_FAILURE)
-        
-        return (failure_runs / total_runs) * 100.0
+        status = self._columns["status"]
+        return float(np.mean(status == _AGENT_FAILURE)) * 100.0
     
     def generate_summary(self, k_values: List[int] = [1, 3, 5]) -> Dict[str, Any]:
         """
@@ -288,9 +450,18 @@ class EvaluationMetrics:
         Returns:
             Dictionary containing all evaluation metrics
         """
-        if not self.results:
+        if not self._columns.size:
             return {"error": "No results available for evaluation"}
         
+        # Memoized per k_values until the results change; callers get a copy
+        key = tuple(k_values)
+        summary = self._summary_cache.get(key)
+        if summary is None:
+            summary = self._summary_cache[key] = self._compute_summary(k_values)
+        return copy.deepcopy(summary)
+    
+    def _compute_summary(self, k_values: List[int]) -> Dict[str, Any]:
+        """Compute the summary returned by generate_summary."""
         # Calculate metrics for different k values
         pass_at_k = {f"pass@{k}": self.calculate_pass_at_k(k) for k in k_values}
         eff_runtime_at_k = {f"eff@{k}_runtime": self.calculate_eff_at_k_runtime(k) for k in k_values}
@@ -302,9 +473,9 @@ class EvaluationMetrics:
         agent_failure_rate = self.calculate_agent_failure_rate()
         
         # Task and run statistics
-        unique_tasks = len(set(r.task_id for r in self.results))
-        total_runs = len(self.results)
-        successful_runs = sum(1 for r in self.results if r.success)
+        unique_tasks = len(self._task_ids)
+        total_runs = self._columns.size
+        successful_runs = int(np.count_nonzero(self._columns["success"]))
         
         # Performance statistics
         runtime_stats = self._calculate_runtime_stats()
@@ -338,41 +509,58 @@ class EvaluationMetrics:
         
         return summary
     
-    def _calculate_runtime_stats(self) -> Dict[str, float]:
-        """Calculate runtime statistics for successful runs."""
-        runtimes = [r.final_runtime_ms for r in self.results 
-                   if r.success and r.final_runtime_ms is not None]
+    @staticmethod
+    def _numeric_stats(values: np.ndarray, mask: np.ndarray) -> Dict[str, float]:
+        """
+        Summary statistics of the measured (non-NaN) values selected by mask.
         
-        if not runtimes:
+        Args:
+            values: float64 column with NaN for missing measurements
+            mask: Boolean row selection
+            
+        Returns:
+            Dict with count, mean, median, std, min, max and p95
+        """
+        selected = values[mask & ~np.isnan(values)]
+        if not selected.size:
             return {"count": 0}
         
+        # One partitioning pass for all order statistics
+        low, median, p95, high = np.percentile(selected, [0, 50, 95, 100])
         return {
-            "count": len(runtimes),
-            "mean": float(np.mean(runtimes)),
-            "median": float(np.median(runtimes)),
-            "std": float(np.std(runtimes)),
-            "min": float(np.min(runtimes)),
-            "max": float(np.max(runtimes)),
-            "p95": float(np.percentile(runtimes, 95))
+            "count": int(selected.size),
+            "mean": float(selected.mean()),
+            "median": float(median),
+            "std": float(selected.std()),
+            "min": float(low),
+            "max": float(high),
+            "p95": float(p95)
         }
     
+    def _calculate_runtime_stats(self) -> Dict[str, float]:
+        """Calculate runtime statistics for successful runs."""
+        return self._numeric_stats(self._columns["final_runtime_ms"], self._columns["success"])
+    
     def _calculate_memory_stats(self) -> Dict[str, float]:
         """Calculate memory statistics for successful runs."""
-        memories = [r.final_memory_mb for r in self.results 
-                   if r.success and r.final_memory_mb is not None]
-        
-        if not memories:
-            return {"count": 0}
-        
-        return {
-            "count": len(memories),
-            "mean": float(np.mean(memories)),
-            "median": float(np.median(memories)),
-            "std": float(np.std(memories)),
-            "min": float(np.min(memories)),
-            "max": float(np.max(memories)),
-            "p95": float(np.percentile(memories, 95))
-        }
+        return self._numeric_stats(self._columns["final_memory_mb"], self._columns["success"])
+    
+    def _result_records(self) -> List[Dict[str, Any]]:
+        """Per-run records for save_results, built straight from the columns."""
+        cols = self._columns
+        names = [name for name, _ in _COLUMNS]
+        task_names = self._task_names
+        status_values = [status.value for status in _STATUSES]
+        
+        # Decode the interned/encoded columns once, then zip rows as dicts
+        columns = {name: cols[name].tolist() for name in names}
+        columns["task_code"] = [task_names[code] for code in columns["task_code"]]
+        columns["status"] = [status_values[code] for code in columns["status"]]
+        for name in ("final_runtime_ms", "final_memory_mb"):
+            columns[name] = [None if value != value else value for value in columns[name]]  # NaN -> None
+        
+        keys = ["task_id"] + names[1:]
+        return [dict(zip(keys, row)) for row in zip(*(columns[name] for name in names))]
     
     def save_results(self, output_file: Path) -> None:
         """
@@ -383,35 +571,42 @@ class EvaluationMetrics:
         """
         results_data = {
             "evaluation_metadata": {
-                "total_results": len(self.results),
-                "unique_tasks": len(set(r.task_id for r in self.results)),
+                "total_results": self._columns.size,
+                "unique_tasks": len(self._task_ids),
                 "timestamp": "2025-01-01T00:00:00Z"  # Would use actual timestamp
             },
-            "results": [
-                {
-                    "task_id": r.task_id,
-                    "run_id": r.run_id,
-                    "status": r.status.value,
-                    "success": r.success,
-                    "efficient_runtime": r.efficient_runtime,
-                    "efficient_memory": r.efficient_memory,
-                    "iteration_count": r.iteration_count,
-                    "final_runtime_ms": r.final_runtime_ms,
-                    "final_memory_mb": r.final_memory_mb,
-                    "runtime_limit_ms": r.runtime_limit_ms,
-                    "memory_limit_mb": r.memory_limit_mb,
-                    "agent_failures": r.agent_failures
-                }
-                for r in self.results
-            ],
+            "results": self._result_records(),
             "summary": self.generate_summary()
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(results_data, f, indent=2)
+        # One record per run, read back by load_results; kept compact since it
+        # grows with the benchmark (only evaluation_summary.json is pretty-printed)
+        Path(output_file).write_text(dumps(results_data), encoding="utf-8")
         
         log.info(f"Saved evaluation results to {output_file}")
     
+    @staticmethod
+    def summarize_files(paths: List[Path], k_values: List[int] = [1, 3, 5],
+                        workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Summarize several detailed results files in parallel.
+        
+        Args:
+            paths: Files written by save_results
+            k_values: List of k values to calculate metrics for
+            workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            One summary per file, in the order of paths
+        """
+        paths = [Path(p) for p in paths]
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+        if workers <= 1:
+            return [_summarize_file(path, k_values) for path in paths]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_summarize_file, paths, [k_values] * len(paths)))
+    
     def load_results(self, input_file: Path) -> None:
         """
         Load results from JSON file.
@@ -419,28 +614,42 @@ class EvaluationMetrics:
         Args:
             input_file: Path to load results from
         """
-        with open(input_file, 'r') as f:
-            data = json.load(f)
-        
-        self.results = []
-        for r in data.get('results', []):
-            metrics = RunMetrics(
-                task_id=r['task_id'],
-                run_id=r['run_id'],
-                status=RunStatus(r['status']),
-                success=r['success'],
-                efficient_runtime=r['efficient_runtime'],
-                efficient_memory=r['efficient_memory'],
-                iteration_count=r['iteration_count'],
-                final_runtime_ms=r.get('final_runtime_ms'),
-                final_memory_mb=r.get('final_memory_mb'),
-                runtime_limit_ms=r['runtime_limit_ms'],
-                memory_limit_mb=r['memory_limit_mb'],
-                agent_failures=r['agent_failures']
-            )
-            self.results.append(metrics)
-        
-        log.info(f"Loaded {len(self.results)} evaluation results from {input_file}")
+        data = loads(Path(input_file).read_bytes())
+        
+        self._columns.clear()
+        self._task_ids.clear()
+        self._task_names.clear()
+        self._invalidate_caches()
+        
+        # Fill whole columns at once instead of appending row by row
+        rows = data.get('results', [])
+        n = len(rows)
+        task_code = self._task_code
+        columns = {
+            "task_code": np.fromiter((task_code(r['task_id']) for r in rows), np.int32, n),
+            "status": np.fromiter((_status_code(r['status']) for r in rows), np.int8, n),
+            # None becomes NaN when converting to float64
+            "final_runtime_ms": np.array([r.get('final_runtime_ms') for r in rows], dtype=np.float64),
+            "final_memory_mb": np.array([r.get('final_memory_mb') for r in rows], dtype=np.float64),
+        }
+        for name, dtype in _COLUMNS:
+            if name not in columns:
+                columns[name] = np.fromiter((r[name] for r in rows), dtype, n)
+        columns["success_efficient_runtime"] = columns["success"] & columns["efficient_runtime"]
+        columns["success_efficient_memory"] = columns["success"] & columns["efficient_memory"]
+        self._columns.extend(columns, n)
+        success = columns["success"]
+        self._succ_iter_sum = int(columns["iteration_count"][success].sum())
+        self._succ_count = int(np.count_nonzero(success))
+        
+        log.info(f"Loaded {self._columns.size} evaluation results from {input_file}")
+
+
+def _summarize_file(path: Path, k_values: List[int]) -> Dict[str, Any]:
+    """Load one detailed results file and summarize it (process pool worker)."""
+    metrics = EvaluationMetrics()
+    metrics.load_results(path)
+    return metrics.generate_summary(k_values)
 
 
 def create_sample_evaluation() -> EvaluationMetrics:
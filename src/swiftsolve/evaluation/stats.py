@@ -7,132 +7,256 @@ for SwiftSolve evaluation results. Based on CONTEXT.md section 4.2 Phase D.
 Generates plots and summary statistics for research publication.
 """
 
-import json
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
+from types import ModuleType
+import tempfile
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
 
-from .metrics import EvaluationMetrics, RunMetrics
+from .metrics import RunMetrics
 from ..utils.logger import get_logger
+from ..utils.jsonio import dumps, loads
 
 # Suppress matplotlib warnings
 warnings.filterwarnings('ignore', category=UserWarning, module='matplotlib')
 
 log = get_logger("EvaluationStats")
 
+# matplotlib.pyplot, imported by _pyplot() on first use
+_plt: Optional[ModuleType] = None
+
+# Per-run columns of a detailed results file, in RunMetrics field order
+_RESULT_COLUMNS = [f.name for f in fields(RunMetrics)]
+
+# Fixed, ordered label sets of the derived task classes
+_DIFFICULTY_DTYPE = pd.CategoricalDtype(['easy', 'medium', 'hard'], ordered=True)
+_COMPLEXITY_DTYPE = pd.CategoricalDtype(['O(n)', 'O(n log n)', 'O(n^2)', 'O(n^k)'], ordered=True)
+
+# Report output name -> EvaluationAnalyzer plot method
+_REPORT_PLOTS = {
+    'success_plot': 'plot_success_rates',
+    'performance_plot': 'plot_performance_distributions',
+    'efficiency_plot': 'plot_efficiency_analysis',
+}
+
+
+def _describe(values: np.ndarray, p95: bool = True) -> Dict[str, float]:
+    """
+    Summary statistics of a non-empty array, matching pandas' Series methods.
+    
+    Both order statistics come from one np.percentile call, and std uses
+    ddof=1 like pandas (NaN for a single value).
+    
+    Args:
+        values: 1-D array without NaN
+        p95: Include the 95th percentile
+        
+    Returns:
+        Dict with mean, median, std, min, max (and p95)
+    """
+    median, p95_value = np.percentile(values, [50, 95])
+    stats = {
+        'mean': values.mean(),
+        'median': median,
+        'std': values.std(ddof=1) if values.size > 1 else np.nan,
+        'min': values.min(),
+        'max': values.max()
+    }
+    if p95:
+        stats['p95'] = p95_value
+    return stats
+
+
+def _pyplot() -> ModuleType:
+    """
+    Import and style matplotlib on first use.
+    
+    matplotlib and seaborn are only needed when plotting, so importing this
+    module (e.g. for the CSV/Markdown reports) does not pay for them.
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Plots are only written to files; no GUI backend needed
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        plt.style.use('default')
+        sns.set_palette("husl")
+        _plt = plt
+    return _plt
+
+
+def _render_plot(method: str, df_path: Path, output_dir: Path, dpi: int) -> Path:
+    """Process pool worker: draw one report plot from a pickled DataFrame."""
+    analyzer = EvaluationAnalyzer(output_dir, output_dir, dpi=dpi)
+    analyzer.df = pd.read_pickle(df_path)
+    return getattr(analyzer, method)()
+
 
 class EvaluationAnalyzer:
     """Statistical analysis and visualization for evaluation results."""
     
-    def __init__(self, results_dir: Path, output_dir: Path):
+    def __init__(self, results_dir: Path, output_dir: Path, dpi: int = 150):
         """
         Initialize analyzer.
         
         Args:
             results_dir: Directory containing evaluation result files
             output_dir: Directory to save plots and reports
+            dpi: Resolution of saved plots
         """
         self.results_dir = Path(results_dir)
         self.output_dir = Path(output_dir)
+        self.dpi = dpi
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Set plot style
-        plt.style.use('default')
-        sns.set_palette("husl")
+        # Loaded DataFrame cache (see load_all_results)
+        self._cache_path = self.output_dir / "_cache.pkl"
+        self._mtime_path = self.output_dir / "_cache.mtimes.json"
         
         self.all_results: List[RunMetrics] = []
         self.df: Optional[pd.DataFrame] = None
     
     def load_all_results(self) -> None:
-        """Load all evaluation results from results directory."""
+        """
+        Load all evaluation results from results directory.
+        
+        The resulting DataFrame is pickled to the output directory together
+        with the mtimes of the files it was built from; later calls reuse it
+        as long as no result file was added, removed or modified.
+        """
         log.info(f"Loading evaluation results from {self.results_dir}")
         
         self.all_results = []
-        result_files = list(self.results_dir.glob("*.json"))
-        
+        result_files = [p for p in self.results_dir.glob("*.json") if p != self._mtime_path]
+        current = {str(p): p.stat().st_mtime for p in result_files}
+        
+        cached = self._load_cached_dataframe(current)
+        if cached is not None:
+            self.df = cached
+            log.info(f"Loaded {len(cached)} cached results for {len(result_files)} files")
+            return
+        
+        # Parse each file once and keep its raw result rows; no RunMetrics
+        # objects are built just to be flattened back into rows
+        rows: List[Dict[str, Any]] = []
         for result_file in result_files:
             try:
-                metrics = EvaluationMetrics()
-                metrics.load_results(result_file)
-                self.all_results.extend(metrics.results)
+                rows.extend(loads(result_file.read_bytes()).get('results', []))
             except Exception as e:
                 log.warning(f"Failed to load {result_file}: {e}")
         
         # Convert to DataFrame for analysis
-        self.df = self._create_dataframe()
-        log.info(f"Loaded {len(self.all_results)} total results from {len(result_files)} files")
+        self.df = self._create_dataframe(rows)
+        log.info(f"Loaded {len(rows)} total results from {len(result_files)} files")
+        
+        try:
+            self.df.to_pickle(self._cache_path)
+            self._mtime_path.write_text(dumps(current), encoding="utf-8")
+        except Exception as e:
+            log.warning(f"Failed to write results cache: {e}")
     
-    def _create_dataframe(self) -> pd.DataFrame:
-        """Convert results to pandas DataFrame."""
-        if not self.all_results:
-            return pd.DataFrame()
-        
-        data = []
-        for r in self.all_results:
-            data.append({
-                'task_id': r.task_id,
-                'run_id': r.run_id,
-                'status': r.status.value,
-                'success': r.success,
-                'efficient_runtime': r.efficient_runtime,
-                'efficient_memory': r.efficient_memory,
-                'iteration_count': r.iteration_count,
-                'final_runtime_ms': r.final_runtime_ms,
-                'final_memory_mb': r.final_memory_mb,
-                'runtime_limit_ms': r.runtime_limit_ms,
-                'memory_limit_mb': r.memory_limit_mb,
-                'agent_failures': r.agent_failures,
-                # Derived fields
-                'runtime_ratio': (r.final_runtime_ms / r.runtime_limit_ms 
-                                 if r.final_runtime_ms and r.runtime_limit_ms else None),
-                'memory_ratio': (r.final_memory_mb / r.memory_limit_mb 
-                                if r.final_memory_mb and r.memory_limit_mb else None),
-                'task_difficulty': self._infer_difficulty(r.task_id),
-                'complexity_class': self._infer_complexity(r.task_id)
-            })
-        
-        return pd.DataFrame(data)
+    def _load_cached_dataframe(self, current: Dict[str, float]) -> Optional[pd.DataFrame]:
+        """
+        Return the cached DataFrame if it was built from exactly these files.
+        
+        Args:
+            current: Result file path -> mtime for the files on disk now
+            
+        Returns:
+            Cached DataFrame, or None when missing or stale
+        """
+        if not (self._cache_path.exists() and self._mtime_path.exists()):
+            return None
+        try:
+            if loads(self._mtime_path.read_bytes()) != current:
+                return None
+            return pd.read_pickle(self._cache_path)
+        except Exception as e:
+            log.warning(f"Ignoring unreadable results cache: {e}")
+            return None
     
-    def _infer_difficulty(self, task_id: str) -> str:
-        """Infer difficulty from task ID."""
-        if 'CF' in task_id:
-            # Codeforces task - infer from problem index
-            if task_id.endswith('A'):
-                return 'easy'
-            elif task_id.endswith(('B', 'C')):
-                return 'medium'
-            else:
-                return 'hard'
-        elif 'BIGOBENCH' in task_id:
-            # BigO(Bench) - infer from ID number
-            id_num = int(''.join(filter(str.isdigit, task_id)) or '0')
-            if id_num <= 10:
-                return 'easy'
-            elif id_num <= 30:
-                return 'medium'
-            else:
-                return 'hard'
+    def _create_dataframe(self, rows: Optional[List[Dict[str, Any]]] = None) -> pd.DataFrame:
+        """
+        Convert results to pandas DataFrame.
+        
+        Args:
+            rows: Raw result rows as written by EvaluationMetrics.save_results;
+                defaults to rows built from self.all_results
+            
+        Returns:
+            DataFrame with one row per run plus derived columns
+        """
+        # Build column lists (struct-of-arrays) so pandas skips per-row dicts
+        if rows is None:
+            if not self.all_results:
+                return pd.DataFrame()
+            columns = {name: [getattr(r, name) for r in self.all_results] for name in _RESULT_COLUMNS}
+            columns['status'] = [r.status.value for r in self.all_results]
         else:
-            return 'medium'  # Default
+            if not rows:
+                return pd.DataFrame()
+            columns = {name: [row.get(name) for row in rows] for name in _RESULT_COLUMNS}
+        
+        df = pd.DataFrame(columns)
+        
+        # Derived fields
+        # Zero or missing measurements/limits give NaN ratios
+        df['runtime_ratio'] = self._ratio(df['final_runtime_ms'], df['runtime_limit_ms'])
+        df['memory_ratio'] = self._ratio(df['final_memory_mb'], df['memory_limit_mb'])
+        difficulty, complexity = self._infer_task_classes(df['task_id'])
+        
+        # Low-cardinality labels are integer-coded for cheap groupby/compare
+        df['status'] = df['status'].astype('category')
+        df['task_difficulty'] = pd.Categorical(difficulty, dtype=_DIFFICULTY_DTYPE)
+        df['complexity_class'] = pd.Categorical(complexity, dtype=_COMPLEXITY_DTYPE)
+        
+        return df
     
-    def _infer_complexity(self, task_id: str) -> str:
-        """Infer expected complexity class from task ID."""
-        if 'BIGOBENCH' in task_id:
-            id_num = int(''.join(filter(str.isdigit, task_id)) or '0')
-            if id_num <= 5:
-                return 'O(n)'
-            elif id_num <= 15:
-                return 'O(n log n)'
-            elif id_num <= 25:
-                return 'O(n^2)'
-            else:
-                return 'O(n^k)'
-        else:
-            return 'O(n)'  # Default for Codeforces
+    @staticmethod
+    def _ratio(measured: pd.Series, limit: pd.Series) -> pd.Series:
+        """Column-wise measured/limit, NaN where either side is zero or missing."""
+        measured = measured.astype('float64').replace(0, np.nan)
+        limit = limit.astype('float64').replace(0, np.nan)
+        return measured / limit
+    
+    @staticmethod
+    def _infer_task_classes(task_ids: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Infer difficulty and expected complexity class from task IDs.
+        
+        Codeforces tasks are graded by problem index (A easy, B/C medium, else
+        hard); BigO(Bench) tasks by the number formed from all digits in the ID.
+        Everything else is medium / O(n).
+        
+        Args:
+            task_ids: Series of task ID strings
+            
+        Returns:
+            Tuple of (difficulty, complexity_class) arrays aligned with task_ids
+        """
+        is_cf = task_ids.str.contains('CF', regex=False)
+        is_bb = task_ids.str.contains('BIGOBENCH', regex=False)
+        digits = task_ids.str.replace(r'\D', '', regex=True)
+        id_num = pd.to_numeric(digits, errors='coerce').fillna(0)
+        last = task_ids.str[-1]
+        
+        difficulty = np.select(
+            [is_cf & (last == 'A'), is_cf & last.isin(['B', 'C']), is_cf,
+             is_bb & (id_num <= 10), is_bb & (id_num <= 30), is_bb],
+            ['easy', 'medium', 'hard', 'easy', 'medium', 'hard'],
+            default='medium'
+        )
+        complexity = np.select(
+            [is_bb & (id_num <= 5), is_bb & (id_num <= 15), is_bb & (id_num <= 25), is_bb],
+            ['O(n)', 'O(n log n)', 'O(n^2)', 'O(n^k)'],
+            default='O(n)'
+        )
+        return difficulty, complexity
     
     def generate_summary_stats(self) -> Dict[str, Any]:
         """Generate comprehensive summary statistics."""
@@ -148,69 +272,28 @@ class EvaluationAnalyzer:
         runtime_efficiency = self.df['efficient_runtime'].mean() * 100
         memory_efficiency = self.df['efficient_memory'].mean() * 100
         
-        # Performance statistics
-        successful_runs = self.df[self.df['success'] == True]
-        
+        # Performance statistics over successful runs with a measurement
         runtime_stats = {}
         memory_stats = {}
         iteration_stats = {}
         
-        if not successful_runs.empty:
-            # Runtime statistics
-            runtime_data = successful_runs['final_runtime_ms'].dropna()
-            if not runtime_data.empty:
-                runtime_stats = {
-                    'mean': runtime_data.mean(),
-                    'median': runtime_data.median(),
-                    'std': runtime_data.std(),
-                    'min': runtime_data.min(),
-                    'max': runtime_data.max(),
-                    'p95': runtime_data.quantile(0.95)
-                }
+        success = self.df['success'].to_numpy(dtype=bool)
+        if success.any():
+            runtime_data = self.df['final_runtime_ms'].to_numpy(dtype=np.float64)[success]
+            runtime_data = runtime_data[~np.isnan(runtime_data)]
+            if runtime_data.size:
+                runtime_stats = _describe(runtime_data)
             
-            # Memory statistics
-            memory_data = successful_runs['final_memory_mb'].dropna()
-            if not memory_data.empty:
-                memory_stats = {
-                    'mean': memory_data.mean(),
-                    'median': memory_data.median(),
-                    'std': memory_data.std(),
-                    'min': memory_data.min(),
-                    'max': memory_data.max(),
-                    'p95': memory_data.quantile(0.95)
-                }
+            memory_data = self.df['final_memory_mb'].to_numpy(dtype=np.float64)[success]
+            memory_data = memory_data[~np.isnan(memory_data)]
+            if memory_data.size:
+                memory_stats = _describe(memory_data)
             
-            # Iteration statistics
-            iteration_data = successful_runs['iteration_count']
-            iteration_stats = {
-                'mean': iteration_data.mean(),
-                'median': iteration_data.median(),
-                'std': iteration_data.std(),
-                'min': iteration_data.min(),
-                'max': iteration_data.max()
-            }
-        
-        # Breakdown by difficulty
-        difficulty_breakdown = {}
-        for difficulty in self.df['task_difficulty'].unique():
-            subset = self.df[self.df['task_difficulty'] == difficulty]
-            difficulty_breakdown[difficulty] = {
-                'total_runs': len(subset),
-                'success_rate': subset['success'].mean() * 100,
-                'runtime_efficiency': subset['efficient_runtime'].mean() * 100,
-                'memory_efficiency': subset['efficient_memory'].mean() * 100
-            }
-        
-        # Breakdown by complexity
-        complexity_breakdown = {}
-        for complexity in self.df['complexity_class'].unique():
-            subset = self.df[self.df['complexity_class'] == complexity]
-            complexity_breakdown[complexity] = {
-                'total_runs': len(subset),
-                'success_rate': subset['success'].mean() * 100,
-                'runtime_efficiency': subset['efficient_runtime'].mean() * 100,
-                'memory_efficiency': subset['efficient_memory'].mean() * 100
-            }
+            iteration_stats = _describe(self.df['iteration_count'].to_numpy()[success], p95=False)
+        
+        # Breakdowns by difficulty and complexity
+        difficulty_breakdown = self._breakdown('task_difficulty')
+        complexity_breakdown = self._breakdown('complexity_class')
         
         return {
             'overall_metrics': {
@@ -229,34 +312,55 @@ class EvaluationAnalyzer:
             'breakdown_by_complexity': complexity_breakdown
         }
     
+    def _breakdown(self, column: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-group run counts and success/efficiency rates in one groupby pass.
+        
+        Args:
+            column: Column to group by
+            
+        Returns:
+            Mapping of group value (in order of first appearance) to its metrics
+        """
+        grouped = self.df.groupby(column, sort=False, observed=True).agg(
+            total_runs=('success', 'size'),
+            success_rate=('success', 'mean'),
+            runtime_efficiency=('efficient_runtime', 'mean'),
+            memory_efficiency=('efficient_memory', 'mean')
+        )
+        grouped[['success_rate', 'runtime_efficiency', 'memory_efficiency']] *= 100
+        return grouped.to_dict('index')
+    
     def plot_success_rates(self) -> Path:
         """Plot success rates by difficulty and complexity."""
         if self.df is None or self.df.empty:
             log.warning("No data available for plotting")
             return None
         
+        plt = _pyplot()
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
-        # Success rate by difficulty
-        difficulty_success = self.df.groupby('task_difficulty')['success'].mean() * 100
-        difficulty_success.plot(kind='bar', ax=ax1, color='skyblue')
-        ax1.set_title('Success Rate by Difficulty')
-        ax1.set_ylabel('Success Rate (%)')
-        ax1.set_xlabel('Difficulty')
-        ax1.tick_params(axis='x', rotation=45)
-        
-        # Success rate by complexity
-        complexity_success = self.df.groupby('complexity_class')['success'].mean() * 100
-        complexity_success.plot(kind='bar', ax=ax2, color='lightcoral')
-        ax2.set_title('Success Rate by Complexity Class')
-        ax2.set_ylabel('Success Rate (%)')
-        ax2.set_xlabel('Complexity Class')
-        ax2.tick_params(axis='x', rotation=45)
-        
-        plt.tight_layout()
-        output_path = self.output_dir / "success_rates.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        try:
+            # Success rate by difficulty
+            difficulty_success = self.df.groupby('task_difficulty', observed=True)['success'].mean() * 100
+            difficulty_success.plot(kind='bar', ax=ax1, color='skyblue')
+            ax1.set_title('Success Rate by Difficulty')
+            ax1.set_ylabel('Success Rate (%)')
+            ax1.set_xlabel('Difficulty')
+            ax1.tick_params(axis='x', rotation=45)
+            
+            # Success rate by complexity
+            complexity_success = self.df.groupby('complexity_class', observed=True)['success'].mean() * 100
+            complexity_success.plot(kind='bar', ax=ax2, color='lightcoral')
+            ax2.set_title('Success Rate by Complexity Class')
+            ax2.set_ylabel('Success Rate (%)')
+            ax2.set_xlabel('Complexity Class')
+            ax2.tick_params(axis='x', rotation=45)
+            
+            plt.tight_layout()
+            output_path = self.output_dir / "success_rates.png"
+            fig.savefig(output_path, dpi=self.dpi, bbox_inches='tight')
+        finally:
+            plt.close(fig)
         
         log.info(f"Saved success rates plot to {output_path}")
         return output_path
@@ -267,52 +371,60 @@ class EvaluationAnalyzer:
             log.warning("No data available for plotting")
             return None
         
-        successful_runs = self.df[self.df['success'] == True]
-        
+        # Project the successful runs once; NaN masks are shared by all subplots
+        success = self.df['success'].to_numpy(dtype=bool)
+        runtimes = self.df['final_runtime_ms'].to_numpy(dtype=np.float64)[success]
+        memories = self.df['final_memory_mb'].to_numpy(dtype=np.float64)[success]
+        iteration_data = self.df['iteration_count'].to_numpy()[success]
+        has_runtime = ~np.isnan(runtimes)
+        has_memory = ~np.isnan(memories)
+        runtime_data = runtimes[has_runtime]
+        memory_data = memories[has_memory]
+        
+        plt = _pyplot()
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-        
-        # Runtime distribution
-        runtime_data = successful_runs['final_runtime_ms'].dropna()
-        if not runtime_data.empty:
-            ax1.hist(runtime_data, bins=30, alpha=0.7, color='skyblue')
-            ax1.set_title('Runtime Distribution (Successful Runs)')
-            ax1.set_xlabel('Runtime (ms)')
-            ax1.set_ylabel('Frequency')
-            ax1.axvline(runtime_data.mean(), color='red', linestyle='--', label=f'Mean: {runtime_data.mean():.1f}ms')
-            ax1.legend()
-        
-        # Memory distribution
-        memory_data = successful_runs['final_memory_mb'].dropna()
-        if not memory_data.empty:
-            ax2.hist(memory_data, bins=30, alpha=0.7, color='lightcoral')
-            ax2.set_title('Memory Usage Distribution (Successful Runs)')
-            ax2.set_xlabel('Memory (MB)')
-            ax2.set_ylabel('Frequency')
-            ax2.axvline(memory_data.mean(), color='red', linestyle='--', label=f'Mean: {memory_data.mean():.1f}MB')
-            ax2.legend()
-        
-        # Runtime vs Memory scatter
-        if not runtime_data.empty and not memory_data.empty:
-            valid_data = successful_runs[['final_runtime_ms', 'final_memory_mb']].dropna()
-            if not valid_data.empty:
-                ax3.scatter(valid_data['final_runtime_ms'], valid_data['final_memory_mb'], alpha=0.6)
+        try:
+            # Runtime distribution
+            if runtime_data.size:
+                runtime_mean = runtime_data.mean()
+                ax1.hist(runtime_data, bins=30, alpha=0.7, color='skyblue')
+                ax1.set_title('Runtime Distribution (Successful Runs)')
+                ax1.set_xlabel('Runtime (ms)')
+                ax1.set_ylabel('Frequency')
+                ax1.axvline(runtime_mean, color='red', linestyle='--', label=f'Mean: {runtime_mean:.1f}ms')
+                ax1.legend()
+            
+            # Memory distribution
+            if memory_data.size:
+                memory_mean = memory_data.mean()
+                ax2.hist(memory_data, bins=30, alpha=0.7, color='lightcoral')
+                ax2.set_title('Memory Usage Distribution (Successful Runs)')
+                ax2.set_xlabel('Memory (MB)')
+                ax2.set_ylabel('Frequency')
+                ax2.axvline(memory_mean, color='red', linestyle='--', label=f'Mean: {memory_mean:.1f}MB')
+                ax2.legend()
+            
+            # Runtime vs Memory scatter
+            both = has_runtime & has_memory
+            if both.any():
+                ax3.scatter(runtimes[both], memories[both], alpha=0.6, rasterized=True)
                 ax3.set_title('Runtime vs Memory Usage')
                 ax3.set_xlabel('Runtime (ms)')
                 ax3.set_ylabel('Memory (MB)')
-        
-        # Iteration count distribution
-        iteration_data = successful_runs['iteration_count']
-        ax4.hist(iteration_data, bins=range(1, int(iteration_data.max()) + 2), alpha=0.7, color='lightgreen')
-        ax4.set_title('Iteration Count Distribution (Successful Runs)')
-        ax4.set_xlabel('Iterations to Success')
-        ax4.set_ylabel('Frequency')
-        ax4.axvline(iteration_data.mean(), color='red', linestyle='--', label=f'Mean: {iteration_data.mean():.1f}')
-        ax4.legend()
-        
-        plt.tight_layout()
-        output_path = self.output_dir / "performance_distributions.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+            
+            # Iteration count distribution
+            ax4.hist(iteration_data, bins=range(1, int(iteration_data.max()) + 2), alpha=0.7, color='lightgreen')
+            ax4.set_title('Iteration Count Distribution (Successful Runs)')
+            ax4.set_xlabel('Iterations to Success')
+            ax4.set_ylabel('Frequency')
+            ax4.axvline(iteration_data.mean(), color='red', linestyle='--', label=f'Mean: {iteration_data.mean():.1f}')
+            ax4.legend()
+            
+            plt.tight_layout()
+            output_path = self.output_dir / "performance_distributions.png"
+            fig.savefig(output_path, dpi=self.dpi, bbox_inches='tight')
+        finally:
+            plt.close(fig)
         
         log.info(f"Saved performance distributions plot to {output_path}")
         return output_path
@@ -323,47 +435,55 @@ class EvaluationAnalyzer:
             log.warning("No data available for plotting")
             return None
         
+        plt = _pyplot()
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
-        # Runtime efficiency
-        runtime_data = self.df[['runtime_ratio', 'success']].dropna()
-        if not runtime_data.empty:
-            successful = runtime_data[runtime_data['success'] == True]['runtime_ratio']
-            failed = runtime_data[runtime_data['success'] == False]['runtime_ratio']
+        try:
+            # Runtime efficiency
+            runtime_data = self.df[['runtime_ratio', 'success']].dropna()
+            if not runtime_data.empty:
+                successful = runtime_data[runtime_data['success'] == True]['runtime_ratio']
+                failed = runtime_data[runtime_data['success'] == False]['runtime_ratio']
+            
+                ax1.hist(successful, bins=30, alpha=0.7, label='Successful', color='green')
+                ax1.hist(failed, bins=30, alpha=0.7, label='Failed', color='red')
+                ax1.axvline(1.0, color='black', linestyle='--', label='Time Limit')
+                ax1.set_title('Runtime Efficiency (Runtime/Limit Ratio)')
+                ax1.set_xlabel('Runtime Ratio')
+                ax1.set_ylabel('Frequency')
+                ax1.legend()
+            
+            # Memory efficiency
+            memory_data = self.df[['memory_ratio', 'success']].dropna()
+            if not memory_data.empty:
+                successful = memory_data[memory_data['success'] == True]['memory_ratio']
+                failed = memory_data[memory_data['success'] == False]['memory_ratio']
             
-            ax1.hist(successful, bins=30, alpha=0.7, label='Successful', color='green')
-            ax1.hist(failed, bins=30, alpha=0.7, label='Failed', color='red')
-            ax1.axvline(1.0, color='black', linestyle='--', label='Time Limit')
-            ax1.set_title('Runtime Efficiency (Runtime/Limit Ratio)')
-            ax1.set_xlabel('Runtime Ratio')
-            ax1.set_ylabel('Frequency')
-            ax1.legend()
-        
-        # Memory efficiency
-        memory_data = self.df[['memory_ratio', 'success']].dropna()
-        if not memory_data.empty:
-            successful = memory_data[memory_data['success'] == True]['memory_ratio']
-            failed = memory_data[memory_data['success'] == False]['memory_ratio']
+                ax2.hist(successful, bins=30, alpha=0.7, label='Successful', color='green')
+                ax2.hist(failed, bins=30, alpha=0.7, label='Failed', color='red')
+                ax2.axvline(1.0, color='black', linestyle='--', label='Memory Limit')
+                ax2.set_title('Memory Efficiency (Memory/Limit Ratio)')
+                ax2.set_xlabel('Memory Ratio')
+                ax2.set_ylabel('Frequency')
+                ax2.legend()
             
-            ax2.hist(successful, bins=30, alpha=0.7, label='Successful', color='green')
-            ax2.hist(failed, bins=30, alpha=0.7, label='Failed', color='red')
-            ax2.axvline(1.0, color='black', linestyle='--', label='Memory Limit')
-            ax2.set_title('Memory Efficiency (Memory/Limit Ratio)')
-            ax2.set_xlabel('Memory Ratio')
-            ax2.set_ylabel('Frequency')
-            ax2.legend()
-        
-        plt.tight_layout()
-        output_path = self.output_dir / "efficiency_analysis.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+            plt.tight_layout()
+            output_path = self.output_dir / "efficiency_analysis.png"
+            fig.savefig(output_path, dpi=self.dpi, bbox_inches='tight')
+        finally:
+            plt.close(fig)
         
         log.info(f"Saved efficiency analysis plot to {output_path}")
         return output_path
     
-    def generate_markdown_report(self) -> Path:
-        """Generate comprehensive Markdown report."""
-        stats = self.generate_summary_stats()
+    def generate_markdown_report(self, stats: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Generate comprehensive Markdown report.
+        
+        Args:
+            stats: Precomputed generate_summary_stats() result (computed if omitted)
+        """
+        if stats is None:
+            stats = self.generate_summary_stats()
         
         report_lines = [
             "# SwiftSolve Evaluation Report",
@@ -437,32 +557,22 @@ class EvaluationAnalyzer:
             log.warning("No data available for CSV export")
             return None
         
-        # Create summary by task
-        task_summary = self.df.groupby('task_id').agg({
-            'success': ['count', 'sum', 'mean'],
-            'efficient_runtime': 'mean',
-            'efficient_memory': 'mean',
-            'iteration_count': 'mean',
-            'final_runtime_ms': 'mean',
-            'final_memory_mb': 'mean',
-            'task_difficulty': 'first',
-            'complexity_class': 'first'
-        }).round(3)
-        
-        # Flatten column names
-        task_summary.columns = ['_'.join(col).strip() for col in task_summary.columns]
-        task_summary = task_summary.rename(columns={
-            'success_count': 'total_runs',
-            'success_sum': 'successful_runs',
-            'success_mean': 'success_rate',
-            'efficient_runtime_mean': 'runtime_efficiency',
-            'efficient_memory_mean': 'memory_efficiency',
-            'iteration_count_mean': 'mean_iterations',
-            'final_runtime_ms_mean': 'mean_runtime_ms',
-            'final_memory_mb_mean': 'mean_memory_mb',
-            'task_difficulty_first': 'difficulty',
-            'complexity_class_first': 'complexity'
-        })
+        # Create summary by task; named aggregations give flat column names
+        slim = self.df[['task_id', 'success', 'efficient_runtime', 'efficient_memory',
+                        'iteration_count', 'final_runtime_ms', 'final_memory_mb',
+                        'task_difficulty', 'complexity_class']]
+        task_summary = slim.groupby('task_id').agg(
+            total_runs=('success', 'count'),
+            successful_runs=('success', 'sum'),
+            success_rate=('success', 'mean'),
+            runtime_efficiency=('efficient_runtime', 'mean'),
+            memory_efficiency=('efficient_memory', 'mean'),
+            mean_iterations=('iteration_count', 'mean'),
+            mean_runtime_ms=('final_runtime_ms', 'mean'),
+            mean_memory_mb=('final_memory_mb', 'mean'),
+            difficulty=('task_difficulty', 'first'),
+            complexity=('complexity_class', 'first')
+        ).round(3)
         
         output_path = self.output_dir / "task_summary.csv"
         task_summary.to_csv(output_path)
@@ -470,6 +580,33 @@ class EvaluationAnalyzer:
         log.info(f"Generated CSV summary: {output_path}")
         return output_path
     
+    def _generate_plots(self) -> Dict[str, Path]:
+        """
+        Render all report plots in parallel worker processes.
+        
+        The DataFrame is pickled once to a temporary file that every worker
+        reads, instead of being sent to each of them.
+        
+        Returns:
+            Mapping of output name to plot path for the plots that succeeded
+        """
+        outputs = {}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            df_path = Path(tmp_dir) / "df.pkl"
+            self.df.to_pickle(df_path)
+            
+            with ProcessPoolExecutor(max_workers=len(_REPORT_PLOTS)) as executor:
+                futures = {
+                    name: executor.submit(_render_plot, method, df_path, self.output_dir, self.dpi)
+                    for name, method in _REPORT_PLOTS.items()
+                }
+                for name, future in futures.items():
+                    try:
+                        outputs[name] = future.result()
+                    except Exception as e:
+                        log.warning(f"Plot generation failed ({name}): {e}")
+        return outputs
+    
     def generate_full_report(self) -> Dict[str, Path]:
         """Generate complete evaluation report with all outputs."""
         log.info("Generating comprehensive evaluation report")
@@ -480,27 +617,26 @@ class EvaluationAnalyzer:
         
         outputs = {}
         
-        # Generate plots
+        # Summary statistics feed both the Markdown report and the JSON export
+        stats = self.generate_summary_stats()
+        
+        # Generate plots (independent and CPU-bound, so one process each)
         try:
-            outputs['success_plot'] = self.plot_success_rates()
-            outputs['performance_plot'] = self.plot_performance_distributions()
-            outputs['efficiency_plot'] = self.plot_efficiency_analysis()
+            outputs.update(self._generate_plots())
         except Exception as e:
             log.warning(f"Plot generation failed: {e}")
         
         # Generate reports
         try:
-            outputs['markdown_report'] = self.generate_markdown_report()
+            outputs['markdown_report'] = self.generate_markdown_report(stats)
             outputs['csv_summary'] = self.generate_csv_summary()
         except Exception as e:
             log.warning(f"Report generation failed: {e}")
         
         # Save raw statistics
         try:
-            stats = self.generate_summary_stats()
             stats_path = self.output_dir / "summary_statistics.json"
-            with open(stats_path, 'w') as f:
-                json.dump(stats, f, indent=2)
+            stats_path.write_text(dumps(stats, indent=True), encoding="utf-8")
             outputs['statistics'] = stats_path
         except Exception as e:
             log.warning(f"Statistics export failed: {e}")
@@ -0,0 +1,156 @@
+"""
+Pure-Python reader for gprof's gmon.out.
+
+Maps the PC-sampling histogram in gmon.out onto the function symbols of the
+profiled ELF binary, so the sandbox can report per-function self time
+without running the gprof tool. Only the GNU gmon format (version 1) and
+64-bit little-endian ELF files are supported; anything else raises
+ValueError and callers fall back to gprof. C++ names are demangled with a
+single c++filt call when binutils is installed.
+"""
+
+import bisect
+import shutil
+import struct
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+_GMON_MAGIC = b"gmon"
+_GMON_HEADER = struct.Struct("<4si12x")
+_TAG_TIME_HIST, _TAG_CG_ARC, _TAG_BB_COUNT = 0, 1, 2
+_HIST_HEADER = struct.Struct("<QQii15sc")
+_CG_ARC = struct.Struct("<QQi")
+
+_ELF_HEADER = struct.Struct("<16sHHIQQQIHHHHHH")
+_SECTION = struct.Struct("<IIQQQQIIQQ")
+_SYMBOL = struct.Struct("<IBBHQQ")
+_SHT_SYMTAB, _SHT_DYNSYM = 2, 11
+_STT_FUNC = 2
+
+
+def elf_functions(bin_path: Path) -> List[Tuple[int, int, str]]:
+    """
+    Read the function symbols of an ELF binary.
+
+    Args:
+        bin_path: 64-bit little-endian ELF executable
+
+    Returns:
+        (address, size, name) tuples sorted by address
+
+    Raises:
+        ValueError: If the file is not a supported ELF binary
+    """
+    data = Path(bin_path).read_bytes()
+    if len(data) < _ELF_HEADER.size:
+        raise ValueError(f"{bin_path} is too short for an ELF header")
+    header = _ELF_HEADER.unpack_from(data)
+    ident, shoff, shentsize, shnum = header[0], header[6], header[11], header[12]
+    if ident[:4] != b"\x7fELF" or ident[4] != 2 or ident[5] != 1:
+        raise ValueError(f"{bin_path} is not a 64-bit little-endian ELF file")
+
+    sections = [_SECTION.unpack_from(data, shoff + i * shentsize) for i in range(shnum)]
+    # Prefer the full symbol table; stripped binaries only keep .dynsym
+    tables = [s for s in sections if s[1] == _SHT_SYMTAB] or [s for s in sections if s[1] == _SHT_DYNSYM]
+    if not tables:
+        raise ValueError(f"{bin_path} has no symbol table")
+    _, _, _, _, sym_off, sym_size, link, _, _, entsize = tables[0]
+    str_off = sections[link][4]
+
+    functions = []
+    for off in range(sym_off, sym_off + sym_size, entsize or _SYMBOL.size):
+        name_off, info, _, shndx, value, size = _SYMBOL.unpack_from(data, off)
+        if info & 0xF != _STT_FUNC or shndx == 0 or not value:
+            continue
+        name = data[str_off + name_off:data.index(b"\0", str_off + name_off)].decode(errors="replace")
+        functions.append((value, size, name))
+    functions.sort()
+    return functions
+
+
+def demangle(names: List[str]) -> List[str]:
+    """
+    Demangle C++ symbol names with one c++filt process for the whole batch.
+
+    Args:
+        names: Symbol names, mangled or not (plain C names pass through)
+
+    Returns:
+        Demangled names in the same order; the input unchanged when c++filt
+        is missing or fails
+    """
+    cxxfilt = shutil.which("c++filt")
+    if not names or cxxfilt is None:
+        return list(names)
+    try:
+        proc = subprocess.run([cxxfilt], input="\n".join(names) + "\n",
+                              capture_output=True, text=True, timeout=10, check=True)
+    except (OSError, subprocess.SubprocessError):
+        return list(names)
+    demangled = proc.stdout.splitlines()
+    return demangled if len(demangled) == len(names) else list(names)
+
+
+def parse_gmon(gmon_path: Path, bin_path: Path) -> Dict[str, float]:
+    """
+    Attribute gmon.out histogram samples to the binary's functions.
+
+    Args:
+        gmon_path: gmon.out written by the -pg instrumented program
+        bin_path: The program that wrote it
+
+    Returns:
+        Self time in seconds per demangled function name, largest first;
+        samples outside every known function are grouped under "<unknown>"
+
+    Raises:
+        ValueError: If either file is not in a supported format
+    """
+    data = Path(gmon_path).read_bytes()
+    if len(data) < _GMON_HEADER.size:
+        raise ValueError(f"{gmon_path} is too short for a gmon header")
+    magic, version = _GMON_HEADER.unpack_from(data)
+    if magic != _GMON_MAGIC or version != 1:
+        raise ValueError(f"{gmon_path} is not a version 1 gmon.out file")
+
+    functions = elf_functions(bin_path)
+    starts = [addr for addr, _, _ in functions]
+    seconds: Dict[str, float] = {}
+    offset = _GMON_HEADER.size
+    try:
+        while offset < len(data):
+            tag = data[offset]
+            offset += 1
+            if tag == _TAG_TIME_HIST:
+                low_pc, high_pc, nbins, rate, _, _ = _HIST_HEADER.unpack_from(data, offset)
+                offset += _HIST_HEADER.size
+                bins = struct.unpack_from(f"<{nbins}H", data, offset)
+                offset += 2 * nbins
+                if nbins <= 0 or rate <= 0:
+                    continue
+                width = (high_pc - low_pc) / nbins
+                for i, count in enumerate(bins):
+                    if not count:
+                        continue
+                    pc = low_pc + int(i * width)
+                    idx = bisect.bisect_right(starts, pc) - 1
+                    addr, size, name = functions[idx] if idx >= 0 else (0, 0, "")
+                    # Zero-size symbols (hand-written asm) extend to the next one
+                    if idx < 0 or (size and pc >= addr + size):
+                        name = "<unknown>"
+                    seconds[name] = seconds.get(name, 0.0) + count / rate
+            elif tag == _TAG_CG_ARC:
+                offset += _CG_ARC.size
+            elif tag == _TAG_BB_COUNT:
+                (ncounts,) = struct.unpack_from("<i", data, offset)
+                offset += 4 + 16 * ncounts
+            else:
+                raise ValueError(f"Unknown gmon.out record tag {tag}")
+    except struct.error as e:
+        raise ValueError(f"Truncated gmon.out record: {e}") from e
+
+    readable: Dict[str, float] = {}
+    for name, secs in zip(demangle(list(seconds)), seconds.values()):
+        readable[name] = readable.get(name, 0.0) + secs
+    return dict(sorted(readable.items(), key=lambda item: item[1], reverse=True))
@@ -1,114 +1,953 @@
 # sandbox/run_in_sandbox.py
-import shutil, subprocess, tempfile, os, json, pathlib, shlex
+import shutil, subprocess, tempfile, os, json, pathlib, shlex, hashlib, selectors, signal, time, atexit, itertools, platform
+from collections import deque
+import multiprocessing.util
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Literal, Optional
 from ..utils.logger import get_logger
+from ..utils.config import get_settings
+from ..utils.bincache import evict_lru, touch
+from .gmon import parse_gmon
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+POSIX_SPAWN_AVAILABLE = hasattr(os, "posix_spawnp")
+# Python ignores these; children get the defaults back, like
+# subprocess's restore_signals=True
+_RESTORED_SIGNALS = tuple(getattr(signal, name) for name in ("SIGPIPE", "SIGXFSZ")
+                          if hasattr(signal, name))
 
 log = get_logger("Sandbox")
 
-#TODO: Increase stack size, to something ~256 MB
+# Candidate programs run under a small launcher that applies setrlimit caps
+# and then execs them: CPU seconds (timeout), address space (sandbox_mem_mb)
+# and a deep stack for recursive solutions. Profiling runs also use it to pin
+# the program to one CPU so timings don't migrate across cores
+RUN_STACK_BYTES = 256 * 1024 * 1024
+_LIMITER_SRC = r"""
+#ifdef __linux__
+#include <sched.h>
+#endif
+#include <sys/resource.h>
+#include <unistd.h>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+
+static void cap(int resource, rlim_t soft, rlim_t hard) {
+    struct rlimit cur;
+    if (getrlimit(resource, &cur) == 0 && cur.rlim_max != RLIM_INFINITY) {
+        if (soft > cur.rlim_max) soft = cur.rlim_max;
+        if (hard > cur.rlim_max) hard = cur.rlim_max;
+    }
+    struct rlimit rl = {soft, hard};
+    if (setrlimit(resource, &rl) != 0) perror("limiter: setrlimit");
+}
+
+static void pin(int cpu) {
+#ifdef __linux__
+    cpu_set_t set;
+    CPU_ZERO(&set);
+    CPU_SET(cpu, &set);
+    if (sched_setaffinity(0, sizeof(set), &set) != 0) perror("limiter: sched_setaffinity");
+#else
+    (void)cpu;  // no CPU affinity API outside Linux; run unpinned
+#endif
+}
+
+int main(int argc, char** argv) {
+    int i = 1;
+    for (; i + 1 < argc && strcmp(argv[i], "--") != 0; i += 2) {
+        rlim_t v = strtoull(argv[i + 1], nullptr, 10);
+        if (!strcmp(argv[i], "--cpu")) cap(RLIMIT_CPU, v, v + 1);
+        else if (!strcmp(argv[i], "--mem")) cap(RLIMIT_AS, v << 20, v << 20);
+        else if (!strcmp(argv[i], "--stack")) cap(RLIMIT_STACK, v, v);
+        else if (!strcmp(argv[i], "--affinity")) pin((int)v);
+        else { fprintf(stderr, "limiter: unknown option %s\n", argv[i]); return 125; }
+    }
+    if (i + 1 >= argc || strcmp(argv[i], "--") != 0) {
+        fprintf(stderr, "usage: limiter [--cpu SEC] [--mem MB] [--stack BYTES] [--affinity CPU] "
+                        "-- PROGRAM [ARGS...]\n");
+        return 125;
+    }
+    execvp(argv[i + 1], argv + i + 1);
+    perror("limiter: execvp");
+    return 127;
+}
+"""
+
+# Faster linkers when installed; single-TU programs are mostly link setup.
+# Only used for uninstrumented builds (mold has no -pg support)
+def _linker_works(flag: str) -> bool:
+    """
+    True if g++ links a trivial program with flag; an installed linker is not
+    enough, e.g. GCC older than 12.1 rejects -fuse-ld=mold.
+    """
+    gxx = shutil.which("g++")
+    if gxx is None:
+        return False
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            result = subprocess.run([gxx, flag, "-x", "c++", "-", "-o", os.path.join(tmp, "probe")],
+                                    input=b"int main() { return 0; }\n", capture_output=True, timeout=60)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+    return result.returncode == 0
+
+_LD_FLAGS = next(([flag] for tool, flag in (("mold", "-fuse-ld=mold"), ("ld.lld", "-fuse-ld=lld"))
+                  if shutil.which(tool) and _linker_works(flag)), [])
+log.info(f"Sandbox linker: {_LD_FLAGS[0][len('-fuse-ld='):] if _LD_FLAGS else 'default'}")
+
+# -march/-ffast-math help the compiler to perform auto-vectorization; a fixed
+# x86-64-v3 (AVX2/BMI2) target keeps cached binaries portable across hosts.
+# Other architectures (aarch64 Linux, Apple Silicon) keep the compiler default
+_MARCH_FLAGS = (["-march=x86-64-v3"] if platform.machine().lower() in ("x86_64", "amd64")
+                else [])
+_TUNE_FLAGS = ["-mtune=native"] if _MARCH_FLAGS else []
+COMPILE_FLAGS = ["-O3", "-std=c++17", *_MARCH_FLAGS, *_TUNE_FLAGS, "-ffast-math",
+                 "-pipe", "-fno-plt"] + _LD_FLAGS
+# Cheap builds for exploratory iterations that opt in with opt="fast"; runtime
+# checks keep the default -O3 build (see compile_and_run's opt)
+FAST_FLAGS = ["-O2", "-std=c++17", "-pipe", "-fno-plt"] + _LD_FLAGS
+FINAL_FLAGS = COMPILE_FLAGS
+_OPT_FLAGS = {"fast": FAST_FLAGS, "final": FINAL_FLAGS}
+
+# Profiling builds skip -ffast-math: its reassociation moves work between
+# source lines and smears gprof's line-level attribution
+PROFILE_FLAGS = ["-O2", "-std=c++17", *_MARCH_FLAGS, "-pg", "-g", "-fno-omit-frame-pointer"]
+# perf samples the same optimized build the runtime check executes; -g only
+# adds line info and frame pointers make --call-graph=fp unwinding work
+PERF_FLAGS = FINAL_FLAGS + ["-g", "-fno-omit-frame-pointer"]
+# Sampling starts PERF_PERIOD_BACKOFF x coarser than the configured period and
+# is halved down to it until at least PERF_MIN_SAMPLES samples are collected
+PERF_PERIOD_BACKOFF = 4
+PERF_MIN_SAMPLES = 500
+# Locations kept by compile_and_profile_hotspots
+HOTSPOT_TOP_K = 10
+
+CACHE_DIR = pathlib.Path(
+    os.environ.get("SWIFTSOLVE_CACHE")
+    or pathlib.Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")) / "swiftsolve"
+).expanduser()
+# Compiled binaries, content-addressed by source + flags + compiler version;
+# least recently used ones are evicted beyond BIN_CACHE_MAX_BYTES
+BIN_CACHE_DIR = CACHE_DIR / "bins"
+BIN_CACHE_MAX_BYTES = int(os.environ.get("SWIFTSOLVE_BIN_CACHE_MAX_BYTES", 2 * 1024 ** 3))
+# Precompiled <bits/stdc++.h> per flag set + compiler version; picked up via
+# -I by sources that include it first, ignored by g++ for everything else
+PCH_DIR = CACHE_DIR / "pch"
+PCH_HEADER = "bits/stdc++.h"
+
+# ccache (when installed) fronts g++ and also catches near-identical sources
+_CCACHE = shutil.which("ccache")
+_GXX = shutil.which("g++")
+_CCACHE_ENV = {**os.environ, "CCACHE_DIR": str(CACHE_DIR / "ccache"), "CCACHE_COMPRESS": "1"}
+# Per-process scratch root, on tmpfs when available to avoid disk I/O;
+# calls get numbered sub-directories instead of a TemporaryDirectory each
+_SCRATCH_BASE = pathlib.Path("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()) / "swiftsolve"
+_scratch_root: Optional[pathlib.Path] = None
+_scratch_counter = itertools.count()
+
+def _scratch_dir() -> pathlib.Path:
+    """This process's scratch root, created on first use (and after fork)."""
+    global _scratch_root
+    root = _SCRATCH_BASE / str(os.getpid())
+    if _scratch_root != root:
+        root.mkdir(parents=True, exist_ok=True)
+        atexit.register(shutil.rmtree, root, ignore_errors=True)
+        # multiprocessing workers exit via os._exit and skip atexit
+        multiprocessing.util.Finalize(None, shutil.rmtree, args=(root,),
+                                      kwargs={"ignore_errors": True}, exitpriority=0)
+        _scratch_root = root
+    return root
+
+@contextmanager
+def _scratch(workdir: Optional[pathlib.Path] = None):
+    """Yield workdir if given, else a fresh scratch sub-directory removed afterwards."""
+    if workdir:
+        yield pathlib.Path(workdir)
+        return
+    tmp = _scratch_dir() / str(next(_scratch_counter))
+    tmp.mkdir()
+    try:
+        yield tmp
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def _gxx_cmd() -> list[str]:
+    return [_CCACHE, _GXX] if _CCACHE else [_GXX]
+
+def _compile(code: str, flags: list[str], out_path: pathlib.Path,
+             workdir: Optional[pathlib.Path] = None) -> None:
+    """
+    Run g++ (through ccache when available) on code, writing out_path.
+
+    The source is piped on stdin; ccache cannot cache stdin input, so with
+    ccache it is written to a relative main.cpp in workdir (or a fresh
+    scratch directory). Without ccache, sources including PCH_HEADER get
+    the precompiled header (ccache would refuse to cache such builds).
+
+    Raises:
+        subprocess.CalledProcessError: If compilation fails
+    """
+    try:
+        if not _CCACHE:
+            pch_dir = _pch_include_dir(tuple(flags)) if PCH_HEADER in code else None
+            pch_flags = ["-I", str(pch_dir)] if pch_dir else []
+            compile_cmd = _gxx_cmd() + flags + pch_flags + ["-x", "c++", "-", "-o", str(out_path)]
+            log.info(f"Compilation command: {' '.join(shlex.quote(c) for c in compile_cmd)}")
+            out, err, returncode = _run_bounded(compile_cmd, code.encode(), None)
+        else:
+            with _scratch(workdir) as tmp:
+                (pathlib.Path(tmp) / "main.cpp").write_text(code, encoding="utf-8")
+                compile_cmd = _gxx_cmd() + flags + ["main.cpp", "-o", str(out_path)]
+                log.info(f"Compilation command: {' '.join(shlex.quote(c) for c in compile_cmd)}")
+                out, err, returncode = _run_bounded(compile_cmd, b"", None, cwd=str(tmp), env=_CCACHE_ENV)
+    except OutputLimitExceeded as e:
+        # Runaway diagnostics: g++ was killed, report the part that was kept
+        raise subprocess.CalledProcessError(-signal.SIGKILL, e.cmd, output=e.output, stderr=e.stderr) from e
+
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, compile_cmd, output=out, stderr=err)
+
+@lru_cache(maxsize=None)
+def _gxx_version() -> str:
+    """First line of `g++ --version`, so compiler upgrades invalidate the cache."""
+    out, _, _ = _run_bounded([_GXX, "--version"], b"", 10)
+    return out.decode(errors="replace").partition("\n")[0]
+
+@lru_cache(maxsize=None)
+def _pch_include_dir(flags: tuple) -> Optional[pathlib.Path]:
+    """
+    Include directory holding a PCH of PCH_HEADER built with flags.
+
+    Built once per flag set (g++ only uses a PCH compiled with compatible
+    flags) and shared across processes through the cache directory. If the
+    PCH is unusable for a source, g++ silently parses the real header.
+
+    Returns:
+        Directory to pass with -I, or None if the PCH could not be built
+    """
+    key = hashlib.sha256("\0".join([*flags, _gxx_version()]).encode()).hexdigest()
+    include_dir = PCH_DIR / key
+    gch_path = include_dir / f"{PCH_HEADER}.gch"
+    if gch_path.exists():
+        return include_dir
+
+    gch_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(include_dir / ".lock", "w") as lock:
+        if FCNTL_AVAILABLE:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        if gch_path.exists():
+            return include_dir
+        # g++ cannot precompile from stdin, so the header source is a file
+        # (not named like PCH_HEADER, so it never shadows the real one)
+        src_path = include_dir / "pch_source.h"
+        src_path.write_text(f"#include <{PCH_HEADER}>\n", encoding="utf-8")
+        staged = gch_path.with_name(f"{gch_path.name}.{os.getpid()}.tmp")
+        pch_cmd = [_GXX, *flags, "-x", "c++-header", str(src_path), "-o", str(staged)]
+        log.info(f"Building precompiled header: {' '.join(shlex.quote(c) for c in pch_cmd)}")
+        _, err, returncode = _run_bounded(pch_cmd, b"", None)
+        if returncode != 0:
+            staged.unlink(missing_ok=True)
+            log.warning(f"Precompiled header build failed: {err.decode(errors='replace')}")
+            return None
+        os.replace(staged, gch_path)
+    return include_dir
+
+@lru_cache(maxsize=None)
+def _on_tmpfs(directory: pathlib.Path) -> bool:
+    """True if directory lives on a RAM-backed filesystem (longest matching mount wins)."""
+    try:
+        mounts = pathlib.Path("/proc/self/mounts").read_text().splitlines()
+    except OSError:
+        return False
+    path = str(directory).rstrip("/") + "/"
+    best, fstype = "", ""
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        mount = fields[1].rstrip("/") + "/"
+        if path.startswith(mount) and len(mount) > len(best):
+            best, fstype = mount, fields[2]
+    return fstype in ("tmpfs", "ramfs")
+
+def _prefetch(bin_path: pathlib.Path) -> None:
+    """
+    Ask the kernel to start reading a cached binary back into the page cache
+    before it is exec'd, so short runs don't pay major faults. A binary
+    that was just compiled is still cached, and tmpfs is always in RAM.
+    """
+    if not hasattr(os, "posix_fadvise") or _on_tmpfs(bin_path.parent):
+        return
+    try:
+        fd = os.open(bin_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _compile_cached(code: str, flags: list[str],
+                    workdir: Optional[pathlib.Path] = None) -> pathlib.Path:
+    """
+    Compile code with flags, reusing a previously built binary when possible.
+
+    Args:
+        code: C++ source
+        flags: g++ flags; part of the cache key
+        workdir: Reusable scratch directory, see compile_and_run
+
+    Returns:
+        Path of the cached binary
+
+    Raises:
+        subprocess.CalledProcessError: If compilation fails
+    """
+    key = hashlib.sha256("\0".join([code, *flags, _gxx_version()]).encode()).hexdigest()
+    BIN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    bin_path = BIN_CACHE_DIR / f"{key}.out"
+    if bin_path.exists():
+        log.info(f"Compilation cache hit: {bin_path}")
+        touch(bin_path)
+        _prefetch(bin_path)
+        return bin_path
+
+    # Serialize concurrent compiles of the same key; the loser of the race
+    # finds the binary already in place once it gets the lock
+    with open(BIN_CACHE_DIR / f"{key}.lock", "w") as lock:
+        if FCNTL_AVAILABLE:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        if bin_path.exists():
+            log.info(f"Compilation cache hit: {bin_path}")
+            touch(bin_path)
+            return bin_path
+
+        # The binary is published atomically so readers never see a partial file
+        staged = BIN_CACHE_DIR / f"{key}.{os.getpid()}.tmp"
+        log.info("Starting compilation...")
+        try:
+            _compile(code, flags, staged, workdir)
+        except BaseException:
+            staged.unlink(missing_ok=True)
+            raise
+        log.info("Compilation successful")
+        os.replace(staged, bin_path)
+    evict_lru(BIN_CACHE_DIR, BIN_CACHE_MAX_BYTES, keep=bin_path, companions=(".lock",))
+    return bin_path
+
+class CompilePool:
+    """
+    Warm worker processes that compile candidate programs in parallel.
+
+    Workers share the on-disk binary cache, so a program compiled by one
+    is a cache hit for every later caller.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Start the pool.
+
+        Args:
+            max_workers: Number of compile processes (default: CPU count)
+        """
+        self._executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+
+    def submit(self, code: str, flags: list[str]) -> "Future[pathlib.Path]":
+        """Schedule a compile; the future resolves to the cached binary path."""
+        return self._executor.submit(_compile_cached, code, list(flags))
+
+    def compile(self, code: str, flags: list[str]) -> pathlib.Path:
+        """Compile in a worker and wait for the binary path."""
+        return self.submit(code, flags).result()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self) -> "CompilePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+# Cap on captured stdout/stderr per stream of helper tools (g++, perf, gprof);
+# candidate programs use Settings.max_output_bytes
+OUTPUT_LIMIT_BYTES = 8 * 1024 * 1024
+
+class OutputLimitExceeded(subprocess.SubprocessError):
+    """Raised by _run_bounded after killing a child whose output exceeded the limit."""
+
+    def __init__(self, cmd: list[str], limit: int, output: bytes = b"", stderr: bytes = b""):
+        self.cmd = cmd
+        self.limit = limit
+        self.output = output  # what was read before the kill, truncated to limit
+        self.stderr = stderr
+        super().__init__(f"Output of {cmd[0]} exceeded {limit} bytes")
 
-# Last 2 flags help the compiler to perform auto-vectorization
-COMPILE_FLAGS = ["-O3", "-std=c++17", "-march=native", "-ffast-math"]
+class _RingBuffer:
+    """Keeps the last `limit` bytes written, dropping the oldest chunks."""
 
-def compile_and_run(code: str, input_data: str, timeout: int) -> tuple[str]:
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.chunks: deque = deque()
+        self.size = 0
+        self.dropped = 0
+
+    def extend(self, chunk: bytes) -> None:
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+        while self.size > self.limit:
+            excess = self.size - self.limit
+            head = self.chunks[0]
+            if len(head) <= excess:
+                self.chunks.popleft()
+                cut = len(head)
+            else:
+                self.chunks[0] = head[excess:]
+                cut = excess
+            self.size -= cut
+            self.dropped += cut
+
+    def __bytes__(self) -> bytes:
+        return b"".join(self.chunks)
+
+def _spawn(cmd: list[str], stdin_fd: int, stdout_fd: int, stderr_fd: int,
+           cwd: Optional[str] = None, env: Optional[dict] = None):
+    """
+    Start cmd with the given descriptors as its stdio.
+
+    Uses os.posix_spawnp, which glibc implements with vfork-style clone, so
+    a large parent never has its page tables copied. Falls back to Popen
+    when a cwd is required (posix_spawn cannot chdir) or spawning fails.
+
+    Returns:
+        Tuple of (kill, wait) callables; wait returns the exit code
+        (negative signal number if killed, as with Popen)
+    """
+    if POSIX_SPAWN_AVAILABLE and cwd is None:
+        try:
+            pid = os.posix_spawnp(cmd[0], cmd, os.environ if env is None else env, file_actions=[
+                (os.POSIX_SPAWN_DUP2, stdin_fd, 0),
+                (os.POSIX_SPAWN_DUP2, stdout_fd, 1),
+                (os.POSIX_SPAWN_DUP2, stderr_fd, 2),
+            ], setsigdef=_RESTORED_SIGNALS)
+        except OSError as e:
+            log.debug(f"posix_spawn failed ({e}), falling back to subprocess")
+        else:
+            def kill() -> None:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+            def wait() -> int:
+                return os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+
+            return kill, wait
+
+    # Every fd this process opens is close-on-exec (PEP 446, and see
+    # utils/logger.py), so skip Popen's per-spawn scan that closes them
+    proc = subprocess.Popen(cmd, stdin=stdin_fd, stdout=stdout_fd, stderr=stderr_fd, cwd=cwd, env=env,
+                            close_fds=False)
+    return proc.kill, proc.wait
+
+def _run_bounded(cmd: list[str], input_data: bytes, timeout: Optional[float],
+                 limit: int = OUTPUT_LIMIT_BYTES, cwd: Optional[str] = None,
+                 env: Optional[dict] = None, keep_tail: bool = False) -> tuple[bytes, bytes, int]:
+    """
+    Run cmd feeding input_data, draining its output into bounded buffers.
+
+    Unlike subprocess.run(capture_output=True) memory stays capped. By
+    default the process is killed as soon as either stream exceeds limit;
+    with keep_tail it runs on and only the last limit bytes are kept. The
+    process is always killed when the wall-clock budget runs out.
+
+    Args:
+        cmd: Command to execute
+        input_data: Bytes written to the child's stdin
+        timeout: Wall-clock budget in seconds (None for no limit)
+        limit: Maximum bytes kept per output stream
+        keep_tail: Ring-buffer the output instead of killing on overflow
+        cwd: Working directory of the child
+        env: Environment of the child (default: inherited)
+
+    Returns:
+        Tuple of (stdout, stderr, returncode)
+
+    Raises:
+        subprocess.TimeoutExpired: If the budget is exceeded
+        OutputLimitExceeded: If a stream exceeded limit (not with keep_tail);
+            carries the truncated output
+    """
+    in_r, in_w = os.pipe()
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    try:
+        kill, wait = _spawn(cmd, in_r, out_w, err_w, cwd, env)
+    except BaseException:
+        for fd in (in_w, out_r, err_r):
+            os.close(fd)
+        raise
+    finally:
+        # Child ends belong to the child now
+        for fd in (in_r, out_w, err_w):
+            os.close(fd)
+
+    buffers = {fd: _RingBuffer(limit) if keep_tail else bytearray() for fd in (out_r, err_r)}
+    pending = memoryview(input_data)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    open_fds = {in_w, out_r, err_r}
+    overflowed = False
+
+    def close(fd: int) -> None:
+        if fd in open_fds:
+            open_fds.discard(fd)
+            os.close(fd)
+
+    try:
+        with selectors.DefaultSelector() as sel:
+            for fd in buffers:
+                os.set_blocking(fd, False)
+                sel.register(fd, selectors.EVENT_READ)
+            if pending:
+                os.set_blocking(in_w, False)
+                sel.register(in_w, selectors.EVENT_WRITE)
+            else:
+                close(in_w)
+
+            while sel.get_map():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                for key, _ in sel.select(remaining):
+                    fd = key.fileobj
+                    if fd == in_w:
+                        try:
+                            pending = pending[os.write(fd, pending[:65536]):]
+                        except BrokenPipeError:
+                            pending = pending[:0]
+                        if not pending:
+                            sel.unregister(fd)
+                            close(fd)
+                        continue
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        sel.unregister(fd)
+                        close(fd)
+                        continue
+                    buf = buffers[fd]
+                    if not keep_tail and len(buf) + len(chunk) > limit:
+                        buf.extend(chunk[:limit - len(buf)])
+                        log.warning(f"Output exceeded {limit} bytes, killing process")
+                        overflowed = True
+                        kill()
+                        for other in list(sel.get_map()):
+                            sel.unregister(other)
+                        break
+                    buf.extend(chunk)
+    except BaseException:
+        # Timeout or any other error: never leave the child running or unreaped
+        kill()
+        wait()
+        raise
+    finally:
+        for fd in list(open_fds):
+            close(fd)
+
+    returncode = wait()
+    if overflowed:
+        raise OutputLimitExceeded(cmd, limit, bytes(buffers[out_r]), bytes(buffers[err_r]))
+    if keep_tail:
+        for name, fd in (("stdout", out_r), ("stderr", err_r)):
+            if buffers[fd].dropped:
+                log.warning(f"Dropped the first {buffers[fd].dropped} bytes of {name}")
+    return bytes(buffers[out_r]), bytes(buffers[err_r]), returncode
+
+def compile_and_run(code: str, input_data: str, timeout: int,
+                    workdir: Optional[pathlib.Path] = None,
+                    opt: Literal["fast", "final"] = "final",
+                    pool: Optional[CompilePool] = None) -> tuple[str]:
     """
     Generates optimized code, good for checking total runtime.
+    Pass workdir to reuse one scratch directory across a whole solve loop
+    instead of creating a fresh one per call. The default opt="final" uses
+    the full COMPILE_FLAGS (-O3); pass opt="fast" for cheap -O2 builds in
+    correctness/complexity checks.
+    With a pool the compile runs in one of its warm workers.
     """
-    log.info(f"Starting compilation and execution with timeout: {timeout}s")
-    log.info(f"Input data: {repr(input_data)}")
+    return compile_once_run_many(code, [input_data], timeout, workdir, opt, pool)[0]
+
+def compile_once_run_many(code: str, inputs: list[str], timeout: int,
+                          workdir: Optional[pathlib.Path] = None,
+                          opt: Literal["fast", "final"] = "final",
+                          pool: Optional[CompilePool] = None) -> list[tuple[str, str]]:
+    """
+    Compile code once and run the binary on each input in turn.
+
+    Args:
+        code: C++ source
+        inputs: stdin contents, one run per entry
+        timeout: Per-run wall-clock budget in seconds
+        workdir: Reusable scratch directory, see compile_and_run
+        opt: Optimization level, see compile_and_run
+        pool: Compile in this CompilePool instead of in-process
+
+    Returns:
+        List of (stdout, stderr) aligned with inputs; on compile failure
+        every entry carries the compiler error
+    """
+    log.info(f"Starting compilation and execution of {len(inputs)} inputs with timeout: {timeout}s")
     log.info(f"Code length: {len(code)} characters")
 
-    with tempfile.TemporaryDirectory() as tmp:
-        src_path = pathlib.Path(tmp) / "main.cpp"
-        bin_path = pathlib.Path(tmp) / "a.out"
+    try:
+        if pool is not None:
+            bin_path = pool.compile(code, _OPT_FLAGS[opt])
+        else:
+            bin_path = _compile_cached(code, _OPT_FLAGS[opt], workdir)
+    except subprocess.CalledProcessError as e:
+        error_msg = f"Compilation failed: {e.stderr.decode(errors='replace') if e.stderr else 'Unknown error'}"
+        log.error(error_msg)
+        log.error(f"Return code: {e.returncode}")
+        if e.stdout:
+            log.error(f"stdout: {e.stdout.decode(errors='replace')}")
+        if e.stderr:
+            log.error(f"stderr: {e.stderr.decode(errors='replace')}")
+        return [("", error_msg)] * len(inputs)
+    except Exception as e:
+        error_msg = f"Execution failed: {e}"
+        log.error(error_msg)
+        log.error(f"Exception type: {type(e).__name__}")
+        return [("", error_msg)] * len(inputs)
+
+    run_cmd = _limited_cmd(bin_path, timeout)
+    log.info(f"Execution command: {' '.join(shlex.quote(c) for c in run_cmd)}")
+    return [_execute(run_cmd, input_data, timeout) for input_data in inputs]
+
+@lru_cache(maxsize=None)
+def _build_limiter() -> Optional[str]:
+    """Build the setrlimit launcher once per process; a failed build is cached too."""
+    try:
+        return str(_compile_cached(_LIMITER_SRC, FAST_FLAGS))
+    except subprocess.CalledProcessError as e:
+        log.warning(f"Could not build the resource limiter, running without limits: {e.stderr!r}")
+        return None
+
+def _limiter() -> Optional[str]:
+    """Path of the setrlimit launcher, or None if it cannot be built."""
+    limiter = _build_limiter()
+    if limiter is not None and not os.path.exists(limiter):
+        # Evicted from the binary cache since it was built
+        _build_limiter.cache_clear()
+        limiter = _build_limiter()
+    return limiter
+
+def _limited_cmd(bin_path: pathlib.Path, timeout: int) -> list[str]:
+    """
+    Command running bin_path under the setrlimit launcher.
+
+    The wall-clock timeout itself is enforced by _run_bounded; the launcher
+    adds the CPU, memory and stack caps. If it cannot be built the binary
+    runs uncapped.
+    """
+    limiter = _limiter()
+    if limiter is None:
+        return [str(bin_path)]
+    return [limiter, "--cpu", str(timeout), "--mem", str(get_settings().sandbox_mem_mb),
+            "--stack", str(RUN_STACK_BYTES), "--", str(bin_path)]
+
+@lru_cache(maxsize=None)
+def _profile_cpu() -> Optional[int]:
+    """Settings.profile_cpu, else the first CPU isolated from the scheduler (isolcpus=)."""
+    cpu = get_settings().profile_cpu
+    if cpu is not None:
+        return cpu
+    try:
+        isolated = pathlib.Path("/sys/devices/system/cpu/isolated").read_text().strip()
+    except OSError:
+        return None
+    # cpulist format, e.g. "2-3,6"
+    return int(isolated.split(",")[0].split("-")[0]) if isolated else None
+
+def _profiled_cmd(bin_path: pathlib.Path) -> list[str]:
+    """
+    Command for a profiling run: the program gets the same deep stack as in
+    compile_and_run and is pinned to _profile_cpu() when one is configured.
+    Compiles are not pinned, so parallel g++ still uses every core.
+    """
+    limiter = _limiter()
+    if limiter is None:
+        return [str(bin_path)]
+    cmd = [limiter, "--stack", str(RUN_STACK_BYTES)]
+    cpu = _profile_cpu()
+    if cpu is not None:
+        cmd += ["--affinity", str(cpu)]
+    return cmd + ["--", str(bin_path)]
+
+def compile_and_run_batch(codes: list[str], inputs: list[str], timeout: int,
+                          opt: Literal["fast", "final"] = "final",
+                          max_workers: Optional[int] = None) -> list[tuple[str, str]]:
+    """
+    Compile and run several candidate programs concurrently.
+
+    Each candidate is an independent compile_and_run in a worker thread (the
+    work is subprocess-bound, so the GIL is not a bottleneck). Identical
+    sources share one binary through the on-disk cache.
+
+    Args:
+        codes: C++ sources, one per candidate
+        inputs: stdin contents aligned with codes
+        timeout: Per-run wall-clock budget in seconds
+        opt: Optimization level, see compile_and_run
+        max_workers: Number of concurrent candidates (default: CPU count)
+
+    Returns:
+        List of (stdout, stderr) aligned with codes
+    """
+    if len(codes) != len(inputs):
+        raise ValueError(f"Got {len(codes)} programs but {len(inputs)} inputs")
+    log.info(f"Starting batch of {len(codes)} programs")
+    # No shared workdir: concurrent ccache builds would overwrite each other's main.cpp
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(lambda pair: compile_and_run(pair[0], pair[1], timeout, opt=opt),
+                                 zip(codes, inputs)))
+
+def _execute(run_cmd: list[str], input_data: str, timeout: int) -> tuple[str, str]:
+    """Run one compiled program on input_data, mapping failures to ("", message)."""
+    log.info(f"Input data: {repr(input_data)}")
+    try:
+        log.info("Starting execution...")
+        out, err, returncode = _run_bounded(run_cmd, input_data.encode(), timeout,
+                                            limit=get_settings().max_output_bytes)
         
-        log.info(f"Writing code to: {src_path}")
-        src_path.write_text(code, encoding="utf-8")
+        stdout = out.decode(errors="replace")
+        stderr = err.decode(errors="replace")
         
-        compile_cmd = [shutil.which("g++")] + COMPILE_FLAGS + [str(src_path), "-o", str(bin_path)]
-        log.info(f"Compilation command: {' '.join(shlex.quote(c) for c in compile_cmd)}")
+        log.info(f"Execution completed with return code: {returncode}")
+        log.info(f"stdout: {repr(stdout)}")
+        log.info(f"stderr: {repr(stderr)}")
         
-        try:
-            log.info("Starting compilation...")
-            compile_result = subprocess.run(compile_cmd, check=True, capture_output=True)
-            log.info("Compilation successful")
-            
-            run_cmd = ["timeout", f"{timeout}", str(bin_path)] if shutil.which("timeout") else [str(bin_path)]
-            log.info(f"Execution command: {' '.join(shlex.quote(c) for c in run_cmd)}")
-            
-            log.info("Starting execution...")
-            res = subprocess.run(
-                run_cmd, input=input_data.encode(), capture_output=True, timeout=timeout
-            )
-            
-            stdout = str(res.stdout.decode())
-            stderr = str(res.stderr.decode())
-            
-            log.info(f"Execution completed with return code: {res.returncode}")
-            log.info(f"stdout: {repr(stdout)}")
-            log.info(f"stderr: {repr(stderr)}")
-            
-            return stdout, stderr
-            
-        except subprocess.CalledProcessError as e:
-            error_msg = f"Compilation failed: {e.stderr.decode() if e.stderr else 'Unknown error'}"
-            log.error(error_msg)
-            log.error(f"Return code: {e.returncode}")
-            if e.stdout:
-                log.error(f"stdout: {e.stdout.decode()}")
-            if e.stderr:
-                log.error(f"stderr: {e.stderr.decode()}")
-            return "", error_msg
-            
-        except subprocess.TimeoutExpired as e:
-            error_msg = f"Execution timed out after {timeout}s"
-            log.error(error_msg)
-            return "", error_msg
-            
-        except Exception as e:
-            error_msg = f"Execution failed: {e}"
-            log.error(error_msg)
-            log.error(f"Exception type: {type(e).__name__}")
-            return "", error_msg
-
-def compile_and_profile(code: str, input_data: str) -> str:
+        return stdout, stderr
+        
+    except subprocess.TimeoutExpired as e:
+        error_msg = f"Execution timed out after {timeout}s"
+        log.error(error_msg)
+        return "", error_msg
+        
+    except OutputLimitExceeded as e:
+        error_msg = "Output limit exceeded"
+        log.error(f"{error_msg} ({e.limit} bytes)")
+        return "", error_msg
+        
+    except Exception as e:
+        error_msg = f"Execution failed: {e}"
+        log.error(error_msg)
+        log.error(f"Exception type: {type(e).__name__}")
+        return "", error_msg
+
+def compile_and_profile(code: str, input_data: str,
+                        workdir: Optional[pathlib.Path] = None,
+                        sample_period_us: Optional[int] = None) -> str:
     """
     Generates code with debug and profiling information, don't use this to check runtime.
     Returns a string containing profiling information.
+    Uses perf sampling when available, else gprof (whose gmon.out is
+    written to workdir when given, else the current directory).
+    sample_period_us is the finest perf sampling period (default:
+    Settings.profile_sample_period_us).
     """
+    _, profile_output = _profile(code, input_data, workdir, sample_period_us)
+    log.info(f"Profile output length: {len(profile_output)} characters")
+    return profile_output
+
+def compile_and_profile_hotspots(code: str, input_data: str,
+                                 workdir: Optional[pathlib.Path] = None,
+                                 sample_period_us: Optional[int] = None,
+                                 top_k: int = HOTSPOT_TOP_K) -> dict[str, str]:
+    """
+    Profile like compile_and_profile, but return the hottest locations as
+    structured data instead of report text.
+
+    Args:
+        code: C++ source
+        input_data: stdin contents
+        workdir: Reusable scratch directory, see compile_and_profile
+        sample_period_us: Finest perf sampling period, see compile_and_profile
+        top_k: Number of locations kept
+
+    Returns:
+        Folded call stack (perf) or function name (gprof) mapped to its share
+        of the profile, ready for ProfileReport.hotspots; empty if only
+        gprof's text report was available
+    """
+    weights, _ = _profile(code, input_data, workdir, sample_period_us)
+    if not weights:
+        return {}
+    total = sum(weights.values()) or 1.0
+    top = sorted(weights.items(), key=lambda item: item[1], reverse=True)[:top_k]
+    return {location: f"{100 * weight / total:.1f}% of profile samples" for location, weight in top}
+
+def _profile(code: str, input_data: str, workdir: Optional[pathlib.Path],
+             sample_period_us: Optional[int]) -> tuple[Optional[dict[str, float]], str]:
+    """Run the available profiler; returns (weight per location, report text)."""
     log.info(f"Starting compilation and profiling")
     log.info(f"Input data: {repr(input_data)}")
     log.info(f"Code length: {len(code)} characters")
 
-    with tempfile.TemporaryDirectory() as tmp:
-        src_path = pathlib.Path(tmp) / "main.cpp"
-        bin_path = pathlib.Path(tmp) / "a.out"
-        
-        log.info(f"Writing code to: {src_path}")
-        src_path.write_text(code, encoding="utf-8")
-        
-        compile_cmd = [shutil.which("g++")] + COMPILE_FLAGS + ["-pg", "-g"] + [str(src_path), "-o", str(bin_path)]
-        log.info(f"Compilation command: {' '.join(shlex.quote(c) for c in compile_cmd)}")
-        
-        log.info("Starting compilation...")
-        subprocess.run(compile_cmd, check=True)
-        log.info("Compilation successful")
-        
-        run_cmd = [str(bin_path)]
-        log.info(f"Execution command: {' '.join(shlex.quote(c) for c in run_cmd)}")
-        
-        log.info("Starting execution...")
-        subprocess.run(run_cmd, input=input_data.encode(), capture_output=True)
-        log.info("Execution completed")
-        
-        prof_cmd = [shutil.which("gprof"), "-l", bin_path]
+    if _perf_usable():
+        if sample_period_us is None:
+            sample_period_us = get_settings().profile_sample_period_us
+        profile = _profile_perf(code, input_data, workdir, sample_period_us)
+        if profile is not None:
+            return profile
+        log.warning("perf profiling failed, falling back to gprof")
+
+    return _profile_gprof(code, input_data, workdir)
+
+def _perf_usable() -> bool:
+    """True if perf is installed and the kernel lets this user sample itself."""
+    if not shutil.which("perf"):
+        return False
+    if os.geteuid() == 0:
+        return True
+    try:
+        paranoid = int(pathlib.Path("/proc/sys/kernel/perf_event_paranoid").read_text())
+    except (OSError, ValueError):
+        return False
+    # Levels above 2 forbid unprivileged perf_event_open entirely
+    return paranoid <= 2
+
+def _profile_perf(code: str, input_data: str, workdir: Optional[pathlib.Path],
+                  sample_period_us: int) -> Optional[tuple[dict[str, int], str]]:
+    """
+    Sample the program with perf record; no -pg instrumentation is needed.
+
+    Short programs yield few samples at a coarse period, so the period
+    starts PERF_PERIOD_BACKOFF x above sample_period_us and is halved
+    (re-running the program) until PERF_MIN_SAMPLES are collected or the
+    configured period is reached.
+
+    Returns:
+        (period per folded call stack, report text), where the report lists
+        the folded stacks after a "# samples" header line; None if perf
+        could not record
+    """
+    bin_path = _compile_cached(code, PERF_FLAGS, workdir)
+    perf = shutil.which("perf")
+    period_us = sample_period_us * PERF_PERIOD_BACKOFF
+
+    with _scratch(workdir) as tmp:
+        data_path = pathlib.Path(tmp) / "perf.data"
+        while True:
+            freq = max(1, round(1_000_000 / period_us))
+            rec_cmd = [perf, "record", "-q", "-F", str(freq), "--call-graph=fp",
+                       "-o", str(data_path), "--", *_profiled_cmd(bin_path)]
+            log.info(f"Profiling command: {' '.join(shlex.quote(c) for c in rec_cmd)}")
+
+            log.info("Starting execution...")
+            _, rec_err, rec_code = _run_bounded(rec_cmd, input_data.encode(), None,
+                                                limit=get_settings().max_output_bytes, keep_tail=True)
+            log.info("Execution completed")
+            if rec_code != 0 or not data_path.exists():
+                log.warning(f"perf record failed: {rec_err.decode(errors='replace')}")
+                return None
+
+            script_cmd = [perf, "script", "-F", "period,ip,sym", "-i", str(data_path)]
+            try:
+                script, _, _ = _run_bounded(script_cmd, b"", None)
+            except OutputLimitExceeded as e:
+                script = e.output  # fold the samples that fit
+            folded, samples = _fold_perf_script(script.decode(errors="replace"))
+            log.info(f"Collected {samples} samples at {period_us}us period")
+            if samples >= PERF_MIN_SAMPLES or period_us // 2 < sample_period_us:
+                break
+            period_us //= 2
+
+        data_path.unlink(True)
+    # Folded stacks ("a;b;c period") are compact and easy for agents to read;
+    # the sample count lets consumers discount low-confidence profiles
+    lines = [f"# samples: {samples}, sample period: {period_us}us"]
+    lines += [f"{stack} {period}" for stack, period in
+              sorted(folded.items(), key=lambda item: item[1], reverse=True)]
+    return folded, "\n".join(lines) + "\n"
+
+def _fold_perf_script(script: str) -> tuple[dict[str, int], int]:
+    """
+    Fold `perf script -F period,ip,sym` output into call stacks.
+
+    Each sample is a period line followed by one "ip sym" line per frame
+    (innermost first) and a blank line; without call chains the frame is on
+    the period line itself.
+
+    Returns:
+        (summed period per root-first ";"-joined stack, number of samples)
+    """
+    folded: dict[str, int] = {}
+    samples = 0
+    for block in script.split("\n\n"):
+        lines = block.strip("\n").splitlines()
+        if not lines or not lines[0].split():
+            continue
+        head = lines[0].split()
+        try:
+            period = int(head[0])
+        except ValueError:
+            continue
+        frames = [line.split(maxsplit=1) for line in lines[1:]] or [head[1:]]
+        stack = ";".join(frame[1] if len(frame) > 1 else "[unknown]" for frame in reversed(frames) if frame)
+        folded[stack] = folded.get(stack, 0) + period
+        samples += 1
+    return folded, samples
+
+def _profile_gprof(code: str, input_data: str,
+                   workdir: Optional[pathlib.Path] = None) -> tuple[Optional[dict[str, float]], str]:
+    """
+    Fallback profiler: -pg instrumented build, with gmon.out read in-process
+    into a per-function flat profile; gprof's line report is only run if
+    the file cannot be parsed (and then no per-function times are returned).
+    """
+    bin_path = _compile_cached(code, PROFILE_FLAGS, workdir)
+    gmon_path = pathlib.Path(workdir or pathlib.Path.cwd()) / "gmon.out"
+    
+    run_cmd = _profiled_cmd(bin_path)
+    log.info(f"Execution command: {' '.join(shlex.quote(c) for c in run_cmd)}")
+    
+    log.info("Starting execution...")
+    _run_bounded(run_cmd, input_data.encode(), None, limit=get_settings().max_output_bytes,
+                 cwd=workdir and str(workdir), keep_tail=True)
+    log.info("Execution completed")
+    
+    log.info("Starting profiling...")
+    seconds = None
+    try:
+        seconds = parse_gmon(gmon_path, bin_path)
+        profile_output = _format_flat_profile(seconds)
+    except (OSError, ValueError) as e:
+        log.warning(f"Could not parse {gmon_path} ({e}), running gprof")
+        prof_cmd = [shutil.which("gprof"), "-l", str(bin_path), str(gmon_path)]
         log.info(f"Profiling command: {' '.join(shlex.quote(c) for c in prof_cmd)}")
-        
-        log.info("Starting profiling...")
-        proc = subprocess.run(prof_cmd, capture_output=True)
-        log.info("Profiling completed")
-        
-        (pathlib.Path.cwd() / "gmon.out").unlink(True)
-        profile_output = str(proc.stdout.decode())
-        
-        log.info(f"Profile output length: {len(profile_output)} characters")
-        return profile_output
\ No newline at end of file
+        try:
+            report, _, _ = _run_bounded(prof_cmd, b"", None)
+        except OutputLimitExceeded as e:
+            report = e.output  # the flat profile comes first
+        profile_output = report.decode(errors="replace")
+    log.info("Profiling completed")
+    
+    gmon_path.unlink(True)
+    return seconds, profile_output
+
+def _format_flat_profile(seconds: dict[str, float]) -> str:
+    """Render parse_gmon's per-function self times like gprof's flat profile."""
+    total = sum(seconds.values()) or 1.0
+    lines = ["Flat profile:", "", "  %   self", " time  seconds  name"]
+    lines += [f"{100 * t / total:5.1f} {t:8.2f}  {name}" for name, t in seconds.items()]
+    return "\n".join(lines) + "\n"
@@ -4,134 +4,48 @@ swiftsolve.schemas  •  Unified Pydantic-v2 message contracts
 These classes are **the only canonical interface** by which agents, the
 controller, and the FastAPI layer exchange data.  DO NOT modify field
 names or enum literals without bumping `SCHEMA_VERSION`.
+
+Building a Pydantic model is costly at import time, so each payload lives
+in its own private module and is only imported the first time it is
+looked up here (PEP 562 module `__getattr__`).
 """
 from __future__ import annotations
 
-from enum import Enum
-from typing import Dict, List, Optional, Literal
-from datetime import datetime, timezone
-
-from pydantic import BaseModel, Field, ConfigDict, constr
-
-SCHEMA_VERSION = "1.0.0"
-
-# --------------------------------------------------------------------------- #
-# 🔸 Enumerations
-# --------------------------------------------------------------------------- #
-class MessageType(str, Enum):
-    PLAN            = "plan"
-    CODE            = "code"
-    PROFILE_REPORT  = "profile_report"
-    VERDICT         = "verdict"
-    RUN_RESULT      = "run_result"          # API response only
-
-
-class TargetAgent(str, Enum):
-    PLANNER = "PLANNER"
-    CODER   = "CODER"
-
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-class RunStatus(str, Enum):
-    SUCCESS               = "success"
-    STATIC_PRUNE_FAILED   = "static_prune_failed"
-    FAILED                = "failed"
-    SANDBOX_ERROR         = "sandbox_error"
+from ._core import SCHEMA_VERSION, MessageType, TargetAgent, RunStatus
 
+if TYPE_CHECKING:
+    from ._plan import PlanMessage
+    from ._code import CodeMessage
+    from ._profile import ProfileReport
+    from ._verdict import VerdictMessage
+    from ._api import ProblemInput, RunResult
 
 # --------------------------------------------------------------------------- #
-# 🔸 Core envelope mixed into every on-loop message
+# 🔸 Lazily imported payloads: name -> defining module
 # --------------------------------------------------------------------------- #
-class _BaseMessage(BaseModel):
-    model_config = ConfigDict(extra="forbid", frozen=True)
+_LAZY = {
+    "PlanMessage":    "._plan",
+    "CodeMessage":    "._code",
+    "ProfileReport":  "._profile",
+    "VerdictMessage": "._verdict",
+    "ProblemInput":   "._api",
+    "RunResult":      "._api",
+}
 
-    type: MessageType                       = Field(..., description="Message discriminator")
-    task_id: constr(strip_whitespace=True)  = Field(..., examples=["B001"])
-    iteration: int                          = Field(..., ge=0)
-    timestamp_utc: datetime                 = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
-        description="ISO-8601 UTC timestamp",
-    )
-    schema_version: Literal["1.0.0"] = Field(default=SCHEMA_VERSION, description="Schema version")
-
-
-# --------------------------------------------------------------------------- #
-# 🔸 Concrete payloads
-# --------------------------------------------------------------------------- #
-class PlanMessage(_BaseMessage):
-    type: Literal[MessageType.PLAN] = Field(default=MessageType.PLAN)
-    problem_statement: str
-    algorithm: str
-    input_bounds: Dict[str, int]            = Field(..., examples=[{"n": 100000}])
-    constraints: Dict[str, int]             = Field(
-        ..., description="e.g. {'runtime_limit': 2000, 'memory_limit': 512}"
-    )
-    retrieval_templates: Optional[List[str]] = None
-    algorithm_id: Optional[str]              = Field(
-        None, description="Canonical ID if retrieved from a template bank"
-    )
-    model_version: Optional[str]             = None   # claude build hash
-    seed: Optional[int]                      = None   # future reproducibility
-
-
-class CodeMessage(_BaseMessage):
-    type: Literal[MessageType.CODE] = Field(default=MessageType.CODE)
-    code_cpp: str                            = Field(..., description="ISO C++17 source code")
-    compiler_flags: List[str]                = Field(default_factory=lambda: ["-O2", "-std=c++17"])
-    model_version: Optional[str]             = None   # gpt-4.1 build hash
-    seed: Optional[int]                      = None
-
-
-class ProfileReport(_BaseMessage):
-    type: Literal[MessageType.PROFILE_REPORT] = Field(default=MessageType.PROFILE_REPORT)
-    input_sizes: List[int]
-    runtime_ms: List[float]
-    peak_memory_mb: List[float]
-    hotspots: Dict[str, str]                 = Field(
-        default_factory=dict,
-        description="Maps code locations (e.g., 'line_23') to human hints",
-    )
-
-
-class VerdictMessage(_BaseMessage):
-    type: Literal[MessageType.VERDICT] = Field(default=MessageType.VERDICT)
-    efficient: bool
-    target_agent: Optional[TargetAgent]      = Field(None, description="Receiver of next patch")
-    patch: Optional[str]                     = None
-    perf_gain: Optional[float]               = Field(
-        None, ge=0.0, le=1.0, description="Fractional improvement vs previous iter"
-    )
-
-
-# --------------------------------------------------------------------------- #
-# 🔸 External-facing payloads
-# --------------------------------------------------------------------------- #
-class ProblemInput(BaseModel):
-    """Inbound object for FastAPI /solve."""
-    model_config = ConfigDict(extra="forbid", frozen=True)
+__all__ = ["SCHEMA_VERSION", "MessageType", "TargetAgent", "RunStatus", *_LAZY]
 
-    task_id: constr(strip_whitespace=True)
-    prompt: str
-    constraints: Dict[str, int]              = Field(..., examples=[{"runtime_limit": 2000}])
-    unit_tests: List[Dict[str, str]]
 
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip this hook
+    return value
 
-class RunResult(BaseModel):
-    """Outbound object returned by /solve."""
-    model_config = ConfigDict(extra="forbid", frozen=True)
 
-    type: Literal[MessageType.RUN_RESULT] = Field(default=MessageType.RUN_RESULT)
-    task_id: str
-    status: RunStatus
-    timestamp_utc: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
-        description="ISO-8601 UTC timestamp"
-    )
-    schema_version: Literal["1.0.0"] = Field(default=SCHEMA_VERSION)
-    
-    # Success results
-    code_cpp: Optional[str] = None
-    profile: Optional[ProfileReport] = None
-    
-    # Failure details
-    error_message: Optional[str] = None
-    last_verdict: Optional[Dict] = None
\ No newline at end of file
+def __dir__():
+    return __all__
@@ -0,0 +1,44 @@
+"""
+swiftsolve.schemas._api  •  External-facing payloads of the FastAPI layer
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Literal
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, Field, ConfigDict, constr
+
+from ._core import SCHEMA_VERSION, MessageType, RunStatus
+from ._profile import ProfileReport
+
+
+class ProblemInput(BaseModel):
+    """Inbound object for FastAPI /solve."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    task_id: constr(strip_whitespace=True)
+    prompt: str
+    constraints: Dict[str, int]              = Field(..., examples=[{"runtime_limit": 2000}])
+    unit_tests: List[Dict[str, str]]
+
+
+class RunResult(BaseModel):
+    """Outbound object returned by /solve."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    type: Literal[MessageType.RUN_RESULT] = Field(default=MessageType.RUN_RESULT)
+    task_id: str
+    status: RunStatus
+    timestamp_utc: datetime = Field(
+        default_factory=lambda: datetime.now(tz=timezone.utc),
+        description="ISO-8601 UTC timestamp"
+    )
+    schema_version: Literal["1.0.0"] = Field(default=SCHEMA_VERSION)
+    
+    # Success results
+    code_cpp: Optional[str] = None
+    profile: Optional[ProfileReport] = None
+    
+    # Failure details
+    error_message: Optional[str] = None
+    last_verdict: Optional[Dict] = None
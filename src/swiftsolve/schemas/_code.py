@@ -0,0 +1,18 @@
+"""
+swiftsolve.schemas._code  •  Coder output
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Literal
+
+from pydantic import Field
+
+from ._core import MessageType, _BaseMessage
+
+
+class CodeMessage(_BaseMessage):
+    type: Literal[MessageType.CODE] = Field(default=MessageType.CODE)
+    code_cpp: str                            = Field(..., description="ISO C++17 source code")
+    compiler_flags: List[str]                = Field(default_factory=lambda: ["-O2", "-std=c++17"])
+    model_version: Optional[str]             = None   # gpt-4.1 build hash
+    seed: Optional[int]                      = None
@@ -0,0 +1,50 @@
+"""
+swiftsolve.schemas._core  •  Enumerations and the shared message envelope
+"""
+from __future__ import annotations
+
+from enum import Enum
+from typing import Literal
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, Field, ConfigDict, constr
+
+SCHEMA_VERSION = "1.0.0"
+
+# --------------------------------------------------------------------------- #
+# 🔸 Enumerations
+# --------------------------------------------------------------------------- #
+class MessageType(str, Enum):
+    PLAN            = "plan"
+    CODE            = "code"
+    PROFILE_REPORT  = "profile_report"
+    VERDICT         = "verdict"
+    RUN_RESULT      = "run_result"          # API response only
+
+
+class TargetAgent(str, Enum):
+    PLANNER = "PLANNER"
+    CODER   = "CODER"
+
+
+class RunStatus(str, Enum):
+    SUCCESS               = "success"
+    STATIC_PRUNE_FAILED   = "static_prune_failed"
+    FAILED                = "failed"
+    SANDBOX_ERROR         = "sandbox_error"
+
+
+# --------------------------------------------------------------------------- #
+# 🔸 Core envelope mixed into every on-loop message
+# --------------------------------------------------------------------------- #
+class _BaseMessage(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    type: MessageType                       = Field(..., description="Message discriminator")
+    task_id: constr(strip_whitespace=True)  = Field(..., examples=["B001"])
+    iteration: int                          = Field(..., ge=0)
+    timestamp_utc: datetime                 = Field(
+        default_factory=lambda: datetime.now(tz=timezone.utc),
+        description="ISO-8601 UTC timestamp",
+    )
+    schema_version: Literal["1.0.0"] = Field(default=SCHEMA_VERSION, description="Schema version")
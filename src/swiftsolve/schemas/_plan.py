@@ -0,0 +1,26 @@
+"""
+swiftsolve.schemas._plan  •  Planner output
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Literal
+
+from pydantic import Field
+
+from ._core import MessageType, _BaseMessage
+
+
+class PlanMessage(_BaseMessage):
+    type: Literal[MessageType.PLAN] = Field(default=MessageType.PLAN)
+    problem_statement: str
+    algorithm: str
+    input_bounds: Dict[str, int]            = Field(..., examples=[{"n": 100000}])
+    constraints: Dict[str, int]             = Field(
+        ..., description="e.g. {'runtime_limit': 2000, 'memory_limit': 512}"
+    )
+    retrieval_templates: Optional[List[str]] = None
+    algorithm_id: Optional[str]              = Field(
+        None, description="Canonical ID if retrieved from a template bank"
+    )
+    model_version: Optional[str]             = None   # claude build hash
+    seed: Optional[int]                      = None   # future reproducibility
@@ -0,0 +1,21 @@
+"""
+swiftsolve.schemas._profile  •  Profiler output
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Literal
+
+from pydantic import Field
+
+from ._core import MessageType, _BaseMessage
+
+
+class ProfileReport(_BaseMessage):
+    type: Literal[MessageType.PROFILE_REPORT] = Field(default=MessageType.PROFILE_REPORT)
+    input_sizes: List[int]
+    runtime_ms: List[float]
+    peak_memory_mb: List[float]
+    hotspots: Dict[str, str]                 = Field(
+        default_factory=dict,
+        description="Maps code locations (e.g., 'line_23') to human hints",
+    )
@@ -0,0 +1,20 @@
+"""
+swiftsolve.schemas._verdict  •  Analyst output
+"""
+from __future__ import annotations
+
+from typing import Optional, Literal
+
+from pydantic import Field
+
+from ._core import MessageType, TargetAgent, _BaseMessage
+
+
+class VerdictMessage(_BaseMessage):
+    type: Literal[MessageType.VERDICT] = Field(default=MessageType.VERDICT)
+    efficient: bool
+    target_agent: Optional[TargetAgent]      = Field(None, description="Receiver of next patch")
+    patch: Optional[str]                     = None
+    perf_gain: Optional[float]               = Field(
+        None, ge=0.0, le=1.0, description="Fractional improvement vs previous iter"
+    )
@@ -1,10 +1,26 @@
 # static_pruner/pruner.py
-import ast, re
+from functools import lru_cache
+from typing import Optional
 from ..schemas import PlanMessage
 from ..utils.logger import get_logger
 
 log = get_logger("StaticPruner")
-_BAD_SORT_LOOP = re.compile(r"for .* in .*:.*sort\(.*\)", re.S)
+
+# "for ... in ...: ... sort(...)" as ordered literal fragments; scanning with
+# str.find is linear in the plan length, unlike the backtracking regex
+# r"for .* in .*:.*sort\(.*\)" it replaces
+_SORT_IN_LOOP = ("for ", " in ", ":", "sort(", ")")
+
+
+def _in_order(text: str, fragments: tuple) -> bool:
+    """True if all fragments occur in text, in order and without overlap."""
+    pos = 0
+    for fragment in fragments:
+        pos = text.find(fragment, pos)
+        if pos < 0:
+            return False
+        pos += len(fragment)
+    return True
 
 def validate(plan: PlanMessage) -> bool:
     """
@@ -18,20 +34,34 @@ def validate(plan: PlanMessage) -> bool:
     log.info(f"Algorithm: {algo}")
     log.info(f"Input bound n: {n}")
     
-    # Check for while loop issues
-    if "while" in algo and "while" in algo.count("while") > 2 and n >= 1e5:
-        log.warning(f"Rejecting plan: too many while loops ({algo.count('while')}) with large n ({n})")
+    # Logged here rather than in the cached helper, so cache hits say why too
+    reason = _rejection_reason(algo, n)
+    if reason is not None:
+        log.warning(f"Rejecting plan: {reason}")
         return False
+    return True
+
+
+@lru_cache(maxsize=1024)
+def _rejection_reason(algo: str, n: int) -> Optional[str]:
+    """
+    Why the heuristics reject a plan, or None to accept it.
+    
+    Cached on the only plan fields the heuristics read, so identical
+    re-plans (which differ in timestamp) reuse the result. Kept free of
+    side effects, since cache hits skip the body.
+    """
+    # Check for while loop issues
+    while_count = algo.count("while")
+    if while_count > 2 and n >= 1e5:
+        return f"too many while loops ({while_count}) with large n ({n})"
     
     # Check for recursion issues
     if "recursion" in algo and n >= 1e4:
-        log.warning(f"Rejecting plan: recursion with large n ({n})")
-        return False
+        return f"recursion with large n ({n})"
     
     # Check for sort-in-loop issues
-    if _BAD_SORT_LOOP.search(algo) and n >= 1e3:
-        log.warning(f"Rejecting plan: sort in loop pattern detected with n ({n})")
-        return False
+    if n >= 1e3 and _in_order(algo, _SORT_IN_LOOP):
+        return f"sort in loop pattern detected with n ({n})"
     
-    log.info("Static pruner approved plan")
-    return True
\ No newline at end of file
+    return None
@@ -0,0 +1,62 @@
+"""Tests for recording benchmark results in the batch runner."""
+
+from swiftsolve.evaluation.batch_runner import BatchRunner
+from swiftsolve.schemas import ProfileReport
+from swiftsolve.utils.jsonio import loads
+
+
+def _successful_result():
+    """A job result as run_benchmark sees it for a successful pipeline run."""
+    profile = ProfileReport(
+        task_id="T1",
+        iteration=1,
+        input_sizes=[1000, 10000],
+        runtime_ms=[12.0, 150.0],
+        peak_memory_mb=[3.0, 40.0],
+    )
+    return {
+        'task_id': "T1",
+        'seed': 0,
+        'run_id': 0,
+        'result': {"status": "success", "code": "int main() {}", "profile": profile},
+        'execution_time_sec': 1.5,
+        'timestamp': 0.0,
+        'task_metadata': {
+            'difficulty': "easy",
+            'expected_complexity': "O(n)",
+            'time_limit_ms': 1000,
+            'memory_limit_mb': 256,
+        },
+    }
+
+
+def test_index_record_from_profile_report(tmp_path):
+    runner = BatchRunner(tmp_path, max_workers=1)
+    runner._record_result(_successful_result())
+    runner._close_results()
+
+    records = [loads(line) for line in runner.index_file.read_bytes().splitlines()]
+    assert records == [{
+        'task_id': "T1",
+        'seed': 0,
+        'run_id': 0,
+        'status': "success",
+        'runtime_ms': 150.0,
+        'memory_mb': 40.0,
+        'iterations': 1,
+        'time_limit_ms': 1000,
+        'memory_limit_mb': 256,
+    }]
+
+
+def test_metrics_from_profile_report(tmp_path):
+    runner = BatchRunner(tmp_path, max_workers=1)
+    runner._record_result(_successful_result())
+    runner._close_results()
+
+    [run] = runner._metrics.results
+    assert run.success
+    assert run.final_runtime_ms == 150.0
+    assert run.final_memory_mb == 40.0
+    assert run.efficient_runtime and run.efficient_memory
+    assert runner._metrics.calculate_pass_at_k(1) == 1.0
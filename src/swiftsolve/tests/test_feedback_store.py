@@ -0,0 +1,42 @@
+"""Tests for the SQLite planner feedback store."""
+
+from swiftsolve.utils.feedback_store import FeedbackStore, PlannerFeedback, format_feedback
+
+
+def _feedback(algorithm, runtime_ms, target="O(n log n)"):
+    return PlannerFeedback(
+        prev_algorithm=algorithm,
+        measured_runtime_ms=runtime_ms,
+        target_complexity=target,
+        failure_mode="inefficient_performance",
+    )
+
+
+def test_append_recent_round_trip(tmp_path):
+    store = FeedbackStore(tmp_path / "nested" / "planner_feedback.db")
+    store.append("T1", _feedback("nested_loops", 1500.0))
+    store.append("T1", _feedback("brute_force", 2500.5))
+    store.append("T1", _feedback("dp_table", 900.0, target="O(n)"))
+    store.append("T2", _feedback("other_task", 10.0))
+
+    # Newest first, filtered by task and target complexity
+    assert store.recent("T1", "O(n log n)") == [
+        _feedback("brute_force", 2500.5),
+        _feedback("nested_loops", 1500.0),
+    ]
+    assert [fb["prev_algorithm"] for fb in store.recent("T1")] == [
+        "dp_table", "brute_force", "nested_loops"]
+    assert len(store.recent("T1", limit=1)) == 1
+    assert store.recent("T3") == []
+
+    # A second store on the same file sees the persisted events
+    reopened = FeedbackStore(tmp_path / "nested" / "planner_feedback.db")
+    assert reopened.recent("T2") == [_feedback("other_task", 10.0)]
+
+
+def test_format_feedback():
+    text = format_feedback(_feedback("nested_loops", 1500.0))
+    assert "'nested_loops'" in text
+    assert "inefficient performance" in text
+    assert "1500.00ms" in text
+    assert "O(n log n) or better" in text
@@ -0,0 +1,131 @@
+"""Tests for EvaluationMetrics against hand-computed values."""
+
+import pytest
+
+from swiftsolve.evaluation.metrics import EvaluationMetrics, RunStatus
+
+RUNTIME_LIMIT = 2000
+MEMORY_LIMIT = 512
+
+
+def _result(status, runtime_ms=None, memory_mb=None, iteration=0):
+    """Pipeline result dict as add_run_result receives it."""
+    result = {"status": status, "iteration": iteration}
+    if runtime_ms is not None:
+        result["profile"] = {"runtime_ms": [10.0, runtime_ms], "peak_memory_mb": [1.0, memory_mb]}
+    return result
+
+
+# (task_id, run_id, result); A's runs are added out of run_id order
+RUNS = [
+    # A: fails first, then passes within both limits
+    ("A", 1, _result("success", 1500, 400, iteration=2)),
+    ("A", 0, _result("failed", 3000, 600)),
+    # B: passes twice, the first time over the time limit
+    ("B", 0, _result("success", 2500, 100)),
+    ("B", 1, _result("success", 1000, 100, iteration=1)),
+    # C: only failures
+    ("C", 0, _result("agent_failure")),
+    ("C", 1, _result("failed", 3000, 700)),
+]
+
+
+def _metrics(runs):
+    metrics = EvaluationMetrics()
+    for task_id, run_id, result in runs:
+        metrics.add_run_result(task_id, run_id, result, RUNTIME_LIMIT, MEMORY_LIMIT)
+    return metrics
+
+
+def test_pass_at_k_ranks_runs_by_run_id():
+    metrics = _metrics(RUNS)
+    assert metrics.calculate_pass_at_k(1) == pytest.approx(1 / 3)  # B only
+    assert metrics.calculate_pass_at_k(2) == pytest.approx(2 / 3)  # A and B
+    assert metrics.calculate_pass_at_k(5) == pytest.approx(2 / 3)
+
+
+def test_eff_at_k():
+    metrics = _metrics(RUNS)
+    # B's first run passes but exceeds the time limit
+    assert metrics.calculate_eff_at_k_runtime(1) == 0.0
+    assert metrics.calculate_eff_at_k_runtime(2) == pytest.approx(2 / 3)
+    assert metrics.calculate_eff_at_k_memory(1) == pytest.approx(1 / 3)
+    assert metrics.calculate_eff_at_k_memory(2) == pytest.approx(2 / 3)
+
+
+def test_tle_mle_rates():
+    metrics = _metrics(RUNS)
+    tle_rate, mle_rate = metrics.calculate_tle_mle_rate()
+    assert tle_rate == pytest.approx(50.0)  # A0, B0, C1
+    assert mle_rate == pytest.approx(100 / 3)  # A0, C1
+
+
+def test_iterations_and_agent_failures():
+    metrics = _metrics(RUNS)
+    assert metrics.calculate_mean_iterations() == pytest.approx(2.0)  # (3 + 1 + 2) / 3
+    assert metrics.calculate_agent_failure_rate() == pytest.approx(100 / 6)
+
+
+def test_summary_statistics():
+    summary = _metrics(RUNS).generate_summary(k_values=[1, 2])
+    assert summary["evaluation_summary"] == {
+        "total_tasks": 3,
+        "total_runs": 6,
+        "successful_runs": 3,
+        "success_rate": 50.0,
+    }
+    assert summary["pass_metrics"] == pytest.approx({"pass@1": 1 / 3, "pass@2": 2 / 3})
+
+    # Successful runs only: runtimes 1500, 2500, 1000 and memory 400, 100, 100
+    runtime = summary["performance_statistics"]["runtime_ms"]
+    assert runtime == pytest.approx({
+        "count": 3, "mean": 5000 / 3, "median": 1500.0, "std": (3500000 / 9) ** 0.5,
+        "min": 1000.0, "max": 2500.0, "p95": 2400.0,
+    })
+    memory = summary["performance_statistics"]["memory_mb"]
+    assert memory == pytest.approx({
+        "count": 3, "mean": 200.0, "median": 100.0, "std": 20000 ** 0.5,
+        "min": 100.0, "max": 400.0, "p95": 370.0,
+    })
+
+
+def test_per_run_records():
+    results = _metrics(RUNS).results
+    assert [(r.task_id, r.run_id) for r in results] == [(task_id, run_id) for task_id, run_id, _ in RUNS]
+
+    a1, a0 = results[0], results[1]
+    assert a1.status is RunStatus.SUCCESS and a1.success
+    assert a1.efficient_runtime and a1.efficient_memory
+    assert a1.iteration_count == 3
+    assert a1.final_runtime_ms == 1500.0 and a1.final_memory_mb == 400.0
+    assert not (a0.success or a0.efficient_runtime or a0.efficient_memory)
+
+    c0 = results[4]
+    assert c0.status is RunStatus.AGENT_FAILURE and c0.agent_failures == 1
+    assert c0.final_runtime_ms is None and c0.final_memory_mb is None
+
+
+def test_task_with_only_failures():
+    metrics = _metrics([run for run in RUNS if run[0] == "C"])
+    assert metrics.calculate_pass_at_k(3) == 0.0
+    assert metrics.calculate_eff_at_k_runtime(3) == 0.0
+    assert metrics.calculate_eff_at_k_memory(3) == 0.0
+    assert metrics.calculate_tle_mle_rate() == pytest.approx((50.0, 50.0))
+    assert metrics.calculate_mean_iterations() == 0.0
+
+    summary = metrics.generate_summary(k_values=[1])
+    assert summary["evaluation_summary"]["successful_runs"] == 0
+    assert summary["performance_statistics"] == {"runtime_ms": {"count": 0}, "memory_mb": {"count": 0}}
+
+
+def test_empty():
+    metrics = EvaluationMetrics()
+    assert len(metrics) == 0
+    assert metrics.results == []
+    assert metrics.calculate_pass_at_k(1) == 0.0
+    assert metrics.calculate_eff_at_k_runtime(1) == 0.0
+    assert metrics.calculate_eff_at_k_memory(1) == 0.0
+    assert metrics.calculate_tle_mle_rate() == (0.0, 0.0)
+    assert metrics.calculate_mean_iterations() == 0.0
+    assert metrics.calculate_agent_failure_rate() == 0.0
+    assert metrics.generate_summary() == {"error": "No results available for evaluation"}
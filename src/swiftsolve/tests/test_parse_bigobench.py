@@ -0,0 +1,32 @@
+"""Tests for parsing BigO(Bench) problem files."""
+
+import json
+
+from swiftsolve.datasets.parse_bigobench import BigOBenchParser
+
+
+def _problem(problem_id, **overrides):
+    problem = {
+        "id": problem_id,
+        "title": f"Problem {problem_id}",
+        "complexity": "O(n)",
+        "inputs": ["1", "2", "3"],
+        "outputs": ["1", "2", "3"],
+    }
+    problem.update(overrides)
+    return problem
+
+
+def test_every_entry_is_validated(tmp_path):
+    json_file = tmp_path / "problems.json"
+    json_file.write_text(json.dumps({"problems": [
+        _problem(1),
+        _problem(2, time_limit_ms=-5),
+        _problem(3, time_limit_ms="abc"),
+        _problem(4, memory_limit_mb=256),
+    ]}))
+
+    tasks = BigOBenchParser(tmp_path).parse_from_json(json_file)
+
+    assert [task.task_id for task in tasks] == ["BIGOBENCH_1", "BIGOBENCH_4"]
+    assert tasks[1].memory_limit_mb == 256
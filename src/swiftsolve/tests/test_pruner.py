@@ -0,0 +1,57 @@
+"""Regression tests for the static pruner heuristics."""
+
+import pytest
+
+from swiftsolve.schemas import PlanMessage
+from swiftsolve.static_pruner.pruner import _SORT_IN_LOOP, _in_order, validate
+
+
+def _plan(algorithm, n):
+    return PlanMessage(
+        task_id="T1",
+        iteration=0,
+        problem_statement="Test problem",
+        algorithm=algorithm,
+        input_bounds={"n": n},
+        constraints={"runtime_limit": 2000, "memory_limit": 512},
+    )
+
+
+def test_single_while_is_accepted():
+    # The old check evaluated '"while" in <int>' and raised TypeError here
+    assert validate(_plan("Two pointers: while left < right, move the smaller end", 100000))
+
+
+def test_nested_whiles_counted():
+    algorithm = ("while i < n: while j < n: while k < n: advance k; "
+                 "advance j; advance i")
+    assert not validate(_plan(algorithm, 100000))
+    assert validate(_plan(algorithm, 1000))  # small inputs are fine
+    assert validate(_plan("while i < n: while j < n: advance j; advance i", 100000))
+
+
+@pytest.mark.parametrize("algorithm, rejected", [
+    ("for x in queries: sort(a) then answer x", True),
+    ("sort(a) once, then for x in queries: binary search", False),
+    ("for x in queries: answer x", False),
+])
+def test_sort_in_loop(algorithm, rejected):
+    assert validate(_plan(algorithm, 1000)) is not rejected
+    assert validate(_plan(algorithm, 100))
+
+
+def test_in_order_fragments():
+    assert _in_order("for i in range(n): sort(v)", _SORT_IN_LOOP)
+    assert not _in_order("sort(v) for i in range(n):", _SORT_IN_LOOP)
+    # Fragments may not overlap
+    assert not _in_order("ab", ("ab", "b"))
+    assert _in_order("abb", ("ab", "b"))
+
+
+def test_cached_rejection_still_logs_reason(caplog):
+    plan = _plan("recursion over every prefix", 100000)
+    for _ in range(2):  # the second verdict comes from the cache
+        caplog.clear()
+        with caplog.at_level("WARNING"):
+            assert not validate(plan)
+        assert "Rejecting plan: recursion with large n (100000)" in caplog.text
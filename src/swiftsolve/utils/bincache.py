@@ -0,0 +1,52 @@
+"""
+LRU bookkeeping for on-disk caches of compiled binaries.
+
+Shared by the sandbox and the Profiler agent. Recency is the binary's
+mtime: callers touch() it on every cache hit (atime is unreliable on
+noatime/relatime mounts) and call evict_lru() after adding a binary.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable
+
+
+def touch(path: Path) -> None:
+    """Mark a cached binary as just used."""
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass  # evicted concurrently; the caller's exec will report it
+
+
+def evict_lru(cache_dir: Path, max_bytes: int, keep: Path,
+              companions: Iterable[str] = ()) -> None:
+    """
+    Delete least recently used binaries until the cache fits its budget.
+
+    Args:
+        cache_dir: Directory holding the cached *.out binaries
+        max_bytes: Size budget for all binaries in cache_dir
+        keep: Binary that must survive (the one just added)
+        companions: Suffixes of sibling files removed along with each
+            binary, e.g. ".lock"
+    """
+    entries = []
+    for path in cache_dir.glob("*.out"):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    if total <= max_bytes:
+        return
+    for _, size, path in sorted(entries, key=lambda e: e[0]):
+        if path == keep:
+            continue
+        path.unlink(missing_ok=True)
+        for suffix in companions:
+            path.with_suffix(suffix).unlink(missing_ok=True)
+        total -= size
+        if total <= max_bytes:
+            break
@@ -1,5 +1,6 @@
 from functools import lru_cache
-from pydantic import BaseModel, Field
+from typing import Optional
+from pydantic import AliasChoices, BaseModel, Field
 from pydantic_settings import BaseSettings
 import os, json
 
@@ -10,7 +11,14 @@ class Settings(BaseSettings):
     diminish_delta: float = 0.05
     sandbox_timeout_sec: int = 2
     sandbox_mem_mb: int = 512
+    profile_sample_period_us: int = 1000
+    # CPU that profiling runs are pinned to (default: first isolated CPU, if any)
+    profile_cpu: Optional[int] = Field(
+        None, validation_alias=AliasChoices("SWIFTSOLVE_PROFILE_CPU", "profile_cpu")
+    )
+    max_output_bytes: int = 16 * 1024 * 1024
     log_dir: str = "logs"
+    feedback_db: str = "logs/planner_feedback.db"
     
     class Config:
         env_file = ".env"
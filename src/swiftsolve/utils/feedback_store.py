@@ -0,0 +1,123 @@
+"""
+Durable store for planner re-plan feedback.
+
+Every CODER→PLANNER re-route is recorded as a structured PlannerFeedback
+event in an append-only SQLite table, so later runs on the same task can
+show the planner which strategies already failed.
+"""
+
+import sqlite3
+import time
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, TypedDict
+
+from .config import get_settings
+
+
+class PlannerFeedback(TypedDict):
+    prev_algorithm: str
+    measured_runtime_ms: float
+    target_complexity: str
+    failure_mode: str
+
+
+def format_feedback(feedback: PlannerFeedback) -> str:
+    """Render a feedback event as the natural-language hint given to the planner."""
+    return (
+        f"Previous algorithm '{feedback['prev_algorithm']}' showed {feedback['failure_mode'].replace('_', ' ')} "
+        f"with runtime {feedback['measured_runtime_ms']:.2f}ms for large inputs. "
+        f"The current approach is not meeting the efficiency requirements. "
+        f"Choose a fundamentally different algorithmic approach that can achieve "
+        f"{feedback['target_complexity']} or better time complexity."
+    )
+
+
+class FeedbackStore:
+    """Append-only SQLite table of PlannerFeedback events keyed by task_id."""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS planner_feedback (
+            id                  INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id             TEXT NOT NULL,
+            created_at          REAL NOT NULL,
+            prev_algorithm      TEXT NOT NULL,
+            measured_runtime_ms REAL NOT NULL,
+            target_complexity   TEXT NOT NULL,
+            failure_mode        TEXT NOT NULL
+        )
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (and create if needed) the feedback database.
+
+        Args:
+            db_path: Path of the SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(self._SCHEMA)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_planner_feedback_task "
+                "ON planner_feedback (task_id, target_complexity)"
+            )
+
+    def append(self, task_id: str, feedback: PlannerFeedback) -> None:
+        """Record one re-plan event for task_id."""
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(
+                "INSERT INTO planner_feedback (task_id, created_at, prev_algorithm, "
+                "measured_runtime_ms, target_complexity, failure_mode) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    task_id,
+                    time.time(),
+                    feedback["prev_algorithm"],
+                    float(feedback["measured_runtime_ms"]),
+                    feedback["target_complexity"],
+                    feedback["failure_mode"],
+                ),
+            )
+
+    def recent(self, task_id: str, target_complexity: Optional[str] = None,
+               limit: int = 3) -> List[PlannerFeedback]:
+        """
+        Fetch the most recent events for a task, newest first.
+
+        Args:
+            task_id: Task to look up
+            target_complexity: Restrict to events aiming at this complexity class
+            limit: Maximum number of events returned
+
+        Returns:
+            List of PlannerFeedback events
+        """
+        query = (
+            "SELECT prev_algorithm, measured_runtime_ms, target_complexity, failure_mode "
+            "FROM planner_feedback WHERE task_id = ?"
+        )
+        params: list = [task_id]
+        if target_complexity is not None:
+            query += " AND target_complexity = ?"
+            params.append(target_complexity)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [
+            PlannerFeedback(
+                prev_algorithm=row[0],
+                measured_runtime_ms=row[1],
+                target_complexity=row[2],
+                failure_mode=row[3],
+            )
+            for row in rows
+        ]
+
+
+@lru_cache
+def get_feedback_store() -> FeedbackStore:
+    return FeedbackStore(Path(get_settings().feedback_db))
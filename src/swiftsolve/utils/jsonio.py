@@ -0,0 +1,100 @@
+"""
+Fast JSON helpers.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise, so callers never need to care which backend is active.
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path, PurePath
+from typing import Any, Dict, Iterable
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """
+    Serialize values neither backend handles natively.
+
+    Raises:
+        TypeError: For any other type, so unserializable data fails loudly
+            instead of being written as its repr
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "item") and hasattr(obj, "dtype"):
+        return obj.item()  # numpy scalar
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()  # stdlib backend; orjson handles these itself
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, PurePath):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize obj to a JSON string.
+
+    Args:
+        obj: Object to serialize (pydantic models are dumped automatically)
+        indent: Pretty-print with a two-space indent
+
+    Returns:
+        JSON document as str
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option).decode()
+    return json.dumps(obj, default=_default, indent=2 if indent else None)
+
+
+def loads(data: Any) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_model(model: BaseModel, indent: bool = True) -> str:
+    """Serialize a pydantic model, pretty-printed by default for log output."""
+    return dumps(model.model_dump(), indent=indent)
+
+
+def write_index(path: Path, header: Dict[str, Any], key: str, entries: Iterable[Dict[str, Any]]) -> None:
+    """
+    Stream a JSON object whose `key` holds a (possibly long) list of entries.
+
+    Header fields are written first, then each entry is serialized and
+    written on its own line, so the full list never exists in memory.
+
+    Args:
+        path: Output file
+        header: Scalar/small fields written before the list
+        key: Name of the list field
+        entries: Iterable of JSON-serializable dicts
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        for name, value in header.items():
+            f.write(f"  {dumps(name)}: {dumps(value)},\n")
+        f.write(f"  {dumps(key)}: [")
+        sep = "\n    "
+        for entry in entries:
+            f.write(sep)
+            f.write(dumps(entry))
+            sep = ",\n    "
+        f.write("\n  ]\n}\n")
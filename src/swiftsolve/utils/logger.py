@@ -1,4 +1,4 @@
-import logging, pathlib, sys
+import logging, os, pathlib, sys
 from .config import get_settings
 
 def get_logger(name: str) -> logging.Logger:
@@ -8,6 +8,9 @@ def get_logger(name: str) -> logging.Logger:
     if not logger.handlers:
         logger.setLevel(logging.INFO)
         fh = logging.FileHandler(log_dir / f"{name}.log", encoding="utf-8")
+        # Invariant: long-lived fds are close-on-exec, because the sandbox
+        # launches children without close_fds' per-spawn /proc/self/fd scan
+        os.set_inheritable(fh.stream.fileno(), False)
         ch = logging.StreamHandler(sys.stdout)
         fmt = logging.Formatter("%(asctime)s %(levelname)s %(name)s - %(message)s")
         fh.setFormatter(fmt); ch.setFormatter(fmt)
@@ -8,6 +8,9 @@ This tests the core logic without requiring LLM API calls.
 import sys
 import os
 import pathlib
+import inspect
+import re
+from functools import lru_cache
 
 # Add src to path so we can import swiftsolve modules
 sys.path.insert(0, str(pathlib.Path(__file__).parent / "src"))
@@ -20,12 +23,20 @@ except ImportError as e:
     print("Make sure you're running this from the project root directory.")
     sys.exit(1)
 
-def test_analyst_patch_intelligence():
+# Signatures are looked up on the classes, so no agent (and no API client)
+# has to be constructed; cached because several checks share them
+_signature = lru_cache(maxsize=None)(inspect.signature)
+
+# Integration points test_solve_loop_integration expects in solve_loop.py
+_SOLVE_LOOP_CHECKS = re.compile(
+    rb'(pending_patch)|(coder\.run\(plan, patch=)|(planner\.run\(problem, feedback=)'
+    rb'|(verdict\.target_agent == "CODER")'
+)
+
+def test_analyst_patch_intelligence(analyst):
     """Test that the Analyst generates different patches for different complexity patterns."""
     print("🧪 Testing Analyst patch intelligence...")
     
-    analyst = Analyst()
-    
     # Test 1: O(n^2) with high memory growth
     profile_quadratic_memory = ProfileReport(
         task_id="TEST_QUAD_MEM",
@@ -114,53 +125,34 @@ def test_coder_signature():
     print("\n🧪 Testing Coder signature compatibility...")
     
     from swiftsolve.agents.coder import Coder
-    from swiftsolve.schemas import PlanMessage
-    import inspect
     
     # Check that run method accepts patch parameter
-    coder = Coder()
-    sig = inspect.signature(coder.run)
-    
-    if 'patch' in sig.parameters:
-        print("✅ Coder.run() accepts 'patch' parameter")
-        
-        # Check that patch parameter is optional
-        patch_param = sig.parameters['patch']
-        if patch_param.default is not inspect.Parameter.empty:
-            print("✅ Coder patch parameter is optional with default")
-            return True
-        else:
-            print("❌ Coder patch parameter should be optional")
-            return False
-    else:
-        print("❌ Coder.run() missing 'patch' parameter")
-        return False
+    sig = _signature(Coder.run)
+    
+    assert 'patch' in sig.parameters, "Coder.run() missing 'patch' parameter"
+    print("✅ Coder.run() accepts 'patch' parameter")
+    
+    # Check that patch parameter is optional
+    assert sig.parameters['patch'].default is not inspect.Parameter.empty, \
+        "Coder patch parameter should be optional"
+    print("✅ Coder patch parameter is optional with default")
 
 def test_planner_signature():
     """Test that the Planner agent accepts feedback parameter."""
     print("\n🧪 Testing Planner signature compatibility...")
     
     from swiftsolve.agents.planner import Planner
-    import inspect
     
     # Check that run method accepts feedback parameter
-    planner = Planner()
-    sig = inspect.signature(planner.run)
-    
-    if 'feedback' in sig.parameters:
-        print("✅ Planner.run() accepts 'feedback' parameter")
-        
-        # Check that feedback parameter is optional
-        feedback_param = sig.parameters['feedback']
-        if feedback_param.default is not inspect.Parameter.empty:
-            print("✅ Planner feedback parameter is optional with default")
-            return True
-        else:
-            print("❌ Planner feedback parameter should be optional")
-            return False
-    else:
-        print("❌ Planner.run() missing 'feedback' parameter")
-        return False
+    sig = _signature(Planner.run)
+    
+    assert 'feedback' in sig.parameters, "Planner.run() missing 'feedback' parameter"
+    print("✅ Planner.run() accepts 'feedback' parameter")
+    
+    # Check that feedback parameter is optional
+    assert sig.parameters['feedback'].default is not inspect.Parameter.empty, \
+        "Planner feedback parameter should be optional"
+    print("✅ Planner feedback parameter is optional with default")
 
 def test_solve_loop_integration():
     """Test that solve_loop has proper patch handling logic."""
@@ -169,40 +161,29 @@ def test_solve_loop_integration():
     # Read the solve_loop.py file and check for key integration points
     solve_loop_path = pathlib.Path("src/swiftsolve/controller/solve_loop.py")
     
-    if not solve_loop_path.exists():
-        print("❌ solve_loop.py not found")
-        return False
+    assert solve_loop_path.exists(), "solve_loop.py not found"
     
-    content = solve_loop_path.read_text()
+    # One scan finds every integration point; group i matches check i
+    found = {
+        i for match in _SOLVE_LOOP_CHECKS.finditer(solve_loop_path.read_bytes())
+        for i, group in enumerate(match.groups()) if group
+    }
     
     # Check for pending_patch variable
-    if "pending_patch" in content:
-        print("✅ solve_loop tracks pending patches")
-    else:
-        print("❌ solve_loop missing pending_patch tracking")
-        return False
+    assert 0 in found, "solve_loop missing pending_patch tracking"
+    print("✅ solve_loop tracks pending patches")
     
     # Check for patch application in coder call
-    if "coder.run(plan, patch=" in content:
-        print("✅ solve_loop passes patches to coder")
-    else:
-        print("❌ solve_loop not passing patches to coder")
-        return False
+    assert 1 in found, "solve_loop not passing patches to coder"
+    print("✅ solve_loop passes patches to coder")
     
     # Check for feedback in planner call
-    if "planner.run(problem, feedback=" in content:
-        print("✅ solve_loop passes feedback to planner")
-    else:
-        print("❌ solve_loop not passing feedback to planner")
-        return False
+    assert 2 in found, "solve_loop not passing feedback to planner"
+    print("✅ solve_loop passes feedback to planner")
     
     # Check for routing logic
-    if 'verdict.target_agent == "CODER"' in content:
-        print("✅ solve_loop has proper routing logic")
-        return True
-    else:
-        print("❌ solve_loop missing routing logic")
-        return False
+    assert 3 in found, "solve_loop missing routing logic"
+    print("✅ solve_loop has proper routing logic")
 
 def main():
     """Run all feedback loop logic tests."""
@@ -210,7 +191,7 @@ def main():
     print("=" * 55)
     
     tests = [
-        ("Analyst Patch Intelligence", test_analyst_patch_intelligence),
+        ("Analyst Patch Intelligence", lambda: test_analyst_patch_intelligence(Analyst())),
         ("Coder Signature Compatibility", test_coder_signature),
         ("Planner Signature Compatibility", test_planner_signature),
         ("Solve Loop Integration", test_solve_loop_integration),
@@ -219,8 +200,12 @@ def main():
     results = []
     for test_name, test_func in tests:
         try:
+            # Converted tests assert and return None; the rest return a bool
             result = test_func()
-            results.append((test_name, result))
+            results.append((test_name, result is not False))
+        except AssertionError as e:
+            print(f"❌ {e}")
+            results.append((test_name, False))
         except Exception as e:
             print(f"❌ {test_name} crashed: {e}")
             import traceback